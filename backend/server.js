@@ -114,17 +114,21 @@ wss.on('connection', (ws, req) => {
   }));
   
   // Handle incoming messages
-  ws.on('message', (data) => {
+  ws.on('message', (data, isBinary) => {
     try {
-      const message = JSON.parse(data.toString());
+      // Binary frames are compact telemetry (decoded in the router)
+      const message = isBinary ? data : JSON.parse(data.toString());
       const client = clients.get(ws);
       
       // Determine client type from first message
       if (client.type === 'unknown') {
-        if (message.type === 'telemetry') {
+        if (isBinary || message.type === 'telemetry' ||
+            (message.type === 'hello' && message.role === 'robot')) {
           client.type = 'robot';
           console.log(`🤖 Client ${clientId} identified as ROBOT`);
-        } else if (message.type === 'cmd') {
+        } else if (message.type === 'cmd' || message.type === 'cmd_batch' ||
+                   message.type === 'stats_request' || message.type === 'path_request' ||
+                   message.type === 'zones' || message.type === 'tick') {
           client.type = 'frontend';
           console.log(`💻 Client ${clientId} identified as FRONTEND`);
         }
@@ -0,0 +1,109 @@
+/**
+ * Telemetry Codec
+ * ===============
+ *
+ * Decodes the compact binary telemetry frames ("binary-v2") that robot
+ * controllers may send instead of JSON, and negotiates the encoding
+ * during the hello / hello_ack exchange.
+ *
+ * binary-v2 layout (little-endian, 52 bytes + robot id):
+ * - 0   "S4" magic        (2 bytes)
+ * - 2   version           (uint8, 2)
+ * - 3   frame type        (uint8, 1 = telemetry)
+ * - 4   pose.x            (float32)
+ * - 8   pose.y            (float32)
+ * - 12  pose.theta        (float32)
+ * - 16  speed             (float32)
+ * - 20  battery           (float32)
+ * - 24  cycle             (uint32)
+ * - 28  timestamp (ms)    (uint64)
+ * - 36  step              (uint32)
+ * - 40  simTime (s)       (float64)
+ * - 48  timeToEmpty (s)   (uint32, 0xFFFFFFFF = null)
+ * - 52  robot id length N (uint8), followed by N bytes of UTF-8
+ *
+ * binary-v1 (version 1, older controllers) is the same frame without
+ * step / simTime / timeToEmpty, with the robot id length at offset 36.
+ *
+ * Must stay in sync with webots_project/.../telemetry_codec.py.
+ *
+ * Author: Fitfest25 Hackathon Team
+ * Date: 2025
+ */
+
+const ENCODING_JSON = 'json';
+const ENCODING_BINARY = 'binary-v2';
+const ENCODING_BINARY_V1 = 'binary-v1';
+const SUPPORTED_ENCODINGS = [ENCODING_BINARY, ENCODING_BINARY_V1, ENCODING_JSON];
+
+const FRAME_TELEMETRY = 1;
+// Fixed header size per frame version (the robot id follows it)
+const HEADER_SIZES = { 1: 36, 2: 52 };
+const TIME_TO_EMPTY_NONE = 0xFFFFFFFF;
+
+/**
+ * Round a float32-decoded value to a fixed number of decimals
+ * (matches the precision of the JSON frames)
+ */
+function roundTo(value, decimals) {
+  const factor = Math.pow(10, decimals);
+  return Math.round(value * factor) / factor;
+}
+
+/**
+ * Decode a binary-v2 (or binary-v1) telemetry frame into the JSON telemetry shape
+ * @param {Buffer} buffer - Raw binary WebSocket frame
+ * @returns {Object} Telemetry object {type, robotId, pose, speed, battery, cycle, timestamp,
+ *   step, simTime, timeToEmpty} (no step / simTime / timeToEmpty for binary-v1)
+ */
+function decodeTelemetryFrame(buffer) {
+  const version = buffer.length >= 4 ? buffer.readUInt8(2) : 0;
+  const headerSize = HEADER_SIZES[version];
+  if (!headerSize ||
+      buffer.length < headerSize + 1 ||
+      buffer.toString('latin1', 0, 2) !== 'S4' ||
+      buffer.readUInt8(3) !== FRAME_TELEMETRY) {
+    throw new Error('Not a binary telemetry frame');
+  }
+
+  const idLength = buffer.readUInt8(headerSize);
+  const telemetry = {
+    type: 'telemetry',
+    robotId: buffer.toString('utf8', headerSize + 1, headerSize + 1 + idLength),
+    pose: {
+      x: roundTo(buffer.readFloatLE(4), 3),
+      y: roundTo(buffer.readFloatLE(8), 3),
+      theta: roundTo(buffer.readFloatLE(12), 4)
+    },
+    speed: roundTo(buffer.readFloatLE(16), 3),
+    battery: roundTo(buffer.readFloatLE(20), 1),
+    cycle: buffer.readUInt32LE(24),
+    timestamp: Number(buffer.readBigUInt64LE(28))
+  };
+  if (version >= 2) {
+    telemetry.step = buffer.readUInt32LE(36);
+    telemetry.simTime = roundTo(buffer.readDoubleLE(40), 3);
+    const timeToEmpty = buffer.readUInt32LE(48);
+    telemetry.timeToEmpty = timeToEmpty === TIME_TO_EMPTY_NONE ? null : timeToEmpty;
+  }
+  return telemetry;
+}
+
+/**
+ * Pick the first encoding offered by a robot that the backend supports
+ * @param {Array<string>} offered - Encodings in the robot's order of preference
+ * @returns {string} Chosen encoding (JSON if nothing matches)
+ */
+function chooseEncoding(offered = []) {
+  const match = offered.find((encoding) => SUPPORTED_ENCODINGS.includes(encoding));
+  return match || ENCODING_JSON;
+}
+
+module.exports = {
+  ENCODING_JSON,
+  ENCODING_BINARY,
+  ENCODING_BINARY_V1,
+  SUPPORTED_ENCODINGS,
+  decodeTelemetryFrame,
+  chooseEncoding
+};
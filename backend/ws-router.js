@@ -8,11 +8,18 @@
  * 
  * Features:
  * - Message type detection and routing
+ * - Telemetry encoding negotiation (JSON / binary-v2)
+ * - Delta telemetry reassembly (telemetry_delta → full state)
  * - Telemetry logging and history
  * - Command forwarding
+ * - Latency tracing (routerAt stamps, stats_request → robot stats)
+ * - Lockstep ticks (tick → robots, tick_done → frontends)
+ * - Geofence zones (zones → robots, zone_enter / zone_exit → frontends)
  * - Statistics tracking
  */
 
+const { decodeTelemetryFrame, chooseEncoding } = require('./utils/telemetry-codec');
+
 // ============================================
 // DATA STORAGE
 // ============================================
@@ -20,6 +27,12 @@
 const telemetryHistory = [];
 const TELEMETRY_LOG_LIMIT = 1000;
 
+// Last full telemetry state per robot (baseline for delta frames)
+const robotStates = new Map();
+
+// Sequence numbers stamped on commands that arrive without one
+let commandSeq = 0;
+
 let stats = {
   telemetryCount: 0,
   commandCount: 0,
@@ -40,7 +53,8 @@ let stats = {
  * @param {Map} clientsMap - Map of client metadata
  */
 function routeMessage(senderWs, message, allClients, clientsMap) {
-  const messageType = message.type;
+  // Binary frames are always compact telemetry
+  const messageType = Buffer.isBuffer(message) ? 'telemetry' : message.type;
   const senderInfo = clientsMap.get(senderWs);
   
   switch (messageType) {
@@ -48,10 +62,19 @@ function routeMessage(senderWs, message, allClients, clientsMap) {
       handleTelemetry(senderWs, message, allClients, clientsMap);
       break;
     
+    case 'telemetry_delta':
+      handleTelemetryDelta(senderWs, message, allClients, clientsMap);
+      break;
+    
     case 'cmd':
+    case 'cmd_batch':
       handleCommand(senderWs, message, allClients, clientsMap);
       break;
     
+    case 'hello':
+      handleHello(senderWs, message, clientsMap);
+      break;
+    
     case 'version_request':
       handleVersionRequest(senderWs, clientsMap);
       break;
@@ -66,9 +89,31 @@ function routeMessage(senderWs, message, allClients, clientsMap) {
       break;
     
     case 'config':
+    case 'telemetry_rate':
       handleConfigUpdate(senderWs, message, allClients, clientsMap);
       break;
     
+    case 'stats_request':
+    case 'path_request':
+    case 'zones':
+    case 'tick':
+      handleRobotRequest(senderWs, message, allClients, clientsMap);
+      break;
+    
+    case 'config_ack':
+    case 'cmd_ack':
+    case 'stats':
+    case 'profile':
+    case 'path_segment':
+    case 'path_history':
+    case 'tick_done':
+    case 'goto_status':
+    case 'zones_ack':
+    case 'zone_enter':
+    case 'zone_exit':
+      handleRobotReply(senderWs, message, allClients, clientsMap);
+      break;
+    
     default:
       console.log(`⚠️  Unknown message type: ${messageType} from ${senderInfo?.id}`);
   }
@@ -80,6 +125,7 @@ function routeMessage(senderWs, message, allClients, clientsMap) {
 
 /**
  * Handle telemetry messages from robot
+ * - Decode binary frames into the JSON shape
  * - Log telemetry
  * - Store in history
  * - Broadcast to all frontend clients
@@ -87,6 +133,17 @@ function routeMessage(senderWs, message, allClients, clientsMap) {
 function handleTelemetry(senderWs, telemetry, allClients, clientsMap) {
   const senderInfo = clientsMap.get(senderWs);
   
+  // Decode compact binary frames; frontends always receive JSON
+  if (Buffer.isBuffer(telemetry)) {
+    telemetry = decodeTelemetryFrame(telemetry);
+  }
+  
+  // Router receive time, so frontends can split telemetry latency per hop
+  telemetry.routerAt = Date.now();
+  
+  // Remember full state as the baseline for delta frames
+  robotStates.set(telemetry.robotId || senderInfo?.id, telemetry);
+  
   // Log telemetry
   stats.telemetryCount++;
   stats.lastTelemetry = telemetry;
@@ -136,23 +193,66 @@ function handleTelemetry(senderWs, telemetry, allClients, clientsMap) {
   }
 }
 
+/**
+ * Handle delta telemetry from robot
+ * - Merge changed fields into the robot's last full state
+ * - Hand the rebuilt full frame to handleTelemetry (history + broadcast)
+ * - Ask the robot for a keyframe if we have no baseline yet
+ */
+function handleTelemetryDelta(senderWs, delta, allClients, clientsMap) {
+  const senderInfo = clientsMap.get(senderWs);
+  const robotKey = delta.robotId || senderInfo?.id;
+  const baseline = robotStates.get(robotKey);
+  
+  if (!baseline) {
+    try {
+      senderWs.send(JSON.stringify({ type: 'keyframe_request', robotId: delta.robotId }));
+    } catch (error) {
+      console.error(`❌ Error requesting keyframe from ${senderInfo?.id}:`, error.message);
+    }
+    return;
+  }
+  
+  const { type, pose, ...fields } = delta;
+  const telemetry = {
+    ...baseline,
+    ...fields,
+    type: 'telemetry',
+    pose: { ...baseline.pose, ...pose }
+  };
+  handleTelemetry(senderWs, telemetry, allClients, clientsMap);
+}
+
 // ============================================
 // COMMAND HANDLING
 // ============================================
 
 /**
  * Handle command messages from frontend
+ * - Stamp a sequence number if missing
+ * - Stamp the router receive time (routerAt) for latency tracing
  * - Log command
  * - Forward to robot clients
  */
 function handleCommand(senderWs, command, allClients, clientsMap) {
   const senderInfo = clientsMap.get(senderWs);
   
+  // Sequence number lets robots ack (and us measure) each command individually
+  if (command.seq === undefined) {
+    command.seq = ++commandSeq;
+  } else {
+    commandSeq = Math.max(commandSeq, command.seq);
+  }
+  command.routerAt = Date.now();
+  
   // Log command
   stats.commandCount++;
   stats.lastCommand = command;
   
-  console.log(`📤 Command from ${senderInfo?.id}: ${command.cmd}`);
+  const label = command.type === 'cmd_batch'
+    ? `batch[${(command.commands || []).map((c) => c.cmd).join(', ')}]`
+    : command.cmd;
+  console.log(`📤 Command #${command.seq} from ${senderInfo?.id}: ${label}`);
   
   // Forward to all robot clients
   let forwardCount = 0;
@@ -178,7 +278,8 @@ function handleCommand(senderWs, command, allClients, clientsMap) {
   try {
     senderWs.send(JSON.stringify({
       type: 'ack',
-      originalCommand: command.cmd,
+      originalCommand: command.type === 'cmd_batch' ? label : command.cmd,
+      seq: command.seq,
       forwarded: forwardCount
     }));
   } catch (error) {
@@ -186,6 +287,37 @@ function handleCommand(senderWs, command, allClients, clientsMap) {
   }
 }
 
+// ============================================
+// HELLO / ENCODING NEGOTIATION
+// ============================================
+
+/**
+ * Handle hello from a robot controller
+ * - Pick the telemetry encoding (first offered one we support)
+ * - Reply with hello_ack
+ */
+function handleHello(senderWs, message, clientsMap) {
+  const senderInfo = clientsMap.get(senderWs);
+  const encoding = chooseEncoding(message.encodings);
+  
+  if (senderInfo) {
+    senderInfo.telemetryEncoding = encoding;
+    senderInfo.robots = message.robots || [];
+  }
+  
+  console.log(`🤝 Hello from ${senderInfo?.id} (${message.role}): telemetry encoding ${encoding}`);
+  
+  try {
+    senderWs.send(JSON.stringify({
+      type: 'hello_ack',
+      encoding: encoding,
+      timestamp: Date.now()
+    }));
+  } catch (error) {
+    console.error(`❌ Error sending hello ack:`, error.message);
+  }
+}
+
 // ============================================
 // UPDATE & CONFIGURATION HANDLERS
 // ============================================
@@ -259,6 +391,9 @@ function handleApplyUpdate(senderWs, message, allClients, clientsMap) {
         client.send(JSON.stringify({
           type: 'update',
           updateType: updateType,
+          settings: message.settings,
+          requestId: message.requestId,
+          robotId: message.robotId,
           timestamp: Date.now()
         }));
         console.log(`📤 Update forwarded to robot`);
@@ -322,6 +457,83 @@ function handleConfigUpdate(senderWs, message, allClients, clientsMap) {
   }
 }
 
+/**
+ * Handle requests from frontend that robots answer themselves
+ * (stats_request → "stats", path_request → "path_history", tick → "tick_done");
+ * forward to robots
+ */
+function handleRobotRequest(senderWs, message, allClients, clientsMap) {
+  const senderInfo = clientsMap.get(senderWs);
+  
+  let forwardedCount = 0;
+  allClients.forEach((client) => {
+    const clientInfo = clientsMap.get(client);
+    if (clientInfo?.type === 'robot' && client.readyState === 1) {
+      try {
+        client.send(JSON.stringify(message));
+        forwardedCount++;
+      } catch (error) {
+        console.error(`❌ Error forwarding ${message.type}:`, error.message);
+      }
+    }
+  });
+  
+  // Lockstep harnesses send a tick per batch of steps; too many to log
+  if (message.type !== 'tick') {
+    console.log(`📨 ${message.type} from ${senderInfo?.id} → ${forwardedCount} robot(s)`);
+  }
+}
+
+/**
+ * Handle replies from robots (e.g. config_ack)
+ * - Forward to all frontend clients
+ */
+function handleRobotReply(senderWs, message, allClients, clientsMap) {
+  const senderInfo = clientsMap.get(senderWs);
+  
+  if (message.type === 'cmd_ack') {
+    console.log(`✅ Command #${message.seq}.${message.index} (${message.command}) executed by ` +
+                `${message.robotId || senderInfo?.id} at step ${message.executedStep} ` +
+                `(+${message.latencySteps} steps)`);
+  } else if (message.type === 'config_ack') {
+    console.log(`⚙️  Config ${message.status} by ${message.robotId || senderInfo?.id}` +
+                (message.version !== undefined ? ` (v${message.version})` : ''));
+  } else if (message.type === 'goto_status') {
+    console.log(`🧭 Goto #${message.seq} ${message.status} for ${message.robotId || senderInfo?.id}` +
+                (message.goal ? ` → (${message.goal.join(', ')})` : '') +
+                (message.reason ? `: ${message.reason}` : ''));
+  } else if (message.type === 'zone_enter' || message.type === 'zone_exit') {
+    console.log(`📍 ${message.robotId || senderInfo?.id} ` +
+                `${message.type === 'zone_enter' ? 'entered' : 'left'} zone ${message.zoneId}` +
+                (message.reason ? ` (${message.reason})` : ''));
+  } else if (message.type === 'zones_ack') {
+    console.log(`📍 Zones ${message.status} by ${message.robotId || senderInfo?.id}` +
+                (message.version !== undefined ? ` (v${message.version})` : ''));
+  } else if (message.type === 'profile') {
+    const total = message.profile?.phases?.total;
+    console.log(`⏱️  Profile from ${senderInfo?.id} at step ${message.step}` +
+                (total ? `: loop p50 ${total.p50} ms, p99 ${total.p99} ms` : ''));
+  } else if (message.type === 'stats') {
+    const endToEnd = message.latency?.['cmd.end_to_end'];
+    console.log(`⏱️  Stats from ${senderInfo?.id} at step ${message.step}` +
+                (endToEnd ? `: cmd p50 ${(endToEnd.p50 / 1000).toFixed(1)} ms, ` +
+                            `p99 ${(endToEnd.p99 / 1000).toFixed(1)} ms` : ''));
+  }
+  
+  allClients.forEach((client) => {
+    const clientInfo = clientsMap.get(client);
+    if (client !== senderWs &&
+        client.readyState === 1 && // WebSocket.OPEN
+        clientInfo?.type === 'frontend') {
+      try {
+        client.send(JSON.stringify(message));
+      } catch (error) {
+        console.error(`❌ Error forwarding ${message.type} to ${clientInfo?.id}:`, error.message);
+      }
+    }
+  });
+}
+
 // ============================================
 // UTILITY FUNCTIONS
 // ============================================
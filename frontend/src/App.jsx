@@ -48,6 +48,8 @@ function App() {
         addLog(`✅ ${data.message}`)
       } else if (data.type === 'ack') {
         addLog(`✓ Command acknowledged: ${data.originalCommand}`)
+      } else if (data.type === 'zone_enter' || data.type === 'zone_exit') {
+        addLog(`📍 ${data.robotId} ${data.type === 'zone_enter' ? 'entered' : 'left'} zone ${data.zoneId}`)
       }
     }
 
@@ -25,7 +25,13 @@ function TelemetryPanel({ telemetry }) {
     )
   }
 
-  const { pose, speed, battery, cycle } = telemetry
+  const { pose, speed, battery, cycle, timeToEmpty, contacts } = telemetry
+
+  const formatTimeToEmpty = (seconds) => {
+    const hours = Math.floor(seconds / 3600)
+    const minutes = Math.floor((seconds % 3600) / 60)
+    return hours > 0 ? `${hours}h ${minutes}m` : `${minutes}m`
+  }
 
   const getBatteryColor = () => {
     if (battery > 60) return 'bg-green-500'
@@ -112,6 +118,11 @@ function TelemetryPanel({ telemetry }) {
               style={{ width: `${battery}%` }}
             ></div>
           </div>
+          {timeToEmpty != null && (
+            <div className="mt-2 text-xs text-slate-500">
+              ≈ {formatTimeToEmpty(timeToEmpty)} left
+            </div>
+          )}
         </div>
 
         {/* Health */}
@@ -123,6 +134,11 @@ function TelemetryPanel({ telemetry }) {
           <div className="mt-2 text-xs text-slate-500">
             Cycle: {cycle}
           </div>
+          {contacts?.length > 0 && (
+            <div className="mt-1 text-xs text-orange-400">
+              🧱 Contact: {contacts.map((c) => c.id).join(', ')}
+            </div>
+          )}
         </div>
       </div>
 
@@ -10,6 +10,20 @@
 const WS_URL = 'ws://localhost:3000';
 const RECONNECT_INTERVAL = 3000; // 3 seconds
 
+/**
+ * Split a telemetry frame's latency into hops (ms, wall clock)
+ * @param {Object} telemetry - Frame with timestamp (robot) and routerAt (backend)
+ * @returns {Object} {robotToRouter, routerToUi, total}
+ */
+function measureTelemetryLatency(telemetry) {
+  const now = Date.now();
+  return {
+    robotToRouter: telemetry.routerAt ? telemetry.routerAt - telemetry.timestamp : null,
+    routerToUi: telemetry.routerAt ? now - telemetry.routerAt : null,
+    total: now - telemetry.timestamp
+  };
+}
+
 class WebSocketClient {
   constructor() {
     this.ws = null;
@@ -52,6 +66,9 @@ class WebSocketClient {
       this.ws.onmessage = (event) => {
         try {
           const data = JSON.parse(event.data);
+          if (data.type === 'telemetry' && data.timestamp) {
+            data.latency = measureTelemetryLatency(data);
+          }
           this.notifyMessage(data);
         } catch (error) {
           console.error('❌ Error parsing message:', error);
@@ -112,9 +129,10 @@ class WebSocketClient {
 
   /**
    * Send command to robot
-   * @param {string} command - Command name (forward, backward, left, right, stop)
+   * @param {string} command - Command name (forward, backward, left, right, stop, goto, twist)
+   * @param {Object} [params] - Command arguments, e.g. { x, y } for goto
    */
-  sendCommand(command) {
+  sendCommand(command, params = {}) {
     if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
       console.warn('⚠️  Cannot send command: not connected');
       return false;
@@ -122,7 +140,9 @@ class WebSocketClient {
 
     const message = {
       type: 'cmd',
-      cmd: command
+      cmd: command,
+      ...params,
+      sentAt: Date.now() // origin stamp for end-to-end latency tracing
     };
 
     try {
@@ -135,6 +155,30 @@ class WebSocketClient {
     }
   }
 
+  /**
+   * Send a continuous velocity command; the robot integrates it until it expires
+   * @param {number} v - Linear velocity (m/s)
+   * @param {number} w - Angular velocity (rad/s, counter-clockwise)
+   * @param {Object} [options] - { duration } in s, or { deadline } in sim time (s)
+   */
+  sendTwist(v, w, options = {}) {
+    return this.sendCommand('twist', { v, w, ...options });
+  }
+
+  /**
+   * Define the geofence zones (replaces all); robots answer with zones_ack and
+   * report zone_enter / zone_exit events
+   * @param {Array<Object>} zones - { id, shape: 'circle', center, radius } or { id, shape: 'polygon', points }
+   */
+  sendZones(zones) {
+    if (!this.ws || this.ws.readyState !== WebSocket.OPEN) {
+      console.warn('⚠️  Cannot send zones: not connected');
+      return false;
+    }
+    this.ws.send(JSON.stringify({ type: 'zones', zones }));
+    return true;
+  }
+
   /**
    * Add event listener
    * @param {string} event - Event type (message, status, error)
@@ -198,8 +198,8 @@ Write-Host ""
 # Install Python Dependencies
 Write-Host "[5/5] Installing Python Dependencies..." -ForegroundColor Yellow
 if (Test-Command "pip") {
-    Write-Host "  --> Installing websocket-client..." -ForegroundColor Cyan
-    pip install websocket-client==1.9.0 --quiet
+    Write-Host "  --> Installing websockets..." -ForegroundColor Cyan
+    pip install websockets==13.1 --quiet
     if ($LASTEXITCODE -eq 0) {
         Write-Host "  [OK] Python dependencies installed!" -ForegroundColor Green
     } else {
@@ -0,0 +1,115 @@
+"""
+S4 Remote Robot Management System - Batched Kinematics Benchmark
+=================================================================
+
+Compares the per-step cost of the scalar kinematics in robot_controller.py
+(one Python call per robot) with batch_kinematics.FleetKinematics at 1, 100
+and 10,000 robots, after checking that both produce identical poses.
+
+Usage:
+    python webots_project/benchmarks/bench_batch_kinematics.py
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+import numpy as np  # noqa: E402
+
+import robot_controller as rc  # noqa: E402
+from batch_kinematics import FleetKinematics, encode_commands  # noqa: E402
+
+FLEET_SIZES = [1, 100, 10000]
+COMMANDS = ["forward", "backward", "left", "right", "stop"]
+TIMESTEP = 64  # ms per step
+STEP_DISTANCE = rc.LINEAR_VELOCITY * (TIMESTEP / 1000.0)  # m per step, as in apply_movement
+
+
+def scalar_apply(pose, last, command):
+    """Scalar reference: apply_movement semantics on a [x, y, theta] list."""
+    x, y, theta = pose
+    if command == "stop":
+        return pose, "stop", False
+    if command == "forward":
+        x, y, _ = rc.move_forward([x, y, 0.0], theta, STEP_DISTANCE)
+    elif command == "backward":
+        x, y, _ = rc.move_backward([x, y, 0.0], theta, STEP_DISTANCE)
+    elif command == "left":
+        if last != "left":
+            theta = rc.rotate_left(theta, rc.TURN_ANGLE)
+        x, y, _ = rc.move_forward([x, y, 0.0], theta, STEP_DISTANCE)
+    elif command == "right":
+        if last != "right":
+            theta = rc.rotate_right(theta, rc.TURN_ANGLE)
+        x, y, _ = rc.move_forward([x, y, 0.0], theta, STEP_DISTANCE)
+    else:
+        return pose, last, False
+    return [x, y, theta], command, True
+
+
+def random_commands(n, steps, rng):
+    """Command script: each robot holds a random command for a random number of steps."""
+    script = []
+    current = [rng.choice(COMMANDS) for _ in range(n)]
+    for _ in range(steps):
+        current = [c if rng.random() > 0.1 else rng.choice(COMMANDS) for c in current]
+        script.append(list(current))
+    return script
+
+
+def verify(n=500, steps=200):
+    """Check batched and scalar kinematics agree bit-for-bit."""
+    rng = random.Random(42)
+    start = [[rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-3.1, 3.1)] for _ in range(n)]
+    script = random_commands(n, steps, rng)
+
+    poses = [list(p) for p in start]
+    last = ["stop"] * n
+    fleet = FleetKinematics.from_poses(start, speed=STEP_DISTANCE)
+    for commands in script:
+        for i, command in enumerate(commands):
+            poses[i], last[i], _ = scalar_apply(poses[i], last[i], command)
+        fleet.apply_commands(encode_commands(commands))
+    assert np.array_equal(fleet.poses, np.array(poses)), "batched kinematics diverged from scalar"
+    print(f"✅ Identical poses for {n} robots over {steps} steps")
+
+
+def bench(n, steps):
+    """Return (scalar_us_per_step, batched_us_per_step) for a fleet of n robots."""
+    rng = random.Random(n)
+    script = random_commands(n, steps, rng)
+    codes = [encode_commands(c) for c in script]
+
+    poses = [[0.0, 0.0, 0.0] for _ in range(n)]
+    last = ["stop"] * n
+    t0 = time.perf_counter()
+    for commands in script:
+        for i, command in enumerate(commands):
+            poses[i], last[i], _ = scalar_apply(poses[i], last[i], command)
+    scalar = (time.perf_counter() - t0) / steps * 1e6
+
+    fleet = FleetKinematics(n, speed=STEP_DISTANCE)
+    t0 = time.perf_counter()
+    for step_codes in codes:
+        fleet.apply_commands(step_codes)
+    batched = (time.perf_counter() - t0) / steps * 1e6
+    return scalar, batched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+    verify()
+    print(f"{'robots':>8} | {'scalar µs/step':>15} | {'batched µs/step':>16} | {'speedup':>8}")
+    for n in FLEET_SIZES:
+        steps = max(20, 20000 // n)
+        scalar, batched = bench(n, steps)
+        print(f"{n:>8} | {scalar:>15.1f} | {batched:>16.1f} | {scalar / batched:>7.1f}x")
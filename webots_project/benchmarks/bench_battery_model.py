@@ -0,0 +1,89 @@
+"""
+S4 Remote Robot Management System - Battery Model Benchmark
+============================================================
+
+Per-step cost of draining a whole fleet through battery_model: one step()
+call per robot (what the controller does today, robot by robot) against a
+single step_many() call on NumPy arrays, for both the linear and the
+physics model. Both paths must produce the same charge, speed and load for
+every robot.
+
+Usage:
+    python webots_project/benchmarks/bench_battery_model.py [steps]
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+from battery_model import create_battery_model  # noqa: E402
+
+FLEET_SIZES = [1, 10, 100, 1000, 10000]
+DT = 0.064            # s per step (64 ms basic timestep)
+MAX_DISTANCE = 0.03   # m per step
+MAX_ROTATION = 0.1    # rad per step
+DEFAULT_STEPS = 50
+
+
+def build_fleet(n, seed=7):
+    """Random charge, motion and previous speed for n robots (a third idle)."""
+    rng = random.Random(seed)
+    soc = [rng.uniform(5.0, 100.0) for _ in range(n)]
+    moving = [rng.random() > 1 / 3 for _ in range(n)]
+    distance = [rng.uniform(0.0, MAX_DISTANCE) if m else 0.0 for m in moving]
+    rotation = [rng.uniform(-MAX_ROTATION, MAX_ROTATION) if m else 0.0 for m in moving]
+    speed = [rng.uniform(0.0, MAX_DISTANCE / DT) for _ in range(n)]
+    return soc, moving, distance, rotation, speed
+
+
+def run_loop(model, fleet, steps):
+    """step() once per robot per step; returns (µs per step, final soc, speed, load)."""
+    soc, moving, distance, rotation, speed = (list(column) for column in fleet)
+    load = [0.0] * len(soc)
+    start = time.perf_counter()
+    for _ in range(steps):
+        for i in range(len(soc)):
+            soc[i], speed[i], load[i] = model.step(soc[i], moving[i], distance[i],
+                                                   rotation[i], speed[i], DT)
+    elapsed = (time.perf_counter() - start) / steps * 1e6
+    return elapsed, soc, speed, load
+
+
+def run_vectorised(model, fleet, steps):
+    """step_many() once per step for the whole fleet; same return as run_loop()."""
+    soc, moving, distance, rotation, speed = (np.asarray(column) for column in fleet)
+    soc = soc.astype(np.float64)
+    speed = speed.astype(np.float64)
+    load = np.zeros_like(soc)
+    start = time.perf_counter()
+    for _ in range(steps):
+        soc, speed, load = model.step_many(soc, moving, distance, rotation, speed, DT)
+    elapsed = (time.perf_counter() - start) / steps * 1e6
+    return elapsed, soc, speed, load
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("steps", nargs="?", type=int, default=DEFAULT_STEPS,
+                        help=f"steps per fleet size (default {DEFAULT_STEPS})")
+    steps = parser.parse_args().steps
+    print(f"{'model':>8} | {'robots':>8} | {'loop µs/step':>13} | "
+          f"{'numpy µs/step':>14} | {'speedup':>8}")
+    for name in ("linear", "physics"):
+        for n in FLEET_SIZES:
+            fleet = build_fleet(n)
+            loop, *loop_state = run_loop(create_battery_model(name), fleet, steps)
+            vector, *vector_state = run_vectorised(create_battery_model(name), fleet, steps)
+            for expected, actual in zip(loop_state, vector_state):
+                assert np.allclose(expected, actual), f"{name}: step_many diverged from step"
+            print(f"{name:>8} | {n:>8} | {loop:>13.1f} | {vector:>14.1f} | {loop / vector:>7.1f}x")
@@ -0,0 +1,104 @@
+"""
+S4 Remote Robot Management System - Collision Layer Benchmark
+==============================================================
+
+Per-step cost of collision.CollisionWorld for fleets of 10 to 10,000
+robots random-walking among obstacles (constant density: the floor grows
+with the fleet), against a brute-force broad phase that tests every robot
+against every obstacle and every other robot. Both must produce identical
+poses; the spatial hash should stay near O(N) per step while brute force
+grows as O(N²).
+
+Usage:
+    python webots_project/benchmarks/bench_collision.py [steps]
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+from collision import CollisionWorld  # noqa: E402
+from occupancy_grid import Footprint  # noqa: E402
+
+FLEET_SIZES = [10, 100, 1000, 10000]
+BRUTE_FORCE_MAX = 1000  # fleets above this skip the O(N²) baseline
+AREA_PER_ROBOT = 4.0    # m² of floor per robot
+STEP_DISTANCE = 0.02    # m per step (default linear velocity at 64 ms)
+DEFAULT_STEPS = 50
+
+
+class BruteForceWorld(CollisionWorld):
+    """Same narrow phase, but every obstacle and robot is a candidate."""
+
+    def _candidates(self, robot_id, x_min, y_min, x_max, y_max):
+        robots = set(self.positions)
+        robots.discard(robot_id)
+        return set(range(len(self.footprints))), robots
+
+
+def build_world(world_class, n, seed):
+    """A fleet of n robots on a 1 m grid plus n / 4 random obstacles between them."""
+    rng = random.Random(seed)
+    side = math.sqrt(n * AREA_PER_ROBOT)
+    footprints = []
+    for i in range(n // 4):
+        x, y = rng.uniform(-side / 2, side / 2), rng.uniform(-side / 2, side / 2)
+        if i % 2:
+            footprints.append(Footprint("circle", f"pillar{i}", x, y, radius=0.2))
+        else:
+            footprints.append(Footprint("box", f"box{i}", x, y, 0.6, 0.2, rng.uniform(-3, 3)))
+    world = world_class(footprints, (0.0, 0.0, side, side))
+    columns = math.ceil(math.sqrt(n))
+    spacing = side / columns
+    robots = []
+    for i in range(n):
+        x = -side / 2 + spacing * (i % columns + 0.5)
+        y = -side / 2 + spacing * (i // columns + 0.5)
+        robots.append([f"R{i}", [x, y, 0.1], rng.uniform(-math.pi, math.pi)])
+        world.place(f"R{i}", (x, y))
+    return world, robots
+
+
+def run(world_class, n, steps, seed=7):
+    """Random-walk the fleet; returns (µs per step, final poses, clipped count)."""
+    world, robots = build_world(world_class, n, seed)
+    rng = random.Random(seed + 1)
+    start = time.perf_counter()
+    for _ in range(steps):
+        for robot in robots:
+            robot_id, position, heading = robot
+            heading += rng.uniform(-0.3, 0.3)
+            target = [position[0] + math.cos(heading) * STEP_DISTANCE,
+                      position[1] + math.sin(heading) * STEP_DISTANCE, position[2]]
+            robot[1], _ = world.resolve(robot_id, position, target)
+            robot[2] = heading
+    elapsed = (time.perf_counter() - start) / steps * 1e6
+    return elapsed, [tuple(r[1]) for r in robots], world.clipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("steps", nargs="?", type=int, default=DEFAULT_STEPS,
+                        help=f"steps per fleet size (default {DEFAULT_STEPS})")
+    steps = parser.parse_args().steps
+    print(f"{'robots':>8} | {'hash µs/step':>13} | {'µs/robot':>9} | "
+          f"{'brute µs/step':>14} | {'speedup':>8} | {'clipped':>8}")
+    for n in FLEET_SIZES:
+        hashed, poses, clipped = run(CollisionWorld, n, steps)
+        if n <= BRUTE_FORCE_MAX:
+            brute, brute_poses, _ = run(BruteForceWorld, n, max(2, steps // (n // 100 + 1)))
+            _, check_poses, _ = run(CollisionWorld, n, max(2, steps // (n // 100 + 1)))
+            assert check_poses == brute_poses, "spatial hash diverged from brute force"
+            compare = f"{brute:>14.0f} | {brute / hashed:>7.1f}x"
+        else:
+            compare = f"{'-':>14} | {'-':>8}"
+        print(f"{n:>8} | {hashed:>13.0f} | {hashed / n:>9.1f} | {compare} | {clipped:>8}")
@@ -0,0 +1,142 @@
+"""
+S4 Remote Robot Management System - Control Loop Benchmark
+===========================================================
+
+Runs the robot_controller.py step pipeline (sensor read, yaw extraction,
+movement, battery, telemetry encoding) against the headless world backend
+and reports steps per second. No Webots and no backend server required.
+
+With --count-calls it instead wraps every node, device and field in a
+counting proxy and reports Supervisor API calls per robot per step, for the
+pre-adapter call pattern ("before": pose read twice, fields looked up on
+every write) and for the current RobotNodeAdapter pipeline ("after").
+
+Usage:
+    python webots_project/benchmarks/bench_control_loop.py [steps] [fleet_size]
+    python webots_project/benchmarks/bench_control_loop.py [steps] --count-calls
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+import robot_controller as rc  # noqa: E402
+from world_backend import HeadlessSupervisor  # noqa: E402
+
+COMMAND_SCRIPT = ["forward", "left", "forward", "right", "backward", "stop"]
+
+
+class CountingProxy:
+    """Forward attribute access to a Webots-like object, counting method calls."""
+
+    def __init__(self, target, counts, label):
+        self._target = target
+        self._counts = counts
+        self._label = label
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self._counts[f"{self._label}.{name}"] += 1
+            result = attr(*args, **kwargs)
+            if name == "getField" and result is not None:
+                return CountingProxy(result, self._counts, "field")
+            return result
+        return call
+
+
+def run(steps, fleet_size=1):
+    """Run the control pipeline for a number of steps and return steps/sec."""
+    supervisor = HeadlessSupervisor(max_steps=steps)
+    timestep = int(supervisor.getBasicTimeStep())
+    fleet = [rc.RobotState(f"ROBOT_{i}", supervisor.add_robot(f"ROBOT_{i}")) for i in range(fleet_size)]
+
+    start = time.perf_counter()
+    frames = 0
+    while supervisor.step(timestep) != -1:
+        command = COMMAND_SCRIPT[(supervisor.step_count // 200) % len(COMMAND_SCRIPT)]
+        current_time = supervisor.getTime()
+        for robot in fleet:
+            robot.current_command = command
+            pose = robot.adapter.read_pose()
+            position, heading = pose.position, pose.theta
+            is_moving = rc.apply_movement(robot, timestep)
+            rc.update_battery(robot, is_moving, timestep)
+            if robot.scheduler.due(current_time, is_moving):
+                json.dumps(rc.create_telemetry(robot, position, heading, is_moving))
+                frames += 1
+                robot.cycle_counter += 1
+    elapsed = time.perf_counter() - start
+    return steps / elapsed, frames, supervisor.getTime() / elapsed
+
+
+def legacy_step(robot, command, previous_command):
+    """Call pattern of the loop before the adapter: pose read twice, getField per write."""
+    robot.gps.getValues()                         # telemetry position
+    rc.get_current_yaw(robot.node)                # telemetry heading
+    if command == "stop":
+        return
+    position = robot.node.getPosition()           # apply_movement re-reads the pose
+    rc.get_current_yaw(robot.node)
+    if command in ("left", "right") and command != previous_command:
+        robot.node.getField('rotation').setSFRotation([0, 0, 1, 0.0])
+    robot.node.getField('translation').setSFVec3f(position)
+
+
+def count_calls(steps):
+    """Supervisor API calls per step, before and after the adapter, for one robot."""
+    results = {}
+    for mode in ("before", "after"):
+        supervisor = HeadlessSupervisor(max_steps=steps)
+        timestep = int(supervisor.getBasicTimeStep())
+        counts = collections.Counter()
+        node = supervisor.add_robot("ROBOT")
+        gps = CountingProxy(supervisor.getDevice('gps'), counts, "gps")
+        robot = rc.RobotState("ROBOT", CountingProxy(node, counts, "node"), gps)
+        counts.clear()  # field lookups at construction are one-off
+        previous = "stop"
+        while supervisor.step(timestep) != -1:
+            command = COMMAND_SCRIPT[(supervisor.step_count // 200) % len(COMMAND_SCRIPT)]
+            robot.current_command = command
+            if mode == "before":
+                legacy_step(robot, command, previous)
+            else:
+                robot.adapter.read_pose()
+                rc.apply_movement(robot, timestep)
+            previous = command
+        results[mode] = {name: count / steps for name, count in counts.items()}
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("steps", nargs="?", type=int,
+                        help="steps to run (default 20000, or 1200 with --count-calls)")
+    parser.add_argument("fleet_size", nargs="?", type=int, default=1,
+                        help="robots in the headless world (default 1)")
+    parser.add_argument("--count-calls", action="store_true",
+                        help="report Supervisor API calls per robot per step instead")
+    args = parser.parse_args()
+    if args.count_calls:
+        results = count_calls(args.steps or 1200)
+        for mode, per_step in results.items():
+            print(f"📞 {mode:<6} {sum(per_step.values()):5.2f} API calls/step | " +
+                  ", ".join(f"{name} {value:.3f}" for name, value in sorted(per_step.items())))
+        sys.exit(0)
+    n = args.steps or 20000
+    fleet_size = args.fleet_size
+    steps_per_sec, frames, realtime_factor = run(n, fleet_size)
+    print(f"📊 {n} steps x {fleet_size} robot(s) | {steps_per_sec:,.0f} steps/s | "
+          f"{frames} telemetry frames | {realtime_factor:,.0f}x real time")
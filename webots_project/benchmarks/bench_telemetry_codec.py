@@ -0,0 +1,64 @@
+"""
+S4 Remote Robot Management System - Telemetry Codec Benchmark
+==============================================================
+
+Compares the JSON and binary-v2 telemetry encodings: bytes per frame and
+encode cost per frame (µs), using frames built by create_telemetry().
+
+Usage:
+    python webots_project/benchmarks/bench_telemetry_codec.py [frames]
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+import robot_controller as rc  # noqa: E402
+from telemetry_codec import (ENCODING_BINARY, ENCODING_JSON,  # noqa: E402
+                             encode_telemetry, unpack_telemetry)
+from world_backend import HeadlessSupervisor  # noqa: E402
+
+
+def build_frames(count):
+    """Build realistic telemetry frames from a robot driving forward."""
+    supervisor = HeadlessSupervisor()
+    robot = rc.RobotState("ROBOT_42", supervisor.getSelf())
+    robot.current_command = "forward"
+    frames = []
+    for i in range(count):
+        rc.apply_movement(robot, 64)
+        rc.update_battery(robot, True, 64)
+        robot.cycle_counter = i
+        frames.append(rc.create_telemetry(robot, robot.node.getPosition(),
+                                          rc.get_current_yaw(robot.node), True))
+    return frames
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("frames", nargs="?", type=int, default=50000,
+                        help="frames to encode per encoding (default 50000)")
+    count = parser.parse_args().frames
+    frames = build_frames(count)
+
+    decoded = unpack_telemetry(encode_telemetry(frames[-1], ENCODING_BINARY))
+    assert decoded["pose"] == frames[-1]["pose"] and decoded["cycle"] == frames[-1]["cycle"]
+    assert decoded["step"] == frames[-1]["step"] and decoded["simTime"] == frames[-1]["simTime"]
+    assert decoded["timeToEmpty"] == frames[-1]["timeToEmpty"]
+
+    print(f"{'encoding':>10} | {'bytes/frame':>11} | {'encode µs/frame':>15}")
+    baseline = None
+    for encoding in (ENCODING_JSON, ENCODING_BINARY):
+        start = time.perf_counter()
+        encoded = [encode_telemetry(f, encoding) for f in frames]
+        cost = (time.perf_counter() - start) / count * 1e6
+        size = sum(len(e) for e in encoded) / count
+        baseline = baseline or size
+        print(f"{encoding:>10} | {size:>11.1f} | {cost:>15.2f}   ({size / baseline:.0%} of JSON size)")
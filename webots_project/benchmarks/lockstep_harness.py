@@ -0,0 +1,90 @@
+"""
+S4 Remote Robot Management System - Lockstep Harness
+=====================================================
+
+Drives a controller running in lockstep mode (S4_LOCKSTEP=1) through the
+backend: sends a scripted command sequence tagged with "atStep", grants
+ticks in batches of K and waits for "tick_done" after each batch. Prints
+steps/s and a digest of every telemetry frame (step + pose + battery), so
+two runs of the same script can be compared for bit-for-bit determinism.
+
+Usage:
+    (cd webots_project/controllers/robot_controller && \\
+        S4_WORLD_BACKEND=headless S4_LOCKSTEP=1 python robot_controller.py) &
+    python webots_project/benchmarks/lockstep_harness.py [steps] [batch] [--backend URL]
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import time
+
+BACKEND_URL = "ws://localhost:3000"
+DEFAULT_STEPS = 2000
+DEFAULT_BATCH = 10
+
+# (atStep, command, steps) - repeated every SCRIPT_PERIOD steps
+SCRIPT = [(1, "forward", 40), (50, "left", 1), (60, "forward", 30),
+          (100, "right", 1), (110, "backward", 20), (150, "stop", None)]
+SCRIPT_PERIOD = 200
+
+
+def scripted_commands(total_steps):
+    """Expand SCRIPT over the run as cmd messages."""
+    commands = []
+    for base in range(0, total_steps, SCRIPT_PERIOD):
+        for at_step, cmd, steps in SCRIPT:
+            if base + at_step <= total_steps:
+                commands.append({"type": "cmd", "cmd": cmd, "steps": steps,
+                                 "atStep": base + at_step})
+    return commands
+
+
+async def run(url, total_steps, batch):
+    """Run the script in lockstep; returns (steps/s, frames, digest, last step)."""
+    import websockets
+
+    digest = hashlib.sha256()
+    frames = 0
+    last_step = 0
+    async with websockets.connect(url) as ws:
+        # The first message identifies this client as a frontend
+        for command in scripted_commands(total_steps):
+            await ws.send(json.dumps(command))
+        start = time.perf_counter()
+        granted = 0
+        while granted < total_steps:
+            granted = min(total_steps, granted + batch)
+            await ws.send(json.dumps({"type": "tick", "until": granted}))
+            while True:
+                message = json.loads(await ws.recv())
+                if message.get("type") == "telemetry":
+                    frames += 1
+                    pose = message["pose"]
+                    digest.update(f"{message['robotId']}|{message['step']}|{pose['x']}|{pose['y']}|"
+                                  f"{pose['theta']}|{message['battery']}\n".encode())
+                elif message.get("type") == "tick_done" and message["step"] >= granted:
+                    last_step = message["step"]
+                    break
+        elapsed = time.perf_counter() - start
+    return total_steps / elapsed, frames, digest.hexdigest(), last_step
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("steps", nargs="?", type=int, default=DEFAULT_STEPS,
+                        help=f"steps to grant (default {DEFAULT_STEPS})")
+    parser.add_argument("batch", nargs="?", type=int, default=DEFAULT_BATCH,
+                        help=f"ticks granted per batch (default {DEFAULT_BATCH})")
+    parser.add_argument("--backend", default=BACKEND_URL, metavar="URL", help=f"backend URL (default {BACKEND_URL})")
+    args = parser.parse_args()
+    steps, batch = args.steps, args.batch
+    steps_per_sec, frames, digest, last_step = asyncio.run(run(args.backend, steps, batch))
+    print(f"🔒 {steps} steps in batches of {batch} | {steps_per_sec:,.0f} steps/s | "
+          f"{frames} telemetry frames | last step {last_step}")
+    print(f"🔑 Telemetry digest: {digest}")
@@ -0,0 +1,164 @@
+"""
+S4 Remote Robot Management System - Recording Replay Driver
+============================================================
+
+Replays a step recording (S4_RECORD_FILE, see step_recorder.py) at max speed.
+
+- controller mode (default): rebuilds the recorded robots in the headless
+  world and feeds every recorded command back through robot_controller.py's
+  apply_movement / update_battery, checking that each step reproduces the
+  recorded pose, movement flag and battery. Reports records/s and mismatches,
+  so kinematics changes can be regression-tested deterministically.
+- backend mode (--backend URL): connects as a robot and streams one telemetry
+  frame per record to the backend as fast as the socket accepts them, to
+  reproduce load spikes on the router. Reports frames/s.
+
+Replay assumes the recording was made with the default runtime config
+(movement speed, battery drain rate) and the same battery model
+(S4_BATTERY_MODEL, linear by default).
+
+Records of commands whose arguments are not recorded (NOT_REPLAYABLE: a
+goto's goal, a twist's velocities and expiry) cannot be re-run. They are
+skipped and counted, and the robot is put back on the recorded pose and
+battery at its next replayable record.
+
+Usage:
+    python webots_project/benchmarks/replay_recording.py run.s4rec
+    python webots_project/benchmarks/replay_recording.py run.s4rec --backend ws://localhost:3000
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import math
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+import robot_controller as rc  # noqa: E402
+from step_recorder import COMMAND_NAMES, RECORD_FIELDS, RecordingReader  # noqa: E402
+from world_backend import HeadlessSupervisor  # noqa: E402
+
+POSE_TOLERANCE = 1e-9
+BATTERY_TOLERANCE = 1e-4  # battery is stored as float32
+NOT_REPLAYABLE = ("goto", "twist")  # commands recorded without their arguments
+
+
+def resync_robot(robot, skipped, record, timestep):
+    """Put a robot back on the recording after skipped steps: this record's pose, the skipped battery."""
+    robot.adapter.set_translation([record["x"], record["y"], record["z"]])
+    robot.adapter.set_yaw(record["theta"])
+    robot.battery_level = skipped["battery"]
+    # Speed over the last skipped step, as update_battery would have left it
+    robot.battery_speed = math.hypot(record["x"] - skipped["x"],
+                                     record["y"] - skipped["y"]) / (timestep / 1000.0)
+
+
+def replay_controller(reader):
+    """
+    Re-run the recorded commands through the controller kinematics.
+
+    Returns (records/s, mismatches, {command: skipped records}).
+    """
+    supervisor = HeadlessSupervisor(basic_timestep=reader.timestep)
+    timestep = reader.timestep
+    robots = {}
+    mismatches = 0
+    skipped = collections.Counter()
+    resync = {}  # robot id -> last skipped record
+    start = time.perf_counter()
+    for raw in reader.iter_raw():
+        record = dict(zip(RECORD_FIELDS, raw))
+        robot_id = reader.robot_ids[record["robot"]]
+        robot = robots.get(robot_id)
+        if robot is None:
+            # First record of a robot: place it at the recorded starting pose
+            node = supervisor.add_robot(robot_id, [record["x"], record["y"], record["z"]],
+                                        [0, 0, 1, record["theta"]])
+            robot = robots[robot_id] = rc.RobotState(robot_id, node)
+
+        command = COMMAND_NAMES.get(record["cmd"], "unknown")
+        if command in NOT_REPLAYABLE:
+            skipped[command] += 1
+            resync[robot_id] = record
+            continue
+        if robot_id in resync:
+            resync_robot(robot, resync.pop(robot_id), record, timestep)
+
+        rc.sim_step = record["step"]
+        robot.current_command = command
+        robot.command_seq = (record["seq"], record["index"]) if record["seq"] else None
+        pose = robot.adapter.read_pose(record["step"])
+        moved = rc.apply_movement(robot, timestep)
+        rc.update_battery(robot, moved, timestep)
+
+        if (abs(pose.position[0] - record["x"]) > POSE_TOLERANCE or
+                abs(pose.position[1] - record["y"]) > POSE_TOLERANCE or
+                abs(pose.theta - record["theta"]) > POSE_TOLERANCE or
+                moved != bool(record["moved"]) or
+                abs(robot.battery_level - record["battery"]) > BATTERY_TOLERANCE):
+            if mismatches < 5:
+                print(f"⚠️  Step {record['step']} {robot_id}: replay diverged from recording")
+            mismatches += 1
+    elapsed = time.perf_counter() - start
+    return len(reader) / elapsed, mismatches, skipped
+
+
+async def replay_backend(reader, url):
+    """Stream one telemetry frame per record to the backend; returns frames/s."""
+    import websockets
+
+    speeds = {"forward": 0.1, "backward": 0.1, "left": 0.05, "right": 0.05}
+    cycles = {}
+    async with websockets.connect(url) as ws:
+        await ws.send(json.dumps({"type": "hello", "role": "robot",
+                                  "robots": reader.robot_ids, "encodings": ["json"]}))
+        start = time.perf_counter()
+        for raw in reader.iter_raw():
+            record = dict(zip(RECORD_FIELDS, raw))
+            robot_id = reader.robot_ids[record["robot"]]
+            cycles[robot_id] = cycles.get(robot_id, -1) + 1
+            await ws.send(json.dumps({
+                "type": "telemetry",
+                "robotId": robot_id,
+                "pose": {"x": round(record["x"], 3), "y": round(record["y"], 3),
+                         "theta": round(record["theta"], 4)},
+                "speed": speeds.get(COMMAND_NAMES.get(record["cmd"]), 0.0),
+                "battery": round(record["battery"], 1),
+                "cycle": cycles[robot_id],
+                "timestamp": int(time.time() * 1000),
+                "step": record["step"],
+                "simTime": round(record["sim_time"], 3)
+            }))
+        elapsed = time.perf_counter() - start
+    return len(reader) / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recording", help="step recording file (S4_RECORD_FILE)")
+    parser.add_argument("--backend", metavar="URL",
+                        help="stream the records to a backend instead of replaying the controller")
+    args = parser.parse_args()
+    reader = RecordingReader(args.recording)
+    print(f"💾 {len(reader)} records | {len(reader.robot_ids)} robot(s) | "
+          f"timestep {reader.timestep} ms")
+    if args.backend:
+        url = args.backend
+        frames_per_sec = asyncio.run(replay_backend(reader, url))
+        print(f"📡 Streamed {len(reader)} telemetry frames to {url} | {frames_per_sec:,.0f} frames/s")
+    else:
+        records_per_sec, mismatches, skipped = replay_controller(reader)
+        for command, count in sorted(skipped.items()):
+            print(f"⏭️  Skipped {count} {command} record(s): {command} arguments are not "
+                  f"recorded, so those steps cannot be replayed")
+        print(f"🔁 Replayed {len(reader) - sum(skipped.values())} of {len(reader)} records | "
+              f"{records_per_sec:,.0f} records/s | {mismatches} mismatch(es)")
+        sys.exit(1 if mismatches else 0)
@@ -0,0 +1,338 @@
+"""
+S4 Remote Robot Management System - Scenario Runner
+====================================================
+
+Runs a batch of controller scenarios (command scripts, battery models,
+fleet sizes, collision / zone settings, ...) against the headless world and
+merges their metrics into one report. No Webots and no backend server
+required.
+
+Every scenario runs the real robot_controller.main() loop in its own worker
+process of a ProcessPoolExecutor (one per core, a fresh interpreter per
+scenario, since the controller reads its S4_* settings at import time):
+- the world is a HeadlessSupervisor that also meters the run (wall time per
+  step, distance driven per robot)
+- the backend link is a ScriptTransport: scripted protocol messages are
+  delivered on their "atStep", and everything the controller sends is
+  counted by type instead of going over a socket
+
+Per run the report has steps/s, real-time factor, distance, battery used,
+the messages sent, step wall-time percentiles and the controller's own
+command latency histograms (latency.py). Histograms are merged across runs
+bucket by bucket, so the totals carry true fleet-wide percentiles.
+
+Scenario spec (JSON; see benchmarks/scenarios.json):
+
+    {"defaults": {"steps": 2000, "timestep": 64, "fleet": 1, "env": {}},
+     "scenarios": [
+       {"name": "patrol", "period": 200,
+        "script": [{"atStep": 1, "cmd": "forward", "steps": 40}, ...]},
+       {"name": "fleet", "fleet": [10, 100], "script": [...]},
+       {"name": "cold", "env": {"S4_BATTERY_MODEL": "physics",
+                                "S4_BATTERY_TEMPERATURE": "0"}, "script": [...]}]}
+
+- script entries are protocol messages ("type" defaults to "cmd",
+  "atStep" to 1); with "period" the script repeats every period steps
+- a list for "fleet" expands into one run per fleet size
+- "env" sets S4_* variables for that run only (merged over the defaults)
+
+Usage:
+    python webots_project/benchmarks/scenario_runner.py [spec.json] [--jobs N] [--json report.json]
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import json
+import math
+import multiprocessing
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+from latency import LatencyHistogram  # noqa: E402
+from world_backend import HeadlessSupervisor  # noqa: E402
+
+DEFAULT_SPEC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "scenarios.json")
+DEFAULT_STEPS = 2000
+DEFAULT_TIMESTEP = 64  # ms
+# Applied before each scenario's own env: quiet logs, and never wait for tick grants
+BASE_ENV = {"S4_LOG_LEVEL": "WARNING", "S4_LOCKSTEP": "0"}
+STEP_HOP = "step.wall"  # per-step wall time histogram (us)
+
+# ============================================
+# SCENARIOS
+# ============================================
+
+
+def expand_scenarios(spec):
+    """Scenario list with defaults applied and fleet lists expanded into one run each."""
+    defaults = spec.get("defaults", {})
+    runs = []
+    for index, entry in enumerate(spec.get("scenarios", [])):
+        scenario = {"steps": DEFAULT_STEPS, "timestep": DEFAULT_TIMESTEP, "fleet": 1,
+                    "script": [], "period": None}
+        scenario.update(defaults)
+        scenario.update(entry)
+        scenario["env"] = {**defaults.get("env", {}), **entry.get("env", {})}
+        scenario.setdefault("name", f"scenario{index + 1}")
+        fleets = scenario["fleet"] if isinstance(scenario["fleet"], list) else [scenario["fleet"]]
+        for fleet in fleets:
+            run = dict(scenario, fleet=int(fleet))
+            if len(fleets) > 1:
+                run["name"] = f"{scenario['name']}@{fleet}"
+            runs.append(run)
+    return runs
+
+
+def fleet_defs(fleet):
+    """DEF names of a fleet (empty = single-robot mode on the supervisor's own node)."""
+    return [f"ROBOT_{i + 1}" for i in range(fleet)] if fleet > 1 else []
+
+
+def scripted_messages(scenario):
+    """[(step, message), ...] for a scenario's script, repeated every period steps."""
+    steps, period = scenario["steps"], scenario["period"]
+    messages = []
+    for base in range(0, steps, period) if period else [0]:
+        for entry in scenario["script"]:
+            message = {"type": "cmd", **entry}
+            at_step = base + int(entry.get("atStep", 1))
+            if at_step > steps:
+                continue
+            if message["type"] in ("cmd", "cmd_batch"):
+                message["atStep"] = at_step
+            else:
+                message.pop("atStep", None)
+            messages.append((at_step, message))
+    messages.sort(key=lambda item: item[0])
+    return messages
+
+# ============================================
+# WORLD AND LINK STAND-INS
+# ============================================
+
+
+class ScenarioSupervisor(HeadlessSupervisor):
+    """Headless world that also records wall time per step and distance per robot."""
+
+    def __init__(self, basic_timestep, max_steps):
+        super().__init__(basic_timestep, max_steps)
+        self.step_wall = LatencyHistogram("us")
+        self.last_step_at = None
+        self.positions = {}
+        self.distance = collections.Counter()
+
+    def step(self, timestep):
+        # One call per loop iteration: the gap between calls is a whole control step
+        now = time.perf_counter()
+        if self.last_step_at is not None:
+            self.step_wall.record((now - self.last_step_at) * 1e6)
+        self.last_step_at = now
+        self.measure()
+        return super().step(timestep)
+
+    def measure(self):
+        """Add the distance every node moved since the previous step."""
+        for def_name, node in self.nodes.items():
+            x, y, _ = node.getPosition()
+            last = self.positions.get(def_name)
+            if last is not None:
+                self.distance[def_name] += math.hypot(x - last[0], y - last[1])
+            self.positions[def_name] = (x, y)
+
+
+class ScriptTransport:
+    """In-process stand-in for AsyncTransport: scripted inbox, counting outbox."""
+
+    def __init__(self, messages, clock):
+        self.pending = collections.deque(messages)  # (step, message) sorted by step
+        self.clock = clock  # returns the controller's current step
+        self.connected = True
+        self.connect_count = 1
+        self.sent = collections.Counter()
+        self.sent_bytes = 0
+
+    def poll(self, timeout=None):
+        """Messages due on the current step; cmd messages get a sentAt stamp like the frontend's."""
+        step = self.clock()
+        messages = []
+        while self.pending and self.pending[0][0] <= step:
+            message = self.pending.popleft()[1]
+            if message.get("type") == "cmd":
+                message = dict(message, sentAt=int(time.time() * 1000))
+            messages.append(json.dumps(message))
+        return messages
+
+    def send(self, message, coalesce_key=None, merge=None):
+        if isinstance(message, bytes):
+            kind = "telemetry"  # binary frame
+        elif coalesce_key is not None and coalesce_key[0] != "telemetry":
+            kind = coalesce_key[0]  # profile
+        else:
+            kind = json.loads(message).get("type", "?")  # telemetry / telemetry_delta / acks
+        self.sent[kind] += 1
+        self.sent_bytes += len(message)
+
+    def stats(self):
+        return {"connected": True, "connects": 1, "pending": len(self.pending),
+                "queued": 0, "sent": sum(self.sent.values()), "coalesced": 0, "dropped": 0,
+                "dropped_reliable": 0, "healthy": True}
+
+    def stop(self):
+        pass
+
+# ============================================
+# WORKER
+# ============================================
+
+
+def run_scenario(scenario):
+    """
+    Run one scenario through robot_controller.main() (in a fresh worker process).
+
+    Returns (result dict, {hop: LatencyHistogram}).
+    """
+    defs = fleet_defs(scenario["fleet"])
+    os.environ.update(BASE_ENV)
+    os.environ.update({key: str(value) for key, value in scenario["env"].items()})
+    os.environ["S4_FLEET_DEFS"] = ",".join(defs)
+    import robot_controller as rc
+
+    supervisor = ScenarioSupervisor(scenario["timestep"], scenario["steps"])
+    supervisor.add_fleet(defs)
+    rc.transport = ScriptTransport(scripted_messages(scenario), lambda: rc.sim_step)
+    started = time.perf_counter()
+    rc.main(supervisor)
+    wall = time.perf_counter() - started
+    supervisor.measure()
+
+    fleet = list(rc.robots.values())
+    steps = supervisor.step_count
+    distance = [supervisor.distance[robot.robot_id] for robot in fleet]
+    battery_used = [100.0 - robot.battery_level for robot in fleet]
+    histograms = dict(rc.latency.hops)
+    histograms[STEP_HOP] = supervisor.step_wall
+    result = {
+        "name": scenario["name"],
+        "robots": len(fleet),
+        "steps": steps,
+        "timestep": scenario["timestep"],
+        "simSeconds": round(supervisor.getTime(), 3),
+        "wallSeconds": round(wall, 3),
+        "stepsPerSec": round(steps / wall, 1),
+        "robotStepsPerSec": round(steps * len(fleet) / wall, 1),
+        "realtimeFactor": round(supervisor.getTime() / wall, 1),
+        "distance": {"total": round(sum(distance), 3), "max": round(max(distance), 3)},
+        "battery": {"used": round(sum(battery_used), 3), "maxUsed": round(max(battery_used), 3),
+                    "minLevel": round(min(robot.battery_level for robot in fleet), 3)},
+        "messages": dict(rc.transport.sent),
+        "bytesSent": rc.transport.sent_bytes,
+        "planner": rc.planner.stats() if rc.planner is not None else None,
+        "collisions": rc.collisions.stats() if rc.collisions is not None else None,
+        "zones": rc.geofence.stats(),
+    }
+    return result, histograms
+
+# ============================================
+# REPORT
+# ============================================
+
+
+def merge_report(runs, elapsed, jobs):
+    """Merge per-run results and histograms into one report dict."""
+    merged = {}
+    messages = collections.Counter()
+    results = []
+    for result, histograms in runs:
+        for hop, histogram in histograms.items():
+            merged.setdefault(hop, LatencyHistogram(histogram.unit)).merge(histogram)
+        messages.update(result["messages"])
+        result["stepWall"] = histograms[STEP_HOP].summary()
+        result["latency"] = {hop: h.summary() for hop, h in sorted(histograms.items())
+                             if hop != STEP_HOP}
+        results.append(result)
+    robot_steps = sum(r["steps"] * r["robots"] for r in results)
+    total = {
+        "runs": len(results),
+        "steps": sum(r["steps"] for r in results),
+        "robotSteps": robot_steps,
+        "wallSeconds": round(sum(r["wallSeconds"] for r in results), 3),
+        "elapsedSeconds": round(elapsed, 3),
+        "robotStepsPerSec": round(robot_steps / elapsed, 1) if elapsed else None,
+        "distance": round(sum(r["distance"]["total"] for r in results), 3),
+        "batteryUsed": round(sum(r["battery"]["used"] for r in results), 3),
+        "messages": dict(messages),
+        "stepWall": merged[STEP_HOP].summary() if STEP_HOP in merged else None,
+        "latency": {hop: h.summary() for hop, h in sorted(merged.items()) if hop != STEP_HOP},
+    }
+    return {"jobs": jobs, "scenarios": results, "total": total}
+
+
+def print_report(report, failed):
+    print(f"{'scenario':<22} {'robots':>6} {'steps':>6} {'steps/s':>9} {'xRT':>6} "
+          f"{'dist m':>8} {'batt %':>7} {'step p50':>9} {'p99 us':>8} {'msgs':>7}")
+    for r in report["scenarios"]:
+        print(f"{r['name']:<22} {r['robots']:>6} {r['steps']:>6} {r['stepsPerSec']:>9,.0f} "
+              f"{r['realtimeFactor']:>6,.0f} {r['distance']['total']:>8.2f} "
+              f"{r['battery']['used']:>7.3f} {r['stepWall']['p50']:>9} {r['stepWall']['p99']:>8} "
+              f"{sum(r['messages'].values()):>7}")
+    total = report["total"]
+    step_wall = total["stepWall"] or {}
+    print(f"📊 {total['runs']} run(s) on {report['jobs']} worker(s) in {total['elapsedSeconds']:.2f} s | "
+          f"{total['robotStepsPerSec']:,.0f} robot-steps/s | {total['distance']:.2f} m | "
+          f"battery {total['batteryUsed']:.3f} % | step p50 {step_wall.get('p50')} us, "
+          f"p99 {step_wall.get('p99')} us, p99.9 {step_wall.get('p99.9')} us")
+    for hop, summary in total["latency"].items():
+        print(f"⏱️  {hop:<24} n={summary['count']:<6} p50 {summary['p50']} | p90 {summary['p90']} | "
+              f"p99 {summary['p99']} {summary['unit']}")
+    for name, error in failed:
+        print(f"❌ {name}: {error}")
+
+
+def run_all(scenarios, jobs):
+    """Fan scenarios out over a process pool; returns (report, [(name, error), ...])."""
+    # spawn + one task per child: each scenario imports the controller with its own env
+    context = multiprocessing.get_context("spawn")
+    runs, failed = [], []
+    started = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs, mp_context=context,
+                                                max_tasks_per_child=1) as pool:
+        futures = {pool.submit(run_scenario, scenario): index
+                   for index, scenario in enumerate(scenarios)}
+        for future in concurrent.futures.as_completed(futures):
+            index = futures[future]
+            try:
+                runs.append((index, future.result()))
+            except Exception as e:
+                failed.append((scenarios[index]["name"], f"{type(e).__name__}: {e}"))
+    elapsed = time.perf_counter() - started
+    runs.sort(key=lambda run: run[0])  # report in spec order
+    return merge_report([run for _, run in runs], elapsed, jobs), failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("spec", nargs="?", default=DEFAULT_SPEC,
+                        help="scenario spec (default benchmarks/scenarios.json)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: one per core)")
+    parser.add_argument("--json", dest="output", metavar="FILE", help="also write the report as JSON")
+    args = parser.parse_args()
+    jobs, output = args.jobs, args.output
+    with open(args.spec, encoding="utf-8") as f:
+        scenarios = expand_scenarios(json.load(f))
+    print(f"🚀 {len(scenarios)} scenario run(s) on {min(jobs, len(scenarios))} worker(s)")
+    report, failed = run_all(scenarios, jobs)
+    print_report(report, failed)
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Report written to {output}")
+    sys.exit(1 if failed else 0)
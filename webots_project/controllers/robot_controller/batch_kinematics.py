@@ -0,0 +1,191 @@
+"""
+S4 Remote Robot Management System - Batched Fleet Kinematics
+=============================================================
+
+Vectorized (NumPy) version of the robot-relative kinematics in
+robot_controller.py, for simulating large fleets.
+
+All poses live in one contiguous (N, 3) float64 array [x, y, theta] and
+commands are applied with array operations instead of one Python call per
+robot. The arithmetic mirrors the scalar functions operation by operation,
+so results are identical to move_forward / move_backward / rotate_left /
+rotate_right / normalize_theta and to the turn-once behaviour of
+apply_movement.
+
+Requires: numpy
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+import numpy as np
+
+# ============================================
+# COMMAND CODES
+# ============================================
+
+CMD_NONE = -1  # unknown command: no movement, debounce state untouched
+CMD_STOP = 0
+CMD_FORWARD = 1
+CMD_BACKWARD = 2
+CMD_LEFT = 3
+CMD_RIGHT = 4
+
+COMMAND_CODES = {
+    "stop": CMD_STOP,
+    "forward": CMD_FORWARD,
+    "backward": CMD_BACKWARD,
+    "left": CMD_LEFT,
+    "right": CMD_RIGHT,
+}
+
+TURN_ANGLE = math.pi / 2  # same as robot_controller.TURN_ANGLE
+TWO_PI = 2 * math.pi
+
+# ============================================
+# VECTORIZED PRIMITIVES
+# ============================================
+
+
+def encode_commands(commands):
+    """Convert a sequence of command strings to an int8 code array."""
+    return np.fromiter((COMMAND_CODES.get(c, CMD_NONE) for c in commands),
+                       dtype=np.int8, count=len(commands))
+
+
+def normalize_theta(theta):
+    """
+    Normalize angles to [-π, π].
+
+    Uses the same repeated ±2π subtraction as the scalar while-loop (instead
+    of np.mod) so the floating-point result is bit-identical.
+    """
+    theta = np.array(theta, dtype=np.float64, copy=True)
+    over = theta > math.pi
+    while over.any():
+        theta[over] -= TWO_PI
+        over = theta > math.pi
+    under = theta < -math.pi
+    while under.any():
+        theta[under] += TWO_PI
+        under = theta < -math.pi
+    return theta
+
+
+def move_forward(positions, theta, speed):
+    """Move each (x, y, ...) row forward along its theta."""
+    out = np.array(positions, dtype=np.float64, copy=True)
+    out[:, 0] = out[:, 0] + np.cos(theta) * speed
+    out[:, 1] = out[:, 1] + np.sin(theta) * speed
+    return out
+
+
+def move_backward(positions, theta, speed):
+    """Move each (x, y, ...) row backward, opposite to its theta."""
+    out = np.array(positions, dtype=np.float64, copy=True)
+    out[:, 0] = out[:, 0] - np.cos(theta) * speed
+    out[:, 1] = out[:, 1] - np.sin(theta) * speed
+    return out
+
+
+def rotate_left(theta, speed):
+    """Rotate counter-clockwise (positive yaw)."""
+    return normalize_theta(np.asarray(theta) + speed)
+
+
+def rotate_right(theta, speed):
+    """Rotate clockwise (negative yaw)."""
+    return normalize_theta(np.asarray(theta) - speed)
+
+
+# ============================================
+# FLEET STATE
+# ============================================
+
+class FleetKinematics:
+    """
+    Pose table for N robots with batched command application.
+
+    poses[:, 0:2] is (x, y), poses[:, 2] is theta. z is kept separately since
+    the Supervisor controllers never change it. speed is the distance moved
+    per step (linear velocity * step length).
+    """
+
+    def __init__(self, count, speed=0.02):
+        self.poses = np.zeros((count, 3), dtype=np.float64)
+        self.z = np.zeros(count, dtype=np.float64)
+        self.last_executed = np.full(count, CMD_STOP, dtype=np.int8)
+        self.speed = speed
+        self._nodes = None   # node list the field handles below were looked up for
+        self._fields = None  # [(translation, rotation), ...], as in RobotNodeAdapter
+
+    @classmethod
+    def from_poses(cls, poses, speed=0.02, z=None):
+        """Build a fleet from an (N, 3) array-like of [x, y, theta]."""
+        poses = np.ascontiguousarray(poses, dtype=np.float64)
+        fleet = cls(len(poses), speed)
+        fleet.poses[:] = poses
+        if z is not None:
+            fleet.z[:] = z
+        return fleet
+
+    def __len__(self):
+        return len(self.poses)
+
+    def apply_commands(self, commands):
+        """
+        Apply one control step for every robot.
+
+        commands is an int8 code array (see encode_commands). Semantics match
+        robot_controller.apply_movement: forward/backward move every step,
+        left/right turn 90° once per new press and then keep moving forward.
+        Returns a boolean array of robots that moved.
+        """
+        commands = np.asarray(commands, dtype=np.int8)
+        x = self.poses[:, 0]
+        y = self.poses[:, 1]
+        theta = self.poses[:, 2]
+
+        # Turn once per new left/right press
+        new_left = (commands == CMD_LEFT) & (self.last_executed != CMD_LEFT)
+        new_right = (commands == CMD_RIGHT) & (self.last_executed != CMD_RIGHT)
+        if new_left.any():
+            theta[new_left] = normalize_theta(theta[new_left] + TURN_ANGLE)
+        if new_right.any():
+            theta[new_right] = normalize_theta(theta[new_right] - TURN_ANGLE)
+
+        # Linear step: forward for forward/left/right, backward for backward
+        ahead = (commands == CMD_FORWARD) | (commands == CMD_LEFT) | (commands == CMD_RIGHT)
+        back = commands == CMD_BACKWARD
+        if ahead.any():
+            t = theta[ahead]
+            x[ahead] = x[ahead] + np.cos(t) * self.speed
+            y[ahead] = y[ahead] + np.sin(t) * self.speed
+        if back.any():
+            t = theta[back]
+            x[back] = x[back] - np.cos(t) * self.speed
+            y[back] = y[back] - np.sin(t) * self.speed
+
+        known = commands != CMD_NONE
+        self.last_executed[known] = commands[known]
+        return ahead | back
+
+    def write_to_nodes(self, nodes, moved=None):
+        """
+        Push poses to Supervisor nodes (only the moved ones if a mask is given).
+
+        Field handles are looked up once per node list and reused on later
+        steps; pass the same list every step.
+        """
+        if self._nodes is not nodes:
+            self._fields = [(node.getField('translation'), node.getField('rotation'))
+                            for node in nodes]
+            self._nodes = nodes
+        indices = range(len(nodes)) if moved is None else np.flatnonzero(moved)
+        for i in indices:
+            x, y, theta = self.poses[i]
+            translation, rotation = self._fields[i]
+            translation.setSFVec3f([float(x), float(y), float(self.z[i])])
+            rotation.setSFRotation([0, 0, 1, float(theta)])
@@ -0,0 +1,228 @@
+"""
+S4 Remote Robot Management System - Battery Energy Models
+==========================================================
+
+Pluggable battery models behind one interface, picked with S4_BATTERY_MODEL:
+
+- "linear" (default): the original constant drain (battery_drain_rate % per
+  second) while moving; keeps existing step recordings replayable
+- "physics": electrical power from idle draw, drive electronics, rolling
+  resistance, acceleration and turning, drawn from a pack whose open-circuit
+  voltage depends on the state of charge and whose capacity and internal
+  resistance depend on temperature
+
+All curves are precomputed into lookup tables when the model is built (0.1 %
+state-of-charge bins, 1 °C temperature bins), so a step costs a table lookup
+and a square root regardless of curve detail. The cumulative-energy table
+gives the remaining Wh directly for time-to-empty estimates.
+
+Every model implements:
+
+    step(soc, moving, distance, rotation, speed, dt) -> (soc, speed, load)
+    step_many(...)                                   -> same, on NumPy arrays
+    time_to_empty(soc, load)                         -> seconds or None
+    configure(config)                                -> pick up runtime config
+
+soc is the battery level in %, distance (m) and rotation (rad) are the motion
+of this step, speed is the previous step's speed (m/s, for acceleration) and
+load is the model's drain measure (W for physics, %/s for linear), which the
+controller averages for time_to_empty().
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+# ============================================
+# CURVES
+# ============================================
+
+# 3S Li-ion pack: (state of charge %, open-circuit voltage V)
+PACK_OCV_CURVE = [(0, 9.0), (5, 9.9), (10, 10.35), (20, 10.65), (40, 10.95),
+                  (60, 11.25), (80, 11.7), (90, 12.0), (100, 12.6)]
+# (temperature °C, usable capacity factor)
+CAPACITY_TEMPERATURE_CURVE = [(-20, 0.60), (0, 0.80), (10, 0.90), (25, 1.00), (45, 1.00), (60, 0.95)]
+# (temperature °C, internal resistance factor)
+RESISTANCE_TEMPERATURE_CURVE = [(-20, 3.0), (0, 1.8), (10, 1.3), (25, 1.0), (45, 0.85), (60, 0.85)]
+
+SOC_BINS = 1000  # table resolution: 0.1 % of charge
+TEMPERATURE_RANGE = (-20, 60)  # °C covered by the temperature tables (clamped outside)
+GRAVITY = 9.81
+
+# ============================================
+# LOOKUP TABLES
+# ============================================
+
+
+def interpolate(curve, x):
+    """Piecewise-linear interpolation on [(x, y), ...] (clamped at both ends)."""
+    if x <= curve[0][0]:
+        return curve[0][1]
+    for (x0, y0), (x1, y1) in zip(curve, curve[1:]):
+        if x <= x1:
+            return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    return curve[-1][1]
+
+
+def build_table(curve, start, stop, bins):
+    """Sample a curve at bins + 1 evenly spaced points from start to stop."""
+    return [interpolate(curve, start + (stop - start) * i / bins) for i in range(bins + 1)]
+
+
+def soc_bin(soc):
+    """Table index of a state of charge in % (clamped)."""
+    return min(SOC_BINS, max(0, int(soc * (SOC_BINS / 100.0))))
+
+# ============================================
+# MODELS
+# ============================================
+
+
+class LinearDrainModel:
+    """The original model: battery_drain_rate % per second while moving."""
+
+    name = "linear"
+
+    def __init__(self, drain_rate=0.008):
+        self.drain_rate = drain_rate
+
+    def configure(self, config):
+        self.drain_rate = config.battery_drain_rate
+
+    def step(self, soc, moving, distance, rotation, speed, dt):
+        if not moving:
+            return soc, 0.0, 0.0
+        soc -= self.drain_rate * dt
+        return max(0.0, min(100.0, soc)), distance / dt, self.drain_rate
+
+    def step_many(self, soc, moving, distance, rotation, speed, dt):
+        import numpy as np
+        load = np.where(moving, self.drain_rate, 0.0)
+        speed = np.where(moving, np.asarray(distance) / dt, 0.0)
+        return np.clip(soc - load * dt, 0.0, 100.0), speed, load
+
+    def time_to_empty(self, soc, load):
+        """Seconds left at the averaged drain; None while (nearly) idle."""
+        if load <= 1e-9:
+            return None
+        return soc / load
+
+
+class PhysicsBatteryModel:
+    """Power-based discharge of a pack with SoC / temperature curves from lookup tables."""
+
+    name = "physics"
+
+    def __init__(self, capacity_ah=4.0, resistance_ohm=0.15, mass_kg=5.0, rolling_coeff=0.02,
+                 efficiency=0.7, idle_w=3.0, drive_w=4.0, turn_j_per_rad=2.0,
+                 temperature_c=25.0, ocv_curve=PACK_OCV_CURVE,
+                 capacity_curve=CAPACITY_TEMPERATURE_CURVE,
+                 resistance_curve=RESISTANCE_TEMPERATURE_CURVE):
+        self.capacity_ah = capacity_ah
+        self.resistance_ohm = resistance_ohm
+        self.mass_kg = mass_kg
+        self.rolling_force = rolling_coeff * mass_kg * GRAVITY  # N
+        self.efficiency = efficiency
+        self.idle_w = idle_w      # electronics, always on
+        self.drive_w = drive_w    # motor drivers while moving
+        self.turn_j_per_rad = turn_j_per_rad
+
+        self.ocv_table = build_table(ocv_curve, 0, 100, SOC_BINS)
+        # Energy stored between empty and each bin (Wh), trapezoidal over the OCV curve
+        self.energy_table = [0.0]
+        bin_ah = capacity_ah / SOC_BINS
+        for v0, v1 in zip(self.ocv_table, self.ocv_table[1:]):
+            self.energy_table.append(self.energy_table[-1] + bin_ah * (v0 + v1) / 2)
+        low, high = TEMPERATURE_RANGE
+        self.capacity_factor_table = build_table(capacity_curve, low, high, high - low)
+        self.resistance_factor_table = build_table(resistance_curve, low, high, high - low)
+        self._ocv_array = None  # NumPy copy of ocv_table for step_many
+        self.set_temperature(temperature_c)
+
+    def set_temperature(self, temperature_c):
+        """Select the temperature bin used for capacity and internal resistance."""
+        low, high = TEMPERATURE_RANGE
+        index = int(round(min(high, max(low, temperature_c)))) - low
+        self.temperature_c = temperature_c
+        self.capacity_factor = self.capacity_factor_table[index]
+        self.resistance = self.resistance_ohm * self.resistance_factor_table[index]
+        self.coulombs_per_percent = self.capacity_ah * 3600.0 * self.capacity_factor / 100.0
+
+    def configure(self, config):
+        if config.battery_temperature != self.temperature_c:
+            self.set_temperature(config.battery_temperature)
+
+    def power(self, moving, distance, rotation, speed, dt):
+        """Electrical power (W) drawn this step and the new speed (m/s)."""
+        new_speed = distance / dt
+        work = self.rolling_force * distance + self.turn_j_per_rad * abs(rotation)
+        if new_speed > speed:
+            work += 0.5 * self.mass_kg * (new_speed * new_speed - speed * speed)
+        watts = self.idle_w + work / (self.efficiency * dt)
+        if moving:
+            watts += self.drive_w
+        return watts, new_speed
+
+    def current(self, soc, watts):
+        """Pack current (A) for a power draw: solves P = (OCV - I R) I, capped at peak power."""
+        ocv = self.ocv_table[soc_bin(soc)]
+        r = self.resistance
+        discriminant = ocv * ocv - 4.0 * r * watts
+        if discriminant <= 0.0:
+            return ocv / (2.0 * r)
+        return (ocv - math.sqrt(discriminant)) / (2.0 * r)
+
+    def step(self, soc, moving, distance, rotation, speed, dt):
+        watts, speed = self.power(moving, distance, rotation, speed, dt)
+        soc -= self.current(soc, watts) * dt / self.coulombs_per_percent
+        return max(0.0, min(100.0, soc)), speed, watts
+
+    def step_many(self, soc, moving, distance, rotation, speed, dt):
+        """step() for a whole fleet at once (NumPy arrays, one element per robot)."""
+        import numpy as np
+        if self._ocv_array is None:
+            self._ocv_array = np.asarray(self.ocv_table)
+        soc = np.asarray(soc, dtype=np.float64)
+        distance = np.asarray(distance, dtype=np.float64)
+        speed = np.asarray(speed, dtype=np.float64)
+        new_speed = distance / dt
+        work = self.rolling_force * distance + self.turn_j_per_rad * np.abs(rotation)
+        gain = np.maximum(new_speed * new_speed - speed * speed, 0.0)
+        work = work + 0.5 * self.mass_kg * gain
+        watts = self.idle_w + work / (self.efficiency * dt) + np.where(moving, self.drive_w, 0.0)
+
+        bins = np.clip((soc * (SOC_BINS / 100.0)).astype(np.intp), 0, SOC_BINS)
+        ocv = self._ocv_array[bins]
+        r = self.resistance
+        discriminant = ocv * ocv - 4.0 * r * watts
+        current = np.where(discriminant > 0.0,
+                           (ocv - np.sqrt(np.maximum(discriminant, 0.0))) / (2.0 * r),
+                           ocv / (2.0 * r))
+        soc = np.clip(soc - current * dt / self.coulombs_per_percent, 0.0, 100.0)
+        return soc, new_speed, watts
+
+    def time_to_empty(self, soc, load):
+        """Seconds until empty at an average draw of `load` W (incl. I²R losses)."""
+        if load <= 1e-9:
+            return None
+        index = soc_bin(soc)
+        energy_j = self.energy_table[index] * 3600.0 * self.capacity_factor
+        ocv = self.ocv_table[index]
+        return energy_j / (load * (1.0 + self.resistance * load / (ocv * ocv)))
+
+
+BATTERY_MODELS = {
+    LinearDrainModel.name: LinearDrainModel,
+    PhysicsBatteryModel.name: PhysicsBatteryModel,
+}
+
+
+def create_battery_model(name="linear", **params):
+    """Build a battery model by name (see BATTERY_MODELS)."""
+    try:
+        model_class = BATTERY_MODELS[name]
+    except KeyError:
+        raise ValueError(f"Unknown battery model '{name}' "
+                         f"(available: {', '.join(BATTERY_MODELS)})") from None
+    return model_class(**params)
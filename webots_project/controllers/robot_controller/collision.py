@@ -0,0 +1,265 @@
+"""
+S4 Remote Robot Management System - Collision Layer
+====================================================
+
+Collision checks for supervisor mode. apply_movement teleports robots by
+writing their translation field, so physics never stops them at a wall or
+another robot. This layer checks every written move before the step ends.
+
+- obstacle footprints (occupancy_grid.world_footprints) are inserted once
+  into a uniform-grid spatial hash; robot discs live in a second hash and
+  are only re-bucketed when a robot crosses into another cell
+- a move is checked against the entries in the cells its swept disc covers,
+  so a step costs O(N) for N robots instead of O(N²) pairwise tests
+- a colliding move is clipped to the last free point along its segment
+  ("clip") or cancelled ("reject"); a robot that already overlaps something
+  may still move as long as the overlap does not get deeper
+- contacts (robots, obstacles and the floor edge closer than CONTACT_MARGIN,
+  plus whatever blocked the robot's move this step) are reported per robot
+  for telemetry
+
+Robots are discs of ROBOT_RADIUS; only x / y are checked.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+from occupancy_grid import ROBOT_RADIUS, world_footprints
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+COLLISION_MODES = ("clip", "reject")
+COLLISION_CELL_SIZE = 0.5  # m, spatial hash cell edge (> robot diameter)
+CONTACT_MARGIN = 0.005     # m, gaps below this count as contact
+CLIP_ITERATIONS = 12       # bisection steps when clipping a move (1/4096 of its length)
+DEPTH_EPSILON = 1e-9       # m, overlap growth below this is ignored
+
+# ============================================
+# SPATIAL HASH
+# ============================================
+
+
+class SpatialHash:
+    """Uniform grid of square cells: cell (ix, iy) -> set of keys."""
+
+    def __init__(self, cell_size=COLLISION_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.covered = {}  # key -> cells it was inserted into
+
+    def cell_range(self, x_min, y_min, x_max, y_max):
+        """Cells overlapping a world-space bounding box."""
+        size = self.cell_size
+        x0, x1 = math.floor(x_min / size), math.floor(x_max / size)
+        y0, y1 = math.floor(y_min / size), math.floor(y_max / size)
+        return tuple((ix, iy) for ix in range(x0, x1 + 1) for iy in range(y0, y1 + 1))
+
+    def insert(self, key, x_min, y_min, x_max, y_max):
+        """Insert or move a key; returns True if its cells changed."""
+        cells = self.cell_range(x_min, y_min, x_max, y_max)
+        if self.covered.get(key) == cells:
+            return False
+        self.remove(key)
+        for cell in cells:
+            self.cells.setdefault(cell, set()).add(key)
+        self.covered[key] = cells
+        return True
+
+    def remove(self, key):
+        for cell in self.covered.pop(key, ()):
+            bucket = self.cells[cell]
+            bucket.discard(key)
+            if not bucket:
+                del self.cells[cell]
+
+    def query(self, x_min, y_min, x_max, y_max):
+        """Keys in the cells overlapping a bounding box (a superset of the hits)."""
+        found = set()
+        for cell in self.cell_range(x_min, y_min, x_max, y_max):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return found
+
+# ============================================
+# GEOMETRY
+# ============================================
+
+
+def footprint_depth(footprint, x, y, radius):
+    """Overlap (m) of a disc with an obstacle footprint; negative = gap."""
+    dx, dy = x - footprint.x, y - footprint.y
+    if footprint.kind == "circle":
+        return footprint.radius + radius - math.hypot(dx, dy)
+    # Closest point of the box, in the box frame
+    cos_yaw, sin_yaw = math.cos(footprint.yaw), math.sin(footprint.yaw)
+    local_x = dx * cos_yaw + dy * sin_yaw
+    local_y = -dx * sin_yaw + dy * cos_yaw
+    half_x, half_y = footprint.size_x / 2, footprint.size_y / 2
+    outside_x = abs(local_x) - half_x
+    outside_y = abs(local_y) - half_y
+    if outside_x <= 0 and outside_y <= 0:
+        return radius - max(outside_x, outside_y)  # centre inside the box
+    return radius - math.hypot(max(outside_x, 0.0), max(outside_y, 0.0))
+
+# ============================================
+# COLLISION WORLD
+# ============================================
+
+
+class CollisionWorld:
+    """Static obstacle footprints plus live robot discs, both spatially hashed."""
+
+    def __init__(self, footprints=(), floor=None, mode="clip", robot_radius=ROBOT_RADIUS,
+                 cell_size=COLLISION_CELL_SIZE):
+        if mode not in COLLISION_MODES:
+            raise ValueError(f"Unknown collision mode '{mode}' "
+                             f"(available: {', '.join(COLLISION_MODES)})")
+        self.mode = mode
+        self.robot_radius = robot_radius
+        self.footprints = list(footprints)
+        # Floor as (x_min, y_min, x_max, y_max); robots must stay on it
+        self.floor = None
+        if floor is not None:
+            center_x, center_y, size_x, size_y = floor
+            self.floor = (center_x - size_x / 2, center_y - size_y / 2,
+                          center_x + size_x / 2, center_y + size_y / 2)
+        self.static = SpatialHash(cell_size)
+        for index, footprint in enumerate(self.footprints):
+            reach = footprint.radius
+            self.static.insert(index, footprint.x - reach, footprint.y - reach,
+                               footprint.x + reach, footprint.y + reach)
+        self.robots = SpatialHash(cell_size)
+        self.positions = {}  # robot id -> (x, y)
+        self.blocked = {}    # robot id -> contact keys that blocked its move this step
+        self.checks = 0      # narrow-phase tests
+        self.rebuckets = 0
+        self.clipped = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_world_file(cls, path, **kwargs):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_world_text(f.read(), **kwargs)
+
+    @classmethod
+    def from_world_text(cls, text, **kwargs):
+        floor, footprints = world_footprints(text)
+        return cls(footprints, floor, **kwargs)
+
+    # --- Robots --------------------------------------------------------------------
+
+    def place(self, robot_id, position):
+        """Record a robot's position at the start of a step (clears last step's blockers)."""
+        self.blocked.pop(robot_id, None)
+        self._move(robot_id, position[0], position[1])
+
+    def _move(self, robot_id, x, y):
+        """Update the hashed position; re-buckets only on a cell change."""
+        self.positions[robot_id] = (x, y)
+        r = self.robot_radius
+        if self.robots.insert(robot_id, x - r, y - r, x + r, y + r):
+            self.rebuckets += 1
+
+    def remove(self, robot_id):
+        self.positions.pop(robot_id, None)
+        self.blocked.pop(robot_id, None)
+        self.robots.remove(robot_id)
+
+    # --- Checks --------------------------------------------------------------------
+
+    def _candidates(self, robot_id, x_min, y_min, x_max, y_max):
+        """Obstacles and other robots near a bounding box (broad phase)."""
+        reach = self.robot_radius + CONTACT_MARGIN
+        box = (x_min - reach, y_min - reach, x_max + reach, y_max + reach)
+        robots = self.robots.query(*box)
+        robots.discard(robot_id)
+        return self.static.query(*box), robots
+
+    def _depths(self, x, y, obstacles, robots):
+        """{(kind, id): overlap} for everything within CONTACT_MARGIN of a disc at (x, y)."""
+        r = self.robot_radius
+        depths = {}
+        for index in obstacles:
+            depth = footprint_depth(self.footprints[index], x, y, r)
+            if depth > -CONTACT_MARGIN:
+                depths[("obstacle", self.footprints[index].name)] = depth
+        for other in robots:
+            ox, oy = self.positions[other]
+            depth = 2 * r - math.hypot(x - ox, y - oy)
+            if depth > -CONTACT_MARGIN:
+                depths[("robot", other)] = depth
+        if self.floor is not None:
+            x_min, y_min, x_max, y_max = self.floor
+            depth = r - min(x - x_min, x_max - x, y - y_min, y_max - y)
+            if depth > -CONTACT_MARGIN:
+                depths[("edge", "floor")] = depth
+        self.checks += len(obstacles) + len(robots)
+        return depths
+
+    def resolve(self, robot_id, start, target):
+        """
+        Check a move from start to target (positions [x, y, z]).
+
+        Returns (position, status): status is "free", "clipped" or "rejected"
+        and position is where the robot may go (target's z is kept). The
+        robot's hashed position is updated to it.
+        """
+        sx, sy, tx, ty = start[0], start[1], target[0], target[1]
+        obstacles, robots = self._candidates(robot_id, min(sx, tx), min(sy, ty),
+                                             max(sx, tx), max(sy, ty))
+        before = self._depths(sx, sy, obstacles, robots)
+
+        def blockers(x, y):
+            return [key for key, depth in self._depths(x, y, obstacles, robots).items()
+                    if depth > max(0.0, before.get(key, 0.0)) + DEPTH_EPSILON]
+
+        def allowed(x, y):
+            return not blockers(x, y)
+
+        x, y, status = tx, ty, "free"
+        blocked = blockers(tx, ty)
+        if blocked:
+            self.blocked[robot_id] = blocked
+            if self.mode == "reject":
+                x, y, status = sx, sy, "rejected"
+                self.rejected += 1
+            else:
+                low, high = 0.0, 1.0
+                for _ in range(CLIP_ITERATIONS):
+                    mid = (low + high) / 2
+                    if allowed(sx + (tx - sx) * mid, sy + (ty - sy) * mid):
+                        low = mid
+                    else:
+                        high = mid
+                x, y, status = sx + (tx - sx) * low, sy + (ty - sy) * low, "clipped"
+                self.clipped += 1
+        self._move(robot_id, x, y)
+        return [x, y, target[2]], status
+
+    def contacts(self, robot_id):
+        """Contacts at the robot's hashed position and this step's blockers: [{"kind", "id"}, ...]."""
+        position = self.positions.get(robot_id)
+        if position is None:
+            return []
+        x, y = position
+        obstacles, robots = self._candidates(robot_id, x, y, x, y)
+        keys = set(self._depths(x, y, obstacles, robots))
+        keys.update(self.blocked.get(robot_id, ()))
+        return [{"kind": kind, "id": name} for kind, name in sorted(keys)]
+
+    def stats(self):
+        return {
+            "mode": self.mode,
+            "robots": len(self.positions),
+            "obstacles": len(self.footprints),
+            "cells": len(self.robots.cells),
+            "checks": self.checks,
+            "rebuckets": self.rebuckets,
+            "clipped": self.clipped,
+            "rejected": self.rejected,
+        }
@@ -0,0 +1,191 @@
+"""
+S4 Remote Robot Management System - Sequenced Command Queue
+============================================================
+
+Per-robot FIFO of movement commands, drained once per simulation step.
+
+Every command carries a sequence number (stamped by the backend router, or
+assigned locally) and an optional duration in steps:
+- a command with "steps" runs for exactly that many steps, then the next
+  queued command starts (or the robot stops if none is queued)
+- a command without "steps" runs for at least one step and holds until a
+  newer command is queued
+- "stop" preempts: it clears everything queued before it and ends the
+  running command, timed or not (entries earlier in the same batch still
+  run first)
+- a command with "at_step" (protocol: "atStep") is held until that
+  simulation step and kept ordered among other tagged commands; used by
+  lockstep runs to script commands step-exactly
+
+Batches ("forward for 40 steps, then right") are just several entries
+pushed together. Each entry is acknowledged when it starts executing, with
+the step it was received on and the step it was executed on, plus a trace of
+the timestamps collected along the way (frontend sentAt, router routerAt,
+robot receive and actuation, in wall and sim time).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import collections
+import threading
+import time
+
+# ============================================
+# COMMAND ENTRY
+# ============================================
+
+
+class QueuedCommand:
+    """A single sequenced command waiting for (or in) execution."""
+
+    __slots__ = ("cmd", "seq", "index", "steps", "received_step", "received_at",
+                 "executed_step", "executed_at", "remaining", "trace", "at_step", "params")
+
+    def __init__(self, cmd, seq, index=0, steps=None, received_step=0, received_at=None,
+                 trace=None, at_step=None, params=None):
+        self.cmd = cmd
+        self.seq = seq
+        self.index = index  # position inside a batch
+        self.steps = steps  # None = hold until superseded
+        self.received_step = received_step
+        self.received_at = received_at if received_at is not None else time.time()
+        self.executed_step = None
+        self.executed_at = None
+        self.remaining = steps
+        self.trace = trace if trace is not None else {}  # upstream stamps (sentAt, routerAt, ...)
+        self.at_step = at_step  # earliest step to start on (None = as soon as possible)
+        self.params = params or {}  # command arguments (e.g. goto target x / y)
+
+    def ack(self, robot_id, sim_time=None):
+        """Build the execution acknowledgment for this command (stamps executedAt)."""
+        self.executed_at = time.time()
+        trace = dict(self.trace)
+        trace["executedAt"] = int(self.executed_at * 1000)
+        trace["executedSimTime"] = sim_time
+        return {
+            "type": "cmd_ack",
+            "robotId": robot_id,
+            "command": self.cmd,
+            "seq": self.seq,
+            "index": self.index,
+            "status": "executed",
+            "receivedStep": self.received_step,
+            "executedStep": self.executed_step,
+            "latencySteps": self.executed_step - self.received_step,
+            "atStep": self.at_step,
+            "step": self.executed_step,
+            "receivedAt": int(self.received_at * 1000),
+            "executedAt": trace["executedAt"],
+            "trace": trace
+        }
+
+
+# ============================================
+# QUEUE
+# ============================================
+
+
+class CommandQueue:
+    """Lock-protected command FIFO with a current (executing) command."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = collections.deque()
+        self._next_local_seq = 1
+        self.current = None
+        self.received = 0
+        self.preempted = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._pending)
+
+    def push(self, cmd, seq=None, steps=None, received_step=0, trace=None, at_step=None,
+             params=None):
+        """Queue one command (with optional arguments); returns its sequence number."""
+        item = dict(params or {}, cmd=cmd, steps=steps)
+        return self.push_batch([item], seq, received_step, trace, at_step)
+
+    def push_batch(self, commands, seq=None, received_step=0, trace=None, at_step=None):
+        """
+        Queue several commands under one sequence number (index = position).
+
+        With at_step the first entry starts on that step at the earliest; the
+        rest follow it as usual. Fields of an entry other than cmd / steps are
+        kept as the command's params.
+        """
+        now = time.time()
+        with self._lock:
+            if seq is None:
+                seq = self._next_local_seq
+            self._next_local_seq = max(self._next_local_seq, seq + 1)
+            position = self._insert_position(at_step)
+            batch = []
+            for index, item in enumerate(commands):
+                cmd = item.get("cmd", "stop")
+                steps = item.get("steps")
+                if cmd == "stop" and at_step is None:
+                    # Stop preempts anything queued before this batch; the
+                    # batch's own earlier entries still run ahead of it
+                    self.preempted += len(self._pending) - len(batch)
+                    self._pending = collections.deque(batch)
+                    position = len(batch)
+                params = {k: v for k, v in item.items() if k not in ("cmd", "steps")}
+                entry = QueuedCommand(cmd, seq, index, steps, received_step, now, trace,
+                                      at_step if index == 0 else None, params)
+                self._pending.insert(position, entry)
+                batch.append(entry)
+                position += 1
+                self.received += 1
+        return seq
+
+    def _insert_position(self, at_step):
+        """Queue index for a new entry: the end, or before later-tagged commands."""
+        if at_step is None:
+            return len(self._pending)
+        for i, entry in enumerate(self._pending):
+            if entry.at_step is not None and entry.at_step > at_step:
+                return i
+        return len(self._pending)
+
+    @staticmethod
+    def _preempts(current, head):
+        """True if head is an untagged stop from a later batch than the running command."""
+        return (head.cmd == "stop" and head.at_step is None and head.seq != current.seq
+                and current.cmd != "stop")
+
+    def _head_ready(self, step):
+        return bool(self._pending) and (self._pending[0].at_step is None or
+                                        self._pending[0].at_step <= step)
+
+    def next_for_step(self, step):
+        """
+        Advance the queue by one step.
+
+        Returns (command, started) where command is the QueuedCommand to run
+        this step (None = nothing ever received) and started is True when it
+        began executing on this step (so it should be acknowledged).
+        """
+        with self._lock:
+            current = self.current
+            if current is not None and current.remaining is not None:
+                current.remaining -= 1
+            finished = current is None or (current.remaining is not None and current.remaining <= 0)
+            ready = self._head_ready(step)
+            superseded = current is not None and current.remaining is None and ready
+            if not finished and ready and self._preempts(current, self._pending[0]):
+                # An immediate stop ends the running command, timed or not
+                self.preempted += 1
+                superseded = True
+            if (finished or superseded) and ready:
+                current = self._pending.popleft()
+                current.executed_step = step
+                self.current = current
+                return current, True
+            if finished and current is not None:
+                # Timed command ran out with nothing queued behind it
+                self.current = QueuedCommand("stop", current.seq, current.index + 1, None, step)
+                self.current.executed_step = step
+                return self.current, False
+            return current, False
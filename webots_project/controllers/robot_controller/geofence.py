@@ -0,0 +1,277 @@
+"""
+S4 Remote Robot Management System - Geofence Zones
+===================================================
+
+Robot-side zone checks. Zones (circles or polygons) are pushed to the
+controller with a "zones" message. They are indexed once in a uniform-grid
+spatial hash (collision.SpatialHash), and every step each robot's motion
+segment is tested against the few zones in the cells it covers. Zones that
+would cover more than MAX_ZONE_CELLS cells stay out of the hash and are
+tested on every update instead, so one huge zone cannot flood the index.
+
+Only transitions are reported (zone_enter / zone_exit). Each one is placed
+at the exact point where the step's segment crosses the zone boundary, so a
+zone crossed within a single step still yields both events, and the event
+time is interpolated inside the step.
+
+    {"id": "dock", "shape": "circle", "center": [x, y], "radius": r}
+    {"id": "lab", "shape": "polygon", "points": [[x, y], [x, y], [x, y], ...]}
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+from collision import SpatialHash
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+ZONE_CELL_SIZE = 1.0  # m, spatial hash cell edge
+MAX_ZONES = 1000
+MAX_POLYGON_POINTS = 256
+MAX_ZONE_CELLS = 256  # larger zones are not indexed, just tested every update
+
+# ============================================
+# ZONES
+# ============================================
+
+
+class ZoneError(ValueError):
+    """Raised when a zone definition is invalid; carries per-zone errors."""
+
+    def __init__(self, errors):
+        super().__init__("; ".join(f"{k}: {v}" for k, v in errors.items()))
+        self.errors = errors
+
+
+class CircleZone:
+    """Disc zone (boundary included)."""
+
+    shape = "circle"
+
+    def __init__(self, zone_id, center, radius):
+        self.id = zone_id
+        self.cx, self.cy = center
+        self.radius = radius
+        self.bounds = (self.cx - radius, self.cy - radius, self.cx + radius, self.cy + radius)
+
+    def contains(self, x, y):
+        return (x - self.cx) ** 2 + (y - self.cy) ** 2 <= self.radius * self.radius
+
+    def crossings(self, ax, ay, bx, by):
+        """Segment parameters t in (0, 1] where a -> b crosses the circle."""
+        dx, dy = bx - ax, by - ay
+        fx, fy = ax - self.cx, ay - self.cy
+        a = dx * dx + dy * dy
+        if a == 0.0:
+            return []
+        b = 2.0 * (fx * dx + fy * dy)
+        c = fx * fx + fy * fy - self.radius * self.radius
+        discriminant = b * b - 4.0 * a * c
+        if discriminant <= 0.0:
+            return []  # misses or only touches
+        root = math.sqrt(discriminant)
+        return [t for t in ((-b - root) / (2.0 * a), (-b + root) / (2.0 * a)) if 0.0 < t <= 1.0]
+
+
+class PolygonZone:
+    """Simple polygon zone (even-odd rule)."""
+
+    shape = "polygon"
+
+    def __init__(self, zone_id, points):
+        self.id = zone_id
+        self.points = points
+        self.edges = list(zip(points, points[1:] + points[:1]))
+        xs, ys = [p[0] for p in points], [p[1] for p in points]
+        self.bounds = (min(xs), min(ys), max(xs), max(ys))
+
+    def contains(self, x, y):
+        inside = False
+        for (x1, y1), (x2, y2) in self.edges:
+            if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                inside = not inside
+        return inside
+
+    def crossings(self, ax, ay, bx, by):
+        """Sorted segment parameters t in (0, 1] where a -> b crosses an edge."""
+        dx, dy = bx - ax, by - ay
+        ts = []
+        for (px, py), (qx, qy) in self.edges:
+            ex, ey = qx - px, qy - py
+            denominator = dx * ey - dy * ex
+            if denominator == 0.0:
+                continue  # parallel
+            wx, wy = px - ax, py - ay
+            t = (wx * ey - wy * ex) / denominator
+            u = (wx * dy - wy * dx) / denominator
+            # An edge owns its start vertex only, so a vertex is crossed once
+            if 0.0 < t <= 1.0 and 0.0 <= u < 1.0:
+                ts.append(t)
+        ts.sort()
+        return ts
+
+
+def _point(value):
+    if (not isinstance(value, (list, tuple)) or len(value) != 2 or
+            not all(isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+                    for v in value)):
+        raise ValueError("expected [x, y]")
+    return (float(value[0]), float(value[1]))
+
+
+def parse_zone(spec):
+    """Build a zone from its protocol dict; raises ValueError if it is malformed."""
+    if not isinstance(spec, dict):
+        raise ValueError("expected an object")
+    zone_id = spec.get("id")
+    if isinstance(zone_id, bool) or not isinstance(zone_id, (str, int)) or zone_id == "":
+        raise ValueError("missing id")
+    zone_id = str(zone_id)
+    shape = spec.get("shape", "polygon" if "points" in spec else "circle")
+    if shape == "circle":
+        radius = spec.get("radius")
+        if (isinstance(radius, bool) or not isinstance(radius, (int, float)) or
+                not math.isfinite(radius) or not radius > 0):
+            raise ValueError("radius must be a positive number")
+        return CircleZone(zone_id, _point(spec.get("center")), float(radius))
+    if shape == "polygon":
+        points = spec.get("points")
+        if not isinstance(points, list) or not 3 <= len(points) <= MAX_POLYGON_POINTS:
+            raise ValueError(f"polygon needs 3 to {MAX_POLYGON_POINTS} points")
+        return PolygonZone(zone_id, [_point(p) for p in points])
+    raise ValueError(f"unknown shape '{shape}'")
+
+
+def parse_zones(specs):
+    """Parse a whole zone list (all-or-nothing); returns {id: zone} or raises ZoneError."""
+    if not isinstance(specs, list):
+        raise ZoneError({"zones": "expected a list"})
+    if len(specs) > MAX_ZONES:
+        raise ZoneError({"zones": f"at most {MAX_ZONES} zones"})
+    zones = {}
+    errors = {}
+    for index, spec in enumerate(specs):
+        key = spec.get("id", index) if isinstance(spec, dict) else index
+        try:
+            zone = parse_zone(spec)
+        except ValueError as e:
+            errors[str(key)] = str(e)
+            continue
+        if zone.id in zones:
+            errors[zone.id] = "duplicate id"
+            continue
+        zones[zone.id] = zone
+    if errors:
+        raise ZoneError(errors)
+    return zones
+
+
+def transitions(zone, ax, ay, bx, by, was_inside):
+    """[(t, entered), ...] for a robot moving a -> b that was (not) inside the zone."""
+    inside = zone.contains(ax, ay)
+    events = []
+    if inside != was_inside:
+        events.append((0.0, inside))  # zone redefined under the robot, or the robot teleported
+    for t in zone.crossings(ax, ay, bx, by):
+        inside = not inside
+        events.append((t, inside))
+    end_inside = zone.contains(bx, by)
+    if inside != end_inside:
+        events.append((1.0, end_inside))  # grazed a vertex / tangent: trust the end point
+    return events
+
+# ============================================
+# INDEX
+# ============================================
+
+
+class GeofenceIndex:
+    """Zones in a spatial hash, plus which zones each robot is in."""
+
+    def __init__(self, cell_size=ZONE_CELL_SIZE):
+        self.cell_size = cell_size
+        self.zones = {}
+        self.index = SpatialHash(cell_size)
+        self.unindexed = set()  # ids of zones too large for the hash
+        self.version = 0
+        self.inside = {}   # robot id -> ids of the zones it is in
+        self.checked = {}  # robot id -> zone version of its last check
+        self.checks = 0    # zone tests
+        self.enters = 0
+        self.exits = 0
+
+    def set_zones(self, zones):
+        """Replace every zone; robots still inside a removed zone exit on their next update."""
+        self.zones = dict(zones)
+        self.index = SpatialHash(self.cell_size)
+        self.unindexed = set()
+        for zone_id, zone in self.zones.items():
+            if self.cell_count(zone.bounds) > MAX_ZONE_CELLS:
+                self.unindexed.add(zone_id)
+            else:
+                self.index.insert(zone_id, *zone.bounds)
+        self.version += 1
+
+    def cell_count(self, bounds):
+        """Number of hash cells a bounding box covers."""
+        x_min, y_min, x_max, y_max = bounds
+        size = self.cell_size
+        return ((math.floor(x_max / size) - math.floor(x_min / size) + 1) *
+                (math.floor(y_max / size) - math.floor(y_min / size) + 1))
+
+    def update(self, robot_id, start, end):
+        """
+        Zone transitions of a robot that moved from start to end this step.
+
+        Returns [(t, zone id, entered), ...] sorted by t, the fraction of the
+        step's segment at which the boundary was crossed.
+        """
+        inside = self.inside.get(robot_id)
+        if not self.zones and not inside:
+            return []
+        ax, ay, bx, by = start[0], start[1], end[0], end[1]
+        if ax == bx and ay == by and self.checked.get(robot_id) == self.version:
+            return []  # nothing moved, nothing changed
+        self.checked[robot_id] = self.version
+        if inside is None:
+            inside = self.inside[robot_id] = set()
+
+        candidates = self.index.query(min(ax, bx), min(ay, by), max(ax, bx), max(ay, by))
+        candidates.update(self.unindexed)
+        candidates.update(inside)
+        events = []
+        for zone_id in candidates:
+            zone = self.zones.get(zone_id)
+            if zone is None:
+                events.append((0.0, zone_id, False))  # zone removed while the robot was in it
+                inside.discard(zone_id)
+                continue
+            self.checks += 1
+            for t, entered in transitions(zone, ax, ay, bx, by, zone_id in inside):
+                events.append((t, zone_id, entered))
+                if entered:
+                    inside.add(zone_id)
+                else:
+                    inside.discard(zone_id)
+        events.sort()
+        for _, _, entered in events:
+            if entered:
+                self.enters += 1
+            else:
+                self.exits += 1
+        return events
+
+    def stats(self):
+        return {
+            "zones": len(self.zones),
+            "version": self.version,
+            "cells": len(self.index.cells),
+            "unindexed": len(self.unindexed),
+            "checks": self.checks,
+            "enters": self.enters,
+            "exits": self.exits,
+        }
@@ -11,6 +11,7 @@ Features:
 - Periodic telemetry transmission
 - Command reception and movement control
 - Simulated battery drain
+- Rate-limited structured logging (structured_log.py)
 
 Author: Fitfest25 Hackathon Team
 Date: 2025
@@ -19,17 +20,21 @@ Date: 2025
 import json
 import time
 import math
-from controller import Supervisor
-import websocket
-import threading
+from world_backend import create_supervisor
+from transport import AsyncTransport
+from telemetry_scheduler import TelemetryScheduler
+from robot_adapter import RobotNodeAdapter
+from structured_log import configure_logging, get_logger, rate_key
 
 # ============================================
 # CONFIGURATION
 # ============================================
 
 BACKEND_URL = "ws://localhost:3000"
-TELEMETRY_INTERVAL = 0.2  # seconds (200ms)
-MOVE_SPEED = 0.5  # meters per timestep
+
+log = get_logger("humanoid_controller")
+TELEMETRY_INTERVAL = 0.2  # seconds (200ms), used when adaptive telemetry is off
+TELEMETRY_ADAPTIVE = True  # fast while moving, slow heartbeat while stopped
 BATTERY_DRAIN_RATE = 0.008  # % per second when moving
 
 # ============================================
@@ -39,28 +44,38 @@ BATTERY_DRAIN_RATE = 0.008  # % per second when moving
 battery_level = 100.0
 cycle_counter = 0
 current_command = "stop"
-ws_connection = None
-connected = False
+transport = None  # AsyncTransport, created in main()
+scheduler = TelemetryScheduler(adaptive=TELEMETRY_ADAPTIVE)
+if not TELEMETRY_ADAPTIVE:
+    scheduler.set_interval(TELEMETRY_INTERVAL)
 
-# Movement speeds (meters per step)
-FORWARD_SPEED = 0.02
-BACKWARD_SPEED = 0.02
-LEFT_SPEED = 0.02
-RIGHT_SPEED = 0.02
+# Movement velocities (m/s), integrated over the sim time elapsed each step
+FORWARD_VELOCITY = 0.3125   # 0.02 m per 64 ms step
+BACKWARD_VELOCITY = 0.3125
+LEFT_VELOCITY = 0.3125
+RIGHT_VELOCITY = 0.3125
 
 # ============================================
 # WEBSOCKET HANDLERS
 # ============================================
 
-def on_message(ws, message):
-    """Handle incoming WebSocket messages (commands from backend)."""
+def on_message(message):
+    """Handle an incoming WebSocket message (drained from the transport between steps)."""
     global current_command
     try:
         data = json.loads(message)
-        if data.get('type') == 'cmd':
+        if data.get('type') == 'telemetry_rate':
+            try:
+                scheduler.set_limits(data.get('minHz'), data.get('maxHz'))
+            except ValueError as e:
+                log.warning("⚠️ Ignoring telemetry_rate: %s", e)
+                return
+            scheduler.set_rates(data.get('movingHz'), data.get('idleHz'))
+            log.info("📶 Telemetry rate limits: %s–%s Hz", scheduler.min_hz, scheduler.max_hz)
+        elif data.get('type') == 'cmd':
             cmd = data.get('cmd', 'stop')
             current_command = cmd
-            print(f"📥 Received command: {cmd}")
+            log.info("📥 Received command: %s", cmd, extra=rate_key("cmd"))
             
             # Send acknowledgment
             ack = {
@@ -68,54 +83,30 @@ def on_message(ws, message):
                 "command": cmd,
                 "status": "received"
             }
-            ws.send(json.dumps(ack))
+            send_message(ack)
     except Exception as e:
-        print(f"❌ Error processing message: {e}")
-
-
-def on_error(ws, error):
-    """Handle WebSocket errors."""
-    print(f"❌ WebSocket error: {error}")
-
+        log.error("❌ Error processing message: %s", e, extra=rate_key("message_error"))
 
-def on_close(ws, close_status_code, close_msg):
-    """Handle WebSocket connection close."""
-    global connected
-    connected = False
-    print(f"🔌 WebSocket connection closed (code: {close_status_code})")
 
+def send_message(message, coalesce_key=None):
+    """
+    Queue a message for the backend; never blocks the simulation loop.
 
-def on_open(ws):
-    """Handle WebSocket connection open."""
-    global connected
-    connected = True
-    print(f"✅ Connected to backend at {BACKEND_URL}")
+    Messages with a coalesce_key replace an older unsent message with the same
+    key (used for telemetry); all others (acks etc.) are delivered reliably,
+    up to the send queue's hard cap (RELIABLE_QUEUE_SIZE).
+    """
+    if transport is not None:
+        transport.send(json.dumps(message), coalesce_key)
 
 
 def connect_websocket():
-    """Establish WebSocket connection to backend."""
-    global ws_connection
-    try:
-        print(f"🔄 Connecting to {BACKEND_URL}...")
-        ws_connection = websocket.WebSocketApp(
-            BACKEND_URL,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close,
-            on_open=on_open
-        )
-        
-        # Run WebSocket in a separate thread
-        ws_thread = threading.Thread(target=ws_connection.run_forever)
-        ws_thread.daemon = True
-        ws_thread.start()
-        
-        # Wait for connection
-        time.sleep(1)
-        return True
-    except Exception as e:
-        print(f"❌ Failed to connect: {e}")
-        return False
+    """Start the background transport (non-blocking; it reconnects by itself)."""
+    global transport
+    if transport is None:
+        transport = AsyncTransport(BACKEND_URL)
+        transport.start()
+    return transport
 
 
 # ============================================
@@ -139,27 +130,33 @@ def update_battery(is_moving, timestep):
         battery_level = max(0.0, min(100.0, battery_level))
 
 
-def apply_movement(robot_node, command, timestep):
-    """Apply movement by updating robot's translation field."""
+def apply_movement(adapter, command, timestep):
+    """
+    Apply movement by updating robot's translation field (cached handle).
+
+    timestep is the sim time (ms) elapsed since the previous step; positions
+    advance by velocity * elapsed time, so the speed does not depend on
+    basicTimeStep.
+    """
     if command == "stop":
         return False
     
-    # Get current position
-    current_pos = robot_node.getPosition()
-    new_pos = list(current_pos)
+    # Current position from this step's pose snapshot
+    new_pos = list(adapter.pose.position)
+    dt = timestep / 1000.0
     
     # Calculate movement based on command
     if command == "forward":
-        new_pos[0] += FORWARD_SPEED  # Move in +X direction
+        new_pos[0] += FORWARD_VELOCITY * dt  # Move in +X direction
     elif command == "backward":
-        new_pos[0] -= BACKWARD_SPEED  # Move in -X direction
+        new_pos[0] -= BACKWARD_VELOCITY * dt  # Move in -X direction
     elif command == "left":
-        new_pos[1] += LEFT_SPEED  # Move in +Y direction (strafe left)
+        new_pos[1] += LEFT_VELOCITY * dt  # Move in +Y direction (strafe left)
     elif command == "right":
-        new_pos[1] -= RIGHT_SPEED  # Move in -Y direction (strafe right)
+        new_pos[1] -= RIGHT_VELOCITY * dt  # Move in -Y direction (strafe right)
     
     # Update robot position
-    robot_node.getField('translation').setSFVec3f(new_pos)
+    adapter.set_translation(new_pos)
     return True
 
 
@@ -185,95 +182,95 @@ def create_telemetry(position, heading, is_moving):
 
 
 def send_telemetry(telemetry):
-    """Send telemetry to backend via WebSocket."""
-    global ws_connection, connected
-    if connected and ws_connection:
-        try:
-            ws_connection.send(json.dumps(telemetry))
-        except Exception as e:
-            print(f"❌ Failed to send telemetry: {e}")
-            connected = False
+    """Send telemetry to backend via WebSocket (only the newest unsent frame is kept)."""
+    send_message(telemetry, coalesce_key="telemetry")
 
 
 # ============================================
 # MAIN CONTROLLER
 # ============================================
 
-def main():
-    """Main robot controller loop."""
+def main(supervisor=None):
+    """
+    Main robot controller loop.
+
+    A pre-built supervisor (e.g. a HeadlessSupervisor) can be passed in;
+    otherwise one is created for the configured world backend.
+    """
     global cycle_counter, current_command
     
-    print("=" * 60)
-    print("🤖 S4 HUMANOID ROBOT SUPERVISOR CONTROLLER")
-    print("=" * 60)
+    configure_logging()
+    log.info("=" * 60)
+    log.info("🤖 S4 HUMANOID ROBOT SUPERVISOR CONTROLLER")
+    log.info("=" * 60)
     
     # Initialize supervisor
-    supervisor = Supervisor()
+    if supervisor is None:
+        supervisor = create_supervisor()
     timestep = int(supervisor.getBasicTimeStep())
-    print(f"⏱️  Timestep: {timestep} ms")
+    log.info("⏱️  Timestep: %s ms", timestep)
     
     # Get robot node
     robot_node = supervisor.getSelf()
-    print("✅ Robot node acquired")
+    log.info("✅ Robot node acquired")
     
     # Initialize sensors
     gps = supervisor.getDevice('gps')
     gps.enable(timestep)
     compass = supervisor.getDevice('compass')
     compass.enable(timestep)
-    print("✅ Sensors initialized (GPS, Compass)")
+    # Cached field handles; position read once per step (heading comes from the compass)
+    adapter = RobotNodeAdapter(robot_node, gps, read_orientation=False)
+    log.info("✅ Sensors initialized (GPS, Compass)")
     
-    # Connect to backend
-    if not connect_websocket():
-        print("⚠️  Starting without backend connection")
+    # Connect to backend (in the background; the loop starts immediately)
+    connect_websocket()
     
-    print("\n🚀 Starting main control loop...")
-    print("-" * 60)
-    
-    last_telemetry_time = 0
+    log.info("🚀 Starting main control loop...")
+    log.info("-" * 60)
     
     # Main control loop
+    last_time = 0.0
     while supervisor.step(timestep) != -1:
         current_time = supervisor.getTime()
+        elapsed = round((current_time - last_time) * 1000.0, 3)  # ms of sim time this step
+        last_time = current_time
+        
+        # Apply messages that arrived since the last step
+        for message in transport.poll():
+            on_message(message)
         
         # Read sensors
-        position = gps.getValues()
+        position = adapter.read_pose().position
         heading = get_heading(compass)
         
         # Apply current command to robot
-        is_moving = apply_movement(robot_node, current_command, timestep)
+        is_moving = apply_movement(adapter, current_command, elapsed)
         
         # Update battery
-        update_battery(is_moving, timestep)
+        update_battery(is_moving, elapsed)
         
-        # Send telemetry at specified interval
-        if current_time - last_telemetry_time >= TELEMETRY_INTERVAL:
+        # Send telemetry when the (motion-adaptive) scheduler says so
+        if scheduler.due(current_time, is_moving):
             telemetry = create_telemetry(position, heading, is_moving)
             send_telemetry(telemetry)
             
-            # Print status every 20 cycles
+            # Log status every 20 cycles
             if cycle_counter % 20 == 0:
-                speed_str = "0.10" if is_moving else "0.00"
-                print(f"📊 Cycle {cycle_counter:4d} | "
-                      f"Pos: ({position[0]:6.2f}, {position[1]:6.2f}) | "
-                      f"θ: {heading:6.3f} | "
-                      f"Speed: {speed_str} m/s | "
-                      f"Battery: {battery_level:5.1f}% | "
-                      f"Cmd: {current_command}")
+                log.info("📊 Cycle %4d | Pos: (%6.2f, %6.2f) | θ: %6.3f | Speed: %s m/s | "
+                         "Battery: %5.1f%% | Cmd: %s",
+                         cycle_counter, position[0], position[1], heading,
+                         "0.10" if is_moving else "0.00", battery_level, current_command,
+                         extra=rate_key("status"))
             
             cycle_counter += 1
-            last_telemetry_time = current_time
         
         # Check if battery is critical
         if battery_level < 10.0 and cycle_counter % 50 == 0:
-            print("⚠️  WARNING: Battery level critical!")
-        
-        # Attempt reconnection if disconnected
-        if not connected and cycle_counter % 100 == 0:
-            print("🔄 Attempting to reconnect...")
-            connect_websocket()
+            log.warning("⚠️  WARNING: Battery level critical!", extra=rate_key("battery"))
     
-    print("\n🛑 Controller stopped")
+    transport.stop()
+    log.info("🛑 Controller stopped")
 
 
 # ============================================
@@ -0,0 +1,145 @@
+"""
+S4 Remote Robot Management System - Latency Histograms
+=======================================================
+
+HDR-style latency histograms, one per hop of the command/telemetry path.
+
+Values are bucketed log-linearly: exact below 64, then 32 sub-buckets per
+power of two (≈3 % relative error), so record() is O(1), memory is fixed
+(2048 counters) and percentiles stay accurate from microseconds to hours.
+
+Hops recorded by the controller (wall-clock values in microseconds):
+- cmd.frontend_to_router   frontend sentAt   → router routerAt
+- cmd.router_to_robot      router routerAt   → robot receive
+- cmd.robot_to_actuation   robot receive     → step the command executed on
+- cmd.end_to_end           first known stamp → actuation
+- cmd.queue_steps          received step     → executed step (in steps)
+- telemetry.send_queue     frame queued      → picked up by the transport writer
+- link.reliable_queue      ack/reply queued  → picked up by the transport writer
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import threading
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+SUB_BUCKET_BITS = 5
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS   # 32 sub-buckets per power of two
+BUCKET_COUNT = 64 * SUB_BUCKETS      # covers every 64-bit value
+REPORT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+# ============================================
+# HISTOGRAM
+# ============================================
+
+
+def bucket_index(value):
+    """Map a non-negative integer to its log-linear bucket."""
+    if value < 2 * SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - (SUB_BUCKET_BITS + 1)
+    return (shift + 1) * SUB_BUCKETS + ((value >> shift) - SUB_BUCKETS)
+
+
+def bucket_value(index):
+    """Representative (midpoint) value of a bucket."""
+    if index < 2 * SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    lower = (index % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return lower + (1 << shift) // 2
+
+
+class LatencyHistogram:
+    """Fixed-size log-linear histogram of non-negative integer latencies."""
+
+    def __init__(self, unit="us"):
+        self.unit = unit
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def record(self, value):
+        value = max(0, int(value))
+        self.counts[bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, p):
+        """Value at percentile p (0-100), bucket-accurate."""
+        if self.count == 0:
+            return None
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(bucket_value(index), self.max)
+        return self.max
+
+    def summary(self):
+        """Dict with count, min/mean/max and the report percentiles."""
+        result = {"unit": self.unit, "count": self.count, "min": self.min, "max": self.max,
+                  "mean": round(self.total / self.count, 1) if self.count else None}
+        for p in REPORT_PERCENTILES:
+            result[f"p{p:g}"] = self.percentile(p)
+        return result
+
+    def merge(self, other):
+        """Add another histogram's counts (e.g. from a different process) to this one."""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.min, other.max):
+            if value is not None:
+                self.min = value if self.min is None else min(self.min, value)
+                self.max = value if self.max is None else max(self.max, value)
+
+    def reset(self):
+        self.__init__(self.unit)
+
+
+# ============================================
+# TRACKER
+# ============================================
+
+
+class LatencyTracker:
+    """Named per-hop histograms, safe to record from several threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hops = {}
+
+    def record(self, hop, value, unit="us"):
+        with self._lock:
+            histogram = self.hops.get(hop)
+            if histogram is None:
+                histogram = self.hops[hop] = LatencyHistogram(unit)
+            histogram.record(value)
+
+    def record_ms(self, hop, start_ms, end_ms):
+        """Record a wall-clock hop given two millisecond timestamps (skips missing stamps)."""
+        if start_ms is None or end_ms is None:
+            return
+        self.record(hop, (end_ms - start_ms) * 1000.0)
+
+    def summary(self):
+        with self._lock:
+            return {hop: h.summary() for hop, h in sorted(self.hops.items())}
+
+    def reset(self):
+        with self._lock:
+            self.hops = {}
@@ -0,0 +1,61 @@
+"""
+S4 Remote Robot Management System - Lockstep Gate
+==================================================
+
+Deterministic fixed-step mode: the controller only advances the simulation
+when a harness grants it ticks, so a run is reproducible regardless of CPU
+speed or network timing.
+
+- {"type": "tick", "ticks": K}     grants K more steps
+- {"type": "tick", "until": N}     grants every step up to and including N
+- when the granted steps are done the controller sends
+  {"type": "tick_done", "step": N, "simTime": ...} and waits again
+
+Commands tagged with "atStep" are held in the command queue until that step
+(command_queue.py), so a harness can script a run step-exactly.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+LOCKSTEP_POLL_TIMEOUT = 0.05  # seconds to block on the inbox while waiting for a tick
+
+# ============================================
+# GATE
+# ============================================
+
+
+class LockstepGate:
+    """Tracks which simulation steps the harness has granted."""
+
+    def __init__(self):
+        self.granted_until = 0  # last step that may run
+        self.grants = 0
+        self.done_reported = True  # nothing granted yet, nothing to report
+
+    def grant(self, current_step, ticks=None, until=None):
+        """Apply a tick message; returns the new granted_until."""
+        if until is not None:
+            target = int(until)
+        else:
+            target = max(self.granted_until, current_step) + int(ticks if ticks is not None else 1)
+        if target > self.granted_until:
+            self.granted_until = target
+            self.grants += 1
+            self.done_reported = False
+        return self.granted_until
+
+    def allows(self, step):
+        """True if `step` has been granted."""
+        return step <= self.granted_until
+
+    def should_report(self, current_step):
+        """True once per grant, when every granted step has run."""
+        if not self.done_reported and current_step >= self.granted_until:
+            self.done_reported = True
+            return True
+        return False
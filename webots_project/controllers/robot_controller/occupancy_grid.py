@@ -0,0 +1,328 @@
+"""
+S4 Remote Robot Management System - Occupancy Grid
+===================================================
+
+2-D occupancy grid of a Webots world, rasterized once from its .wbt file
+for the goto planner (path_planner.py). The footprints it is built from
+(world_footprints) are shared with the collision layer (collision.py).
+
+- the floor (a top-level Solid whose boundingObject is a Plane) sets the
+  grid bounds; 10 x 10 m around the origin if there is none
+- every other top-level Solid with a Box or Cylinder boundingObject
+  (directly, inside a Shape / Pose / Transform, or via USE) is an obstacle
+- obstacles are grown by the robot radius and the floor edge is blocked
+  within it, so the planner can treat the robot as a point
+
+Robots are never obstacles. Only the yaw of a node's rotation is used.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+import re
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+GRID_RESOLUTION = 0.05  # m per cell
+ROBOT_RADIUS = 0.18     # m, obstacles are inflated by this (DEF ROBOT body is 0.3 x 0.2)
+DEFAULT_FLOOR_SIZE = (10.0, 10.0)  # m, used when the world has no floor plane
+
+FREE = 0
+OCCUPIED = 1
+
+# ============================================
+# .WBT PARSER
+# ============================================
+
+TOKEN_PATTERN = re.compile(r'"(?:[^"\\]|\\.)*"|[{}\[\]]|[^\s{}\[\]"]+')
+
+
+class WbtNode:
+    """A parsed VRML node: type, optional DEF name and fields."""
+
+    def __init__(self, node_type, def_name=None):
+        self.type = node_type
+        self.def_name = def_name
+        self.fields = {}
+
+    def numbers(self, name, default=None):
+        """A field's value as a list of floats (default if missing)."""
+        value = self.fields.get(name)
+        if not isinstance(value, list) or not value:
+            return default
+        try:
+            return [float(v) for v in value]
+        except (TypeError, ValueError):
+            return default
+
+
+def tokenize(text):
+    """Split .wbt text into tokens, dropping comments (the #VRML header included)."""
+    lines = []
+    for line in text.splitlines():
+        if '#' in line and '"' not in line:
+            line = line[:line.index('#')]
+        lines.append(line)
+    return TOKEN_PATTERN.findall("\n".join(lines))
+
+
+def parse_wbt(text):
+    """Parse .wbt text into (top-level nodes, DEF name -> node)."""
+    tokens = tokenize(text)
+    defs = {}
+    position = 0
+
+    def parse_node():
+        nonlocal position
+        def_name = None
+        if tokens[position] == "USE":
+            position += 2
+            return defs.get(tokens[position - 1])
+        if tokens[position] == "DEF":
+            def_name = tokens[position + 1]
+            position += 2
+        node = WbtNode(tokens[position], def_name)
+        position += 2  # type and "{"
+        if def_name:
+            defs[def_name] = node
+        while tokens[position] != "}":
+            name = tokens[position]
+            position += 1
+            node.fields[name] = parse_value()
+        position += 1
+        return node
+
+    def starts_node():
+        token = tokens[position]
+        return token in ("DEF", "USE") or (position + 1 < len(tokens) and tokens[position + 1] == "{")
+
+    def parse_value():
+        nonlocal position
+        if tokens[position] == "[":
+            position += 1
+            items = []
+            while tokens[position] != "]":
+                if starts_node():
+                    items.append(parse_node())
+                else:
+                    items.append(tokens[position])
+                    position += 1
+            position += 1
+            return items
+        if starts_node():
+            return parse_node()
+        values = []
+        # Scalars run until the next field name (an identifier that is not a literal)
+        while tokens[position] not in ("}", "]") and (
+                not values or _is_literal(tokens[position])):
+            values.append(tokens[position])
+            position += 1
+        return values
+
+    nodes = []
+    while position < len(tokens):
+        nodes.append(parse_node())
+    return nodes, defs
+
+
+def _is_literal(token):
+    if token[0] == '"' or token in ("TRUE", "FALSE"):
+        return True
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+# ============================================
+# GEOMETRY
+# ============================================
+
+
+def find_geometry(node, depth=0):
+    """Box / Cylinder / Plane geometry of a boundingObject, with its local offset."""
+    if node is None or depth > 8:
+        return None, (0.0, 0.0)
+    if node.type in ("Box", "Cylinder", "Plane", "Capsule"):
+        return node, (0.0, 0.0)
+    if node.type == "Shape":
+        return find_geometry(node.fields.get("geometry"), depth + 1)
+    if node.type in ("Pose", "Transform", "Group"):
+        offset = node.numbers("translation", [0.0, 0.0, 0.0])
+        for child in node.fields.get("children", []):
+            if isinstance(child, WbtNode):
+                geometry, inner = find_geometry(child, depth + 1)
+                if geometry is not None:
+                    return geometry, (offset[0] + inner[0], offset[1] + inner[1])
+    return None, (0.0, 0.0)
+
+
+def node_yaw(node):
+    """Yaw of a node's axis-angle rotation (only rotations about ±Z count)."""
+    rotation = node.numbers("rotation", [0.0, 0.0, 1.0, 0.0])
+    return rotation[3] * (1.0 if rotation[2] >= 0 else -1.0) if abs(rotation[2]) > 0.9 else 0.0
+
+
+class Footprint:
+    """2-D footprint of an obstacle Solid: a rotated box or a disc."""
+
+    __slots__ = ("kind", "name", "x", "y", "size_x", "size_y", "yaw", "radius")
+
+    def __init__(self, kind, name, x, y, size_x=0.0, size_y=0.0, yaw=0.0, radius=0.0):
+        self.kind = kind  # "box" or "circle"
+        self.name = name
+        self.x = x
+        self.y = y
+        self.size_x = size_x
+        self.size_y = size_y
+        self.yaw = yaw
+        # Boxes: radius of the enclosing circle
+        self.radius = radius if kind == "circle" else math.hypot(size_x / 2, size_y / 2)
+
+
+def world_footprints(text):
+    """
+    Floor and obstacle footprints of a .wbt world.
+
+    Returns (floor, footprints): floor is (center x, center y, size x, size y)
+    of the first top-level Solid with a Plane boundingObject, or None;
+    footprints lists a Footprint per other top-level Solid with a Box or
+    Cylinder boundingObject.
+    """
+    nodes, _ = parse_wbt(text)
+    floor = None
+    footprints = []
+    for node in nodes:
+        if node is None or node.type != "Solid":
+            continue
+        geometry, offset = find_geometry(node.fields.get("boundingObject"))
+        if geometry is None:
+            continue
+        translation = node.numbers("translation", [0.0, 0.0, 0.0])
+        if geometry.type == "Plane":
+            if floor is None:
+                size = geometry.numbers("size", list(DEFAULT_FLOOR_SIZE))
+                floor = (translation[0], translation[1], size[0], size[1])
+            continue
+        yaw = node_yaw(node)
+        cx = translation[0] + offset[0] * math.cos(yaw) - offset[1] * math.sin(yaw)
+        cy = translation[1] + offset[0] * math.sin(yaw) + offset[1] * math.cos(yaw)
+        label = node.fields.get("name")
+        name = node.def_name or (label[0].strip('"') if label else f"solid{len(footprints)}")
+        if geometry.type == "Box":
+            box = geometry.numbers("size", [0.1, 0.1, 0.1])
+            footprints.append(Footprint("box", name, cx, cy, box[0], box[1], yaw))
+        else:
+            footprints.append(Footprint("circle", name, cx, cy,
+                                        radius=geometry.numbers("radius", [0.1])[0]))
+    return floor, footprints
+
+# ============================================
+# GRID
+# ============================================
+
+
+class OccupancyGrid:
+    """Row-major occupancy cells over a rectangular floor."""
+
+    def __init__(self, origin, width, height, resolution=GRID_RESOLUTION):
+        self.origin = origin  # world (x, y) of cell (0, 0)'s corner
+        self.width = width
+        self.height = height
+        self.resolution = resolution
+        self.cells = bytearray(width * height)
+        self.obstacles = 0
+        self.version = 0  # bumped on every change (plan cache key)
+
+    @classmethod
+    def from_world_file(cls, path, resolution=GRID_RESOLUTION, robot_radius=ROBOT_RADIUS):
+        with open(path, encoding="utf-8") as f:
+            return cls.from_world_text(f.read(), resolution, robot_radius)
+
+    @classmethod
+    def from_world_text(cls, text, resolution=GRID_RESOLUTION, robot_radius=ROBOT_RADIUS):
+        """Rasterize a .wbt world: floor plane for bounds, top-level Solids as obstacles."""
+        floor, footprints = world_footprints(text)
+        center_x, center_y, size_x, size_y = floor or (0.0, 0.0) + DEFAULT_FLOOR_SIZE
+        width = max(1, int(math.ceil(size_x / resolution)))
+        height = max(1, int(math.ceil(size_y / resolution)))
+        grid = cls((center_x - size_x / 2, center_y - size_y / 2), width, height, resolution)
+        grid.block_border(robot_radius)
+        for footprint in footprints:
+            if footprint.kind == "box":
+                grid.add_box(footprint.x, footprint.y, footprint.size_x, footprint.size_y,
+                             footprint.yaw, robot_radius)
+            else:
+                grid.add_circle(footprint.x, footprint.y, footprint.radius, robot_radius)
+        return grid
+
+    # --- Coordinates ---------------------------------------------------------------
+
+    def world_to_cell(self, x, y):
+        return (int((x - self.origin[0]) // self.resolution),
+                int((y - self.origin[1]) // self.resolution))
+
+    def cell_to_world(self, cell):
+        """World (x, y) of a cell's centre."""
+        return (self.origin[0] + (cell[0] + 0.5) * self.resolution,
+                self.origin[1] + (cell[1] + 0.5) * self.resolution)
+
+    def in_bounds(self, cell):
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def is_free(self, cell):
+        return self.in_bounds(cell) and self.cells[cell[1] * self.width + cell[0]] == FREE
+
+    # --- Rasterization -------------------------------------------------------------
+
+    def _fill(self, x_min, y_min, x_max, y_max, inside):
+        """Mark cells in a world-space bounding box whose centre satisfies inside(x, y)."""
+        c0 = self.world_to_cell(x_min, y_min)
+        c1 = self.world_to_cell(x_max, y_max)
+        for cy in range(max(0, c0[1]), min(self.height - 1, c1[1]) + 1):
+            for cx in range(max(0, c0[0]), min(self.width - 1, c1[0]) + 1):
+                x, y = self.cell_to_world((cx, cy))
+                if inside(x, y):
+                    self.cells[cy * self.width + cx] = OCCUPIED
+        self.version += 1
+
+    def add_box(self, cx, cy, size_x, size_y, yaw=0.0, inflation=0.0):
+        """Block a (rotated) box grown by `inflation` on every side."""
+        half_x, half_y = size_x / 2 + inflation, size_y / 2 + inflation
+        cos_yaw, sin_yaw = math.cos(yaw), math.sin(yaw)
+        reach = math.hypot(half_x, half_y)
+
+        def inside(x, y):
+            dx, dy = x - cx, y - cy
+            return (abs(dx * cos_yaw + dy * sin_yaw) <= half_x and
+                    abs(-dx * sin_yaw + dy * cos_yaw) <= half_y)
+
+        self._fill(cx - reach, cy - reach, cx + reach, cy + reach, inside)
+        self.obstacles += 1
+
+    def add_circle(self, cx, cy, radius, inflation=0.0):
+        """Block a disc (cylinder footprint) grown by `inflation`."""
+        reach = radius + inflation
+        self._fill(cx - reach, cy - reach, cx + reach, cy + reach,
+                   lambda x, y: (x - cx) ** 2 + (y - cy) ** 2 <= reach * reach)
+        self.obstacles += 1
+
+    def block_border(self, margin):
+        """Block cells within `margin` of the floor edge (the robot must stay on it)."""
+        # Cells whose centre ((i + 0.5) * resolution from the edge) is closer than the margin
+        k = max(0, math.ceil(margin / self.resolution - 0.5))
+        blocked = bytes([OCCUPIED]) * self.width
+        for cy in range(self.height):
+            row = cy * self.width
+            if cy < k or cy >= self.height - k:
+                self.cells[row:row + self.width] = blocked
+            else:
+                self.cells[row:row + k] = blocked[:k]
+                self.cells[row + self.width - k:row + self.width] = blocked[:k]
+        self.version += 1
+
+    def free_cells(self):
+        return self.cells.count(FREE)
@@ -0,0 +1,180 @@
+"""
+S4 Remote Robot Management System - Path Planner
+=================================================
+
+A* over an OccupancyGrid (occupancy_grid.py) for the goto command.
+
+- 8-connected moves with the octile distance as heuristic; diagonal moves
+  may not cut the corner of a blocked cell
+- the cell path is reduced to its corners, then shortened by skipping every
+  corner that has a clear line of sight past it, and returned as world
+  waypoints starting at the robot's position and ending at the exact goal
+- plans are kept in an LRU cache keyed by (start cell, goal cell, grid
+  version), so repeated goals (patrols, several robots sent to the same
+  dock) skip the search
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import collections
+import heapq
+import math
+import time
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+PLAN_CACHE_SIZE = 64  # plans kept in the LRU cache
+SQRT2 = math.sqrt(2.0)
+NEIGHBOURS = [(1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+              (1, 1, SQRT2), (1, -1, SQRT2), (-1, 1, SQRT2), (-1, -1, SQRT2)]
+
+# ============================================
+# SEARCH
+# ============================================
+
+
+def octile(a, b):
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (SQRT2 - 1.0) * min(dx, dy)
+
+
+def astar(grid, start, goal):
+    """Cell path from start to goal (both inclusive), or None if unreachable.
+
+    The start cell may be blocked (the robot can already stand in an
+    inflated margin); every other cell on the path is free.
+    """
+    if not grid.in_bounds(start) or not grid.is_free(goal):
+        return None
+    width, cells = grid.width, grid.cells
+    g_score = {start: 0.0}
+    came_from = {}
+    closed = set()
+    counter = 0  # tie-breaker so the heap never compares cells
+    heap = [(octile(start, goal), counter, start)]
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if current == goal:
+            path = [current]
+            while current in came_from:
+                current = came_from[current]
+                path.append(current)
+            path.reverse()
+            return path
+        if current in closed:
+            continue
+        closed.add(current)
+        cx, cy = current
+        for dx, dy, cost in NEIGHBOURS:
+            nx, ny = cx + dx, cy + dy
+            if not (0 <= nx < grid.width and 0 <= ny < grid.height) or cells[ny * width + nx]:
+                continue
+            if dx and dy and (cells[cy * width + nx] or cells[ny * width + cx]):
+                continue  # no corner cutting
+            neighbour = (nx, ny)
+            tentative = g_score[current] + cost
+            if tentative < g_score.get(neighbour, math.inf):
+                g_score[neighbour] = tentative
+                came_from[neighbour] = current
+                counter += 1
+                heapq.heappush(heap, (tentative + octile(neighbour, goal), counter, neighbour))
+    return None
+
+
+def corners(path):
+    """Drop cells that continue in the same direction as the previous move."""
+    if len(path) < 3:
+        return list(path)
+    result = [path[0]]
+    for before, cell, after in zip(path, path[1:], path[2:]):
+        if (cell[0] - before[0], cell[1] - before[1]) != (after[0] - cell[0], after[1] - cell[1]):
+            result.append(cell)
+    result.append(path[-1])
+    return result
+
+
+def line_of_sight(grid, a, b):
+    """True if the straight segment between two cell centres only crosses free cells."""
+    steps = max(abs(b[0] - a[0]), abs(b[1] - a[1])) * 2
+    for i in range(1, steps):
+        t = i / steps
+        x = a[0] + 0.5 + (b[0] - a[0]) * t
+        y = a[1] + 0.5 + (b[1] - a[1]) * t
+        if not grid.is_free((int(x), int(y))):
+            return False
+    return True
+
+
+def shortcut(grid, path):
+    """Greedy string pulling: from each kept cell jump to the farthest visible one."""
+    if len(path) < 3:
+        return list(path)
+    result = [path[0]]
+    i = 0
+    while i < len(path) - 1:
+        j = len(path) - 1
+        while j > i + 1 and not line_of_sight(grid, path[i], path[j]):
+            j -= 1
+        result.append(path[j])
+        i = j
+    return result
+
+# ============================================
+# PLANNER
+# ============================================
+
+
+class PathPlanner:
+    """A* planner with an LRU cache of recent plans."""
+
+    def __init__(self, grid, cache_size=PLAN_CACHE_SIZE):
+        self.grid = grid
+        self.cache_size = cache_size
+        self._cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.last_plan_ms = 0.0
+
+    def plan(self, start, goal):
+        """
+        World waypoints [(x, y), ...] from start (x, y) to goal (x, y).
+
+        Returns (waypoints, cached); waypoints is None if the goal is blocked,
+        off the floor or unreachable.
+        """
+        start_cell = self.grid.world_to_cell(start[0], start[1])
+        goal_cell = self.grid.world_to_cell(goal[0], goal[1])
+        key = (start_cell, goal_cell, self.grid.version)
+        cells = self._cache.get(key)
+        cached = key in self._cache
+        if cached:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            self.last_plan_ms = 0.0
+        else:
+            began = time.perf_counter()
+            path = astar(self.grid, start_cell, goal_cell)
+            cells = shortcut(self.grid, corners(path)) if path is not None else None
+            self.last_plan_ms = (time.perf_counter() - began) * 1000
+            self.misses += 1
+            self._cache[key] = cells
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        if cells is None:
+            return None, cached
+        # Inner corners at cell centres; exact endpoints
+        waypoints = [self.grid.cell_to_world(cell) for cell in cells[1:-1]]
+        return [tuple(start[:2])] + waypoints + [tuple(goal[:2])], cached
+
+    def stats(self):
+        return {
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+            "lastPlanMs": round(self.last_plan_ms, 3),
+            "grid": [self.grid.width, self.grid.height],
+            "resolution": self.grid.resolution,
+        }
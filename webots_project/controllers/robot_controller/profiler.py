@@ -0,0 +1,148 @@
+"""
+S4 Remote Robot Management System - Step Profiler
+==================================================
+
+Low-overhead per-step phase timers for the controller main loop.
+
+The loop marks phase boundaries with lap("name"); each lap adds the time
+since the previous mark to that phase for the current step (summed over
+all robots in fleet mode). end_step() pushes the per-step totals into
+rolling windows, from which p50 / p99 / max are computed when a report is
+requested. "physics" is the time spent inside supervisor.step() between
+two loop iterations, "total" the whole iteration.
+
+With enabled=False every call returns immediately. An optional cProfile
+run covers the whole loop and is printed / dumped when the loop ends.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import collections
+import cProfile
+import io
+import pstats
+import time
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+PROFILE_WINDOW = 1000      # steps kept per phase for the rolling percentiles
+CPROFILE_TOP = 25          # functions listed in the cProfile summary
+
+# ============================================
+# PROFILER
+# ============================================
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(len(sorted_values) * p / 100.0)) - 1))
+    return sorted_values[index]
+
+
+class StepProfiler:
+    """Phase timers with rolling per-phase percentiles."""
+
+    def __init__(self, enabled=True, window=PROFILE_WINDOW, budget_ms=None, cprofile_path=None):
+        self.enabled = enabled
+        self.window = window
+        self.budget_ms = budget_ms  # real-time budget per step (the basic timestep)
+        self.cprofile_path = cprofile_path  # None = off, "" = print only, else dump file
+        self.windows = collections.OrderedDict()  # phase -> deque of seconds
+        self.steps = 0
+        self.over_budget = 0
+        self._acc = {}
+        self._mark = None
+        self._step_start = None
+        self._step_end = None
+        self._cprofile = None
+
+    def begin_step(self):
+        """Call right after supervisor.step() returns."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._step_end is not None:
+            self._acc["physics"] = now - self._step_end
+        self._step_start = self._mark = now
+
+    def lap(self, phase):
+        """Charge the time since the previous mark to `phase`."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._acc[phase] = self._acc.get(phase, 0.0) + (now - self._mark)
+        self._mark = now
+
+    def end_step(self):
+        """Close the step and push its phase totals into the rolling windows."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._acc["total"] = now - self._step_start
+        for phase, seconds in self._acc.items():
+            samples = self.windows.get(phase)
+            if samples is None:
+                samples = self.windows[phase] = collections.deque(maxlen=self.window)
+            samples.append(seconds)
+        if self.budget_ms is not None:
+            wall = self._acc["total"] + self._acc.get("physics", 0.0)
+            if wall * 1000.0 > self.budget_ms:
+                self.over_budget += 1
+        self.steps += 1
+        self._acc = {}
+        self._step_end = now
+
+    def summary(self):
+        """Per-phase {p50, p99, max, mean} in milliseconds over the rolling window."""
+        phases = {}
+        for phase, samples in self.windows.items():
+            ordered = sorted(samples)
+            phases[phase] = {
+                "p50": round(percentile(ordered, 50) * 1000.0, 4),
+                "p99": round(percentile(ordered, 99) * 1000.0, 4),
+                "max": round(ordered[-1] * 1000.0, 4),
+                "mean": round(sum(ordered) / len(ordered) * 1000.0, 4),
+            }
+        return {
+            "steps": self.steps,
+            "window": self.window,
+            "budgetMs": self.budget_ms,
+            "overBudget": self.over_budget,
+            "phases": phases,
+        }
+
+    def format_report(self):
+        """Human-readable table of summary() for stdout."""
+        summary = self.summary()
+        lines = [f"⏱️  Step profile ({summary['steps']} steps, last {self.window}"
+                 + (f", {summary['overBudget']} over {self.budget_ms} ms budget" if self.budget_ms else "")
+                 + ")"]
+        for phase, t in summary["phases"].items():
+            lines.append(f"   {phase:<10} p50 {t['p50']:8.3f} ms | p99 {t['p99']:8.3f} ms | "
+                         f"max {t['max']:8.3f} ms")
+        return "\n".join(lines)
+
+    # --- cProfile -------------------------------------------------------------------
+
+    def start_cprofile(self):
+        if self.cprofile_path is None or self._cprofile is not None:
+            return
+        self._cprofile = cProfile.Profile()
+        self._cprofile.enable()
+
+    def stop_cprofile(self):
+        """Stop cProfile; returns the top functions by cumulative time (or None)."""
+        if self._cprofile is None:
+            return None
+        self._cprofile.disable()
+        if self.cprofile_path:
+            self._cprofile.dump_stats(self.cprofile_path)
+        out = io.StringIO()
+        pstats.Stats(self._cprofile, stream=out).sort_stats("cumulative").print_stats(CPROFILE_TOP)
+        self._cprofile = None
+        return out.getvalue()
@@ -0,0 +1,93 @@
+"""
+S4 Remote Robot Management System - Robot Node Adapter
+=======================================================
+
+Thin wrapper around a robot's Supervisor node that keeps the Webots API
+traffic per step to the minimum:
+
+- the translation / rotation Field handles are resolved once, at creation
+- read_pose() reads the position and orientation once per step into a
+  PoseSnapshot that movement, battery and telemetry all share
+- set_translation() / set_yaw() write through the cached handles and
+  remember what they wrote, so motion() gives this step's displacement
+  without reading the node again
+
+Works with real Webots nodes and with world_backend.HeadlessNode.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+# ============================================
+# POSE SNAPSHOT
+# ============================================
+
+
+class PoseSnapshot:
+    """Pose of a robot as read at the start of a step."""
+
+    __slots__ = ("position", "theta", "step")
+
+    def __init__(self, position, theta, step=None):
+        self.position = position  # [x, y, z]
+        self.theta = theta        # yaw in [-π, π], None if orientation was not read
+        self.step = step
+
+
+def yaw_from_orientation(matrix):
+    """Yaw (theta) from a flat row-major 3x3 rotation matrix: atan2(R21, R11)."""
+    return math.atan2(matrix[3], matrix[0])
+
+
+# ============================================
+# ADAPTER
+# ============================================
+
+
+class RobotNodeAdapter:
+    """Cached field handles and one pose read per step for a robot node."""
+
+    def __init__(self, node, gps=None, read_orientation=True):
+        self.node = node
+        self.gps = gps  # position source if present, otherwise the node itself
+        self.read_orientation = read_orientation
+        self.translation_field = node.getField('translation')
+        self.rotation_field = node.getField('rotation')
+        self.pose = None
+        self.written_position = None  # last set_translation() since read_pose()
+        self.written_theta = None     # last set_yaw() since read_pose()
+
+    def read_pose(self, step=None):
+        """Read position (+ yaw) once and store it as the step's shared snapshot."""
+        if self.gps is not None:
+            position = self.gps.getValues()
+        else:
+            position = self.node.getPosition()
+        theta = yaw_from_orientation(self.node.getOrientation()) if self.read_orientation else None
+        self.pose = PoseSnapshot(position, theta, step)
+        self.written_position = None
+        self.written_theta = None
+        return self.pose
+
+    def set_translation(self, position):
+        self.translation_field.setSFVec3f(position)
+        self.written_position = position
+
+    def set_yaw(self, theta):
+        """Set the rotation to a pure yaw about +Z."""
+        self.rotation_field.setSFRotation([0, 0, 1, theta])
+        self.written_theta = theta
+
+    def motion(self):
+        """(distance m, |rotation| rad) written since the last read_pose()."""
+        distance = rotation = 0.0
+        if self.written_position is not None:
+            start = self.pose.position
+            distance = math.hypot(self.written_position[0] - start[0],
+                                  self.written_position[1] - start[1])
+        if self.written_theta is not None and self.pose.theta is not None:
+            turn = self.written_theta - self.pose.theta
+            rotation = abs(math.atan2(math.sin(turn), math.cos(turn)))
+        return distance, rotation
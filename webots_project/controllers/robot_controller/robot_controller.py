@@ -19,110 +19,524 @@ Features:
 - WebSocket connection to backend
 - Periodic telemetry transmission
 - Command reception and movement control
-- Simulated battery drain
+- Simulated battery drain through a pluggable model (battery_model.py,
+  S4_BATTERY_MODEL): linear drain or a physics model with lookup-table
+  curves; telemetry reports the estimated time to empty
+- Fleet mode: one Supervisor process driving N robot nodes (by DEF name),
+  with per-robot state in RobotState objects and commands routed by robot id
+- Field handles cached per robot (robot_adapter.py); the pose is read once
+  per step and shared by movement, battery and telemetry
+- Latency tracing: commands and telemetry carry wall + sim timestamps per hop,
+  aggregated into per-hop histograms (latency.py) answered by stats_request
+- Structured logging (structured_log.py): levels, per-key rate limits and an
+  async console / JSON-lines writer instead of print() in the loop
+- Step recording (S4_RECORD_FILE): per-step command, pose and battery of every
+  robot in an mmap-able fixed-record file (step_recorder.py) for replay
+- Pose history (S4_HISTORY_DIR): per-robot mmap ring buffer of recent poses
+  that other local processes can read windows of (trajectory_ring.py)
+- Path simplification (S4_PATH_SIMPLIFY=1): RDP-simplified "path_segment"
+  messages plus level-of-detail history on "path_request"
+- Step profiling (S4_PROFILE=1): per-phase timers with rolling p50/p99,
+  reported to stdout and as "profile" messages; optional cProfile run
+- goto command: A* over an occupancy grid rasterized once from the .wbt world
+  (occupancy_grid.py, path_planner.py), followed with the turn/forward
+  primitives; one message per goal, progress reported as "goto_status"
+- Lockstep mode (S4_LOCKSTEP=1): steps only when the backend grants ticks,
+  applies "atStep"-tagged commands on that exact step (lockstep.py)
+- twist command: continuous linear / angular velocity, integrated every step
+  until its duration or deadline expires
+- Collision layer (S4_COLLISION=clip|reject): spatially hashed obstacle
+  footprints and robot discs (collision.py); colliding moves are clipped or
+  cancelled and contacts are reported in telemetry
+- Geofence zones ("zones" message, geofence.py): circles / polygons in a
+  spatial hash, checked against each step's motion; only zone_enter /
+  zone_exit events are sent, placed where the boundary was crossed
 
 Author: Fitfest25 Hackathon Team
 Date: 2025
 """
 
 import json
+import logging
+import os
 import time
 import math
-from controller import Supervisor
-import websocket
-import threading
+from world_backend import create_supervisor
+from transport import AsyncTransport
+from telemetry_codec import ENCODING_JSON, DeltaEncoder, encode_telemetry, merge_telemetry_frames
+from telemetry_scheduler import IDLE_HZ, MAX_HZ, MIN_HZ, MOVING_HZ, TelemetryScheduler
+from runtime_config import ConfigError, RuntimeConfig
+from command_queue import CommandQueue
+from battery_model import create_battery_model
+from robot_adapter import RobotNodeAdapter
+from step_recorder import StepRecorder
+from trajectory_ring import RING_CAPACITY, TrajectoryRing
+from trajectory_simplify import PATH_TOLERANCE, PathSimplifier
+from occupancy_grid import OccupancyGrid
+from path_planner import PathPlanner
+from collision import CollisionWorld
+from geofence import GeofenceIndex, ZoneError, parse_zones
+from latency import LatencyTracker
+from profiler import StepProfiler
+from lockstep import LOCKSTEP_POLL_TIMEOUT, LockstepGate
+from structured_log import configure_logging, get_logger, rate_key
 
 # ============================================
 # CONFIGURATION
 # ============================================
 
 BACKEND_URL = "ws://localhost:3000"
-TELEMETRY_INTERVAL = 0.2  # seconds (200ms)
-BATTERY_DRAIN_RATE = 0.008  # % per second when moving
+TELEMETRY_INTERVAL = 0.2  # seconds (200ms), used when adaptive telemetry is off
+# Adaptive telemetry: fast while moving, slow heartbeat while stopped
+# (rates in telemetry_scheduler.py, min/max adjustable at runtime)
+TELEMETRY_ADAPTIVE = os.environ.get("S4_TELEMETRY_ADAPTIVE", "1") == "1"
+BATTERY_DRAIN_RATE = 0.008  # % per second when moving (linear model)
+# Battery model: "linear" (constant drain while moving) or "physics" (battery_model.py)
+BATTERY_MODEL = os.environ.get("S4_BATTERY_MODEL", "linear")
+BATTERY_TEMPERATURE = float(os.environ.get("S4_BATTERY_TEMPERATURE", "25"))  # °C (physics model)
+BATTERY_LOAD_SMOOTHING = 30.0  # seconds (sim time) the load is averaged over for time-to-empty
+# Preferred telemetry wire encoding ("json" or "binary-v2"), negotiated at connect time
+TELEMETRY_ENCODING = os.environ.get("S4_TELEMETRY_ENCODING", ENCODING_JSON)
+# Delta telemetry: keyframe every N frames, only changed fields in between
+TELEMETRY_DELTA = os.environ.get("S4_TELEMETRY_DELTA", "0") == "1"
+LINK_STATS_INTERVAL = 10.0  # seconds (sim time) between send-queue reports
+# Path simplification: send RDP-simplified path segments, keep LOD history
+PATH_SIMPLIFY = os.environ.get("S4_PATH_SIMPLIFY", "0") == "1"
+# Step profiling: phase timers + periodic report (stdout and "profile" message)
+PROFILE = os.environ.get("S4_PROFILE", "0") == "1"
+PROFILE_REPORT_INTERVAL = 10.0  # seconds (sim time) between profile reports
+# cProfile over the whole loop: "1" = print at exit, anything else = dump file path
+PROFILE_CPROFILE = os.environ.get("S4_PROFILE_CPROFILE")
+
+# Step recording: append every robot's command/pose/battery per step to this file
+RECORD_FILE = os.environ.get("S4_RECORD_FILE", "")
+# Pose history: one mmap ring file per robot (<dir>/<robot id>.ring), e.g. /dev/shm/s4
+HISTORY_DIR = os.environ.get("S4_HISTORY_DIR", "")
+HISTORY_CAPACITY = int(os.environ.get("S4_HISTORY_CAPACITY", RING_CAPACITY))  # records per robot
+
+# goto: world file for the occupancy grid ("" = the supervisor's own world)
+WORLD_FILE = os.environ.get("S4_WORLD_FILE", "")
+GOTO_FIELDS = ("x", "y", "tolerance")  # cmd fields kept as goto params
+GOTO_TOLERANCE = 0.01          # m, default arrival radius
+GOTO_WAYPOINT_TOLERANCE = 0.02  # m, radius at which an intermediate waypoint counts as reached
+GOTO_HEADING_TOLERANCE = 0.05  # rad, turn in place until the heading error is below this
+
+# twist: continuous (v, w) velocity command, integrated every step until it expires
+TWIST_FIELDS = ("v", "w", "duration", "deadline")  # cmd fields kept as twist params
+TWIST_MAX_LINEAR = 2.0           # m/s, |v| is clamped to this
+TWIST_MAX_ANGULAR = 2 * math.pi  # rad/s, |w| is clamped to this
+COMMAND_FIELDS = {"goto": GOTO_FIELDS, "twist": TWIST_FIELDS}
+# Envelope and tracing fields of a config message that are not settings
+CONFIG_MESSAGE_FIELDS = ("type", "robotId", "requestId", "updateType", "timestamp",
+                         "sentAt", "routerAt", "seq")
+
+# Motion sub-stepping: goto turns and moves are integrated in sub-steps of at most
+# this much sim time (ms), so coarse basicTimeSteps follow the same path. 0 = off
+MOTION_SUBSTEP_MS = float(os.environ.get("S4_MOTION_SUBSTEP_MS", "64"))
+
+# Collisions: "off", "clip" (stop a move at the first contact) or "reject" (cancel it)
+COLLISION_MODE = os.environ.get("S4_COLLISION", "off")
+
+# Lockstep: advance only on granted "tick"s; every frame is JSON and carries its step
+LOCKSTEP = os.environ.get("S4_LOCKSTEP", "0") == "1"
+
+# Fleet mode: comma-separated DEF names of the robot nodes this supervisor drives.
+# Empty = classic single-robot mode (the supervisor's own node).
+FLEET_DEFS = [d.strip() for d in os.environ.get("S4_FLEET_DEFS", "").split(",") if d.strip()]
 
 # ============================================
 # GLOBAL VARIABLES
 # ============================================
 
-battery_level = 100.0
-cycle_counter = 0
-current_command = "stop"
-last_executed_command = "stop"
-ws_connection = None
-connected = False
+log = get_logger("robot_controller")
+
+transport = None  # AsyncTransport, created in main()
+telemetry_encoding = ENCODING_JSON  # encoding accepted by the backend (hello_ack)
+encoding_session = 0  # transport.connect_count the encoding was negotiated on
+telemetry_dropped = 0  # send-queue telemetry drops already answered with keyframes
+robots = {}  # robot_id -> RobotState
+
+# Movement velocities - robot-relative, integrated over the sim time elapsed each step
+LINEAR_VELOCITY = 0.3125   # m/s for forward/backward/goto (0.02 m per 64 ms step)
+ANGULAR_VELOCITY = 3.125   # rad/s while turning towards a goto waypoint (0.2 rad per 64 ms step)
+TURN_ANGLE = math.pi / 2   # 90 degrees turn for left/right
+
+# Runtime-tunable settings (defaults above, changed by config/update messages)
+config = RuntimeConfig(
+    linear_velocity=LINEAR_VELOCITY,
+    angular_velocity=ANGULAR_VELOCITY,
+    telemetry_interval=TELEMETRY_INTERVAL,
+    battery_drain_rate=BATTERY_DRAIN_RATE,
+    battery_temperature=BATTERY_TEMPERATURE,
+    telemetry_min_hz=MIN_HZ,
+    telemetry_max_hz=MAX_HZ,
+    telemetry_moving_hz=MOVING_HZ,
+    telemetry_idle_hz=IDLE_HZ,
+    path_tolerance=PATH_TOLERANCE
+)
+sim_step = 0  # index of the current simulation step
+sim_time = 0.0  # supervisor.getTime() of the current step (seconds)
+basic_timestep = 64  # ms, the world's basicTimeStep (set in main)
+latency = LatencyTracker()  # per-hop latency histograms (stats_request)
+profiler = StepProfiler(enabled=PROFILE)  # per-phase step timers (budget set in main)
+recorder = None  # StepRecorder when RECORD_FILE is set (created in main)
+lockstep = LockstepGate() if LOCKSTEP else None  # granted steps in lockstep mode
+planner = None  # PathPlanner over the world's occupancy grid (created in main)
+collisions = None  # CollisionWorld when COLLISION_MODE is not "off" (created in main)
+geofence = GeofenceIndex()  # zones pushed by "zones" messages, shared by all robots
+battery_model = create_battery_model(BATTERY_MODEL)  # shared by all robots
+battery_model.configure(config)
+
+# ============================================
+# ROBOT STATE
+# ============================================
+
+class RobotState:
+    """Per-robot state (one instance per controlled robot node)."""
+
+    def __init__(self, robot_id, node, gps=None):
+        self.robot_id = robot_id
+        self.node = node
+        self.gps = gps  # only the supervisor's own robot has a GPS device
+        self.adapter = RobotNodeAdapter(node, gps)  # cached fields + per-step pose
+        self.battery_level = 100.0
+        self.battery_speed = 0.0  # m/s at the last step (battery model acceleration term)
+        self.battery_load = None  # averaged battery model load (time-to-empty)
+        self.cycle_counter = 0
+        self.current_command = "stop"
+        self.last_executed_command = "stop"
+        self.commands = CommandQueue()
+        self.command_seq = None  # (seq, index) of the executing command
+        self.turned_seq = None   # command the last 90° turn was made for
+        self.scheduler = TelemetryScheduler(adaptive=TELEMETRY_ADAPTIVE)
+        configure_scheduler(self.scheduler)
+        self.delta_encoder = DeltaEncoder() if TELEMETRY_DELTA else None
+        self.history = None  # TrajectoryRing when HISTORY_DIR is set
+        self.path = PathSimplifier(config.path_tolerance) if PATH_SIMPLIFY else None
+        self.path_moving = False  # motion state at the last path update
+        self.goto = None  # active goto: {"seq", "goal", "tolerance", "waypoints", "index"}
+        self.twist = None  # active twist: {"seq", "v", "w", "expires", "expired"}
+
+    def get_position(self):
+        """Position from the current step's pose snapshot (GPS if available, else the node)."""
+        pose = self.adapter.pose or self.adapter.read_pose()
+        return pose.position
+
+
+def configure_scheduler(scheduler):
+    """Apply the current telemetry settings from the config store to a scheduler."""
+    scheduler.set_limits(config.telemetry_min_hz, config.telemetry_max_hz)
+    if scheduler.adaptive:
+        scheduler.set_rates(config.telemetry_moving_hz, config.telemetry_idle_hz)
+    else:
+        scheduler.set_interval(config.telemetry_interval)
+
+
+def route_targets(data):
+    """Return the robots a message is addressed to (all robots if no robotId)."""
+    robot_id = data.get('robotId')
+    if robot_id is None:
+        return list(robots.values())
+    robot = robots.get(robot_id)
+    return [robot] if robot else []
 
-# Movement speeds (meters/radians per step) - robot-relative
-MOVEMENT_SPEED = 0.02     # Universal linear speed for forward/backward
-TURN_ANGLE = math.pi / 2  # 90 degrees turn for left/right
 
 # ============================================
 # WEBSOCKET HANDLERS
 # ============================================
 
-def on_message(ws, message):
-    """Handle incoming WebSocket messages (commands from backend)."""
-    global current_command
+def on_message(message):
+    """Handle an incoming WebSocket message (drained from the transport between steps)."""
+    global telemetry_encoding, encoding_session
     try:
         data = json.loads(message)
-        if data.get('type') == 'cmd':
+        if data.get('type') == 'hello_ack':
+            telemetry_encoding = data.get('encoding', ENCODING_JSON)
+            encoding_session = transport.connect_count
+            log.info("🤝 Telemetry encoding: %s", telemetry_encoding)
+        elif data.get('type') == 'keyframe_request':
+            for robot in route_targets(data):
+                if robot.delta_encoder is not None:
+                    robot.delta_encoder.force_keyframe()
+        elif data.get('type') in ('config', 'update', 'telemetry_rate'):
+            stage_config(data)
+        elif data.get('type') == 'stats_request':
+            send_stats(data)
+        elif data.get('type') == 'path_request':
+            for robot in route_targets(data):
+                send_path_history(robot, data)
+        elif data.get('type') == 'zones':
+            define_zones(data)
+        elif data.get('type') == 'tick':
+            if lockstep is not None:
+                lockstep.grant(sim_step, data.get('ticks'), data.get('until'))
+        elif data.get('type') == 'cmd':
             cmd = data.get('cmd', 'stop')
-            current_command = cmd
-            print(f"📥 Received command: {cmd}")
-            
-            # Send acknowledgment
-            ack = {
-                "type": "ack",
-                "command": cmd,
-                "status": "received"
-            }
-            ws.send(json.dumps(ack))
+            trace = trace_command(data)
+            fields = COMMAND_FIELDS.get(cmd)
+            params = {k: data[k] for k in fields if k in data} if fields else None
+            for robot in route_targets(data):
+                seq = robot.commands.push(cmd, data.get('seq'), data.get('steps'), sim_step, trace,
+                                          data.get('atStep'), params)
+                log.info("📥 Received command #%s for %s: %s", seq, robot.robot_id, cmd,
+                         extra=rate_key(f"cmd.{robot.robot_id}", robot_id=robot.robot_id, step=sim_step))
+        elif data.get('type') == 'cmd_batch':
+            commands = data.get('commands', [])
+            trace = trace_command(data)
+            for robot in route_targets(data):
+                seq = robot.commands.push_batch(commands, data.get('seq'), sim_step, trace,
+                                                data.get('atStep'))
+                log.info("📥 Received batch #%s for %s: %s", seq, robot.robot_id,
+                         ", ".join(c.get('cmd', 'stop') for c in commands),
+                         extra=rate_key(f"cmd.{robot.robot_id}", robot_id=robot.robot_id, step=sim_step))
     except Exception as e:
-        print(f"❌ Error processing message: {e}")
+        log.error("❌ Error processing message: %s", e, extra=rate_key("message_error"))
+
+
+def trace_command(data):
+    """
+    Stamp robot receive time on an incoming command and record the upstream hops.
 
+    Returns the trace dict carried by the queued command into its cmd_ack.
+    """
+    trace = {
+        "sentAt": data.get('sentAt'),
+        "routerAt": data.get('routerAt'),
+        "robotAt": int(time.time() * 1000),
+        "robotStep": sim_step,
+        "robotSimTime": round(sim_time, 3)
+    }
+    latency.record_ms("cmd.frontend_to_router", trace["sentAt"], trace["routerAt"])
+    latency.record_ms("cmd.router_to_robot", trace["routerAt"], trace["robotAt"])
+    return trace
 
-def on_error(ws, error):
-    """Handle WebSocket errors."""
-    print(f"❌ WebSocket error: {error}")
 
+def record_actuation(command, ack):
+    """Record the robot-side and end-to-end hops of a command that just started."""
+    trace = ack["trace"]
+    origin = trace.get("sentAt") or trace.get("routerAt") or trace.get("robotAt")
+    # Robot-local hop from the unrounded clock readings (sub-ms resolution)
+    latency.record("cmd.robot_to_actuation", (command.executed_at - command.received_at) * 1e6)
+    latency.record_ms("cmd.end_to_end", origin, trace["executedAt"])
+    latency.record("cmd.queue_steps", ack["latencySteps"], unit="steps")
 
-def on_close(ws, close_status_code, close_msg):
-    """Handle WebSocket connection close."""
-    global connected
-    connected = False
-    print(f"🔌 WebSocket connection closed (code: {close_status_code})")
 
+def send_stats(data):
+    """Answer a stats_request with the latency histograms and link counters."""
+    send_message({
+        "type": "stats",
+        "requestId": data.get('requestId'),
+        "step": sim_step,
+        "simTime": round(sim_time, 3),
+        "latency": latency.summary(),
+        "link": transport.stats(),
+        "profile": profiler.summary() if profiler.enabled else None,
+        "planner": planner.stats() if planner is not None else None,
+        "collisions": collisions.stats() if collisions is not None else None,
+        "zones": geofence.stats(),
+        "timestamp": int(time.time() * 1000)
+    })
+    if data.get('reset'):
+        latency.reset()
 
-def on_open(ws):
-    """Handle WebSocket connection open."""
-    global connected
-    connected = True
-    print(f"✅ Connected to backend at {BACKEND_URL}")
 
+def send_path_history(robot, data):
+    """
+    Answer a path_request with the robot's simplified history at one level of detail.
 
-def connect_websocket():
-    """Establish WebSocket connection to backend."""
-    global ws_connection
+    The level comes from "level" (index) or "tolerance" (m); "seconds" limits
+    the time window, "maxPoints" caps the size (coarser levels first), and
+    "bucketSeconds" thins it to one point per time bucket.
+    """
+    if robot.path is None:
+        return
+    level = robot.path.level_for(data.get('tolerance'), data.get('level'))
+    since = sim_time - data['seconds'] if data.get('seconds') else None
+    level, points = robot.path.history(level, since, data.get('maxPoints'), data.get('bucketSeconds'))
+    send_message({
+        "type": "path_history",
+        "requestId": data.get('requestId'),
+        "robotId": robot.robot_id,
+        "level": level,
+        "tolerance": robot.path.lod_tolerances[level],
+        "points": [[round(t, 3), round(x, 3), round(y, 3)] for t, x, y in points],
+        "step": sim_step
+    })
+
+
+def update_path(robot, current_time, position, is_moving):
+    """Feed the pose into the robot's path simplifier; send completed segments."""
+    was_moving = robot.path_moving
+    robot.path_moving = is_moving
+    if not is_moving and not was_moving:
+        return
+    points = robot.path.add(current_time, position[0], position[1])
+    if points is None and not is_moving:
+        points = robot.path.flush()  # just stopped: send the tail right away
+    if points:
+        send_message({
+            "type": "path_segment",
+            "robotId": robot.robot_id,
+            "segment": robot.path.segments,
+            "tolerance": robot.path.tolerance,
+            "points": [[round(t, 3), round(x, 3), round(y, 3)] for t, x, y in points],
+            "step": sim_step
+        })
+
+
+def stage_config(data):
+    """
+    Validate a config / update / telemetry_rate message and stage it.
+
+    Settings come from a "settings" object, or from the message's own fields.
+    Accepted updates are committed at the next step boundary by apply_config();
+    rejected ones are answered with a config_ack right away.
+
+    Settings are shared by every robot of this controller. A robotId naming a
+    robot driven elsewhere is ignored; one naming a single robot of a larger
+    fleet is rejected rather than retuning the whole fleet.
+    """
+    robot_id = data.get('robotId')
+    if robot_id is not None and robot_id not in robots:
+        return
+    request = {
+        "requestId": data.get('requestId'),
+        "source": data.get('type'),
+        "updateType": data.get('updateType')
+    }
     try:
-        print(f"🔄 Connecting to {BACKEND_URL}...")
-        ws_connection = websocket.WebSocketApp(
-            BACKEND_URL,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close,
-            on_open=on_open
-        )
-        
-        # Run WebSocket in a separate thread
-        ws_thread = threading.Thread(target=ws_connection.run_forever)
-        ws_thread.daemon = True
-        ws_thread.start()
-        
-        # Wait for connection
-        time.sleep(1)
-        return True
-    except Exception as e:
-        print(f"❌ Failed to connect: {e}")
-        return False
+        if robot_id is not None and len(robots) > 1:
+            raise ConfigError({"robotId": "settings apply to the whole fleet; send without robotId"})
+        if data.get('type') == 'update' and data.get('updateType') == 'reset':
+            config.stage_reset(request)
+            return
+        settings = data.get('settings')
+        if settings is None:
+            settings = {k: v for k, v in data.items() if k not in CONFIG_MESSAGE_FIELDS}
+        config.stage(convert_legacy_settings(settings), request)
+    except ConfigError as e:
+        log.warning("⚠️  Rejected config update: %s", e)
+        send_message({
+            "type": "config_ack",
+            "requestId": request["requestId"],
+            "status": "rejected",
+            "errors": e.errors,
+            "version": config.version,
+            "step": sim_step
+        })
+
+
+def define_zones(data):
+    """Replace the geofence zones (all-or-nothing) and answer with a zones_ack."""
+    ack = {
+        "type": "zones_ack",
+        "requestId": data.get('requestId'),
+        "step": sim_step
+    }
+    try:
+        zones = parse_zones(data.get('zones', []))
+    except ZoneError as e:
+        log.warning("⚠️  Rejected zones: %s", e)
+        ack.update(status="rejected", errors=e.errors, version=geofence.version)
+        send_message(ack)
+        return
+    geofence.set_zones(zones)
+    log.info("📍 %d geofence zone(s) defined (v%d)", len(zones), geofence.version)
+    ack.update(status="applied", zones=len(zones), version=geofence.version)
+    send_message(ack)
+
+
+def send_zone_events(robot, start, end, timestep):
+    """
+    Send zone_enter / zone_exit for the robot's motion from start to end this step.
+
+    Each event carries the point where the boundary was crossed and the sim
+    time interpolated within the step (timestep ms ending at sim_time).
+    """
+    for t, zone_id, entered in geofence.update(robot.robot_id, start, end):
+        x = start[0] + (end[0] - start[0]) * t
+        y = start[1] + (end[1] - start[1]) * t
+        event = {
+            "type": "zone_enter" if entered else "zone_exit",
+            "robotId": robot.robot_id,
+            "zoneId": zone_id,
+            "position": [round(x, 3), round(y, 3)],
+            "step": sim_step,
+            "simTime": round(sim_time - timestep / 1000.0 * (1.0 - t), 4),
+            "timestamp": int(time.time() * 1000)
+        }
+        if not entered and zone_id not in geofence.zones:
+            event["reason"] = "removed"
+        log.info("📍 %s %s zone %s at (%.3f, %.3f)", robot.robot_id,
+                 "entered" if entered else "left", zone_id, x, y,
+                 extra=rate_key(f"zone.{robot.robot_id}.{zone_id}", robot_id=robot.robot_id,
+                                step=sim_step))
+        send_message(event)
+
+
+def convert_legacy_settings(settings):
+    """Turn a legacy per-step movement_speed (m/step) into linear_velocity (m/s)."""
+    legacy = [k for k in settings if k in ('movement_speed', 'movementSpeed', 'MOVEMENT_SPEED')]
+    if not legacy:
+        return settings
+    settings = dict(settings)
+    for key in legacy:
+        value = settings.pop(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = value / (basic_timestep / 1000.0)
+        settings['linear_velocity'] = value  # non-numbers are rejected by validation
+    return settings
+
+
+def apply_config():
+    """Commit staged config updates (between steps) and acknowledge them."""
+    for request, changes, version in config.apply_pending():
+        battery_model.configure(config)
+        for robot in robots.values():
+            configure_scheduler(robot.scheduler)
+            if robot.path is not None:
+                robot.path.tolerance = config.path_tolerance
+        log.info("⚙️  Config v%s applied at step %s: %s", version, sim_step, changes)
+        send_message({
+            "type": "config_ack",
+            "requestId": request["requestId"],
+            "status": "applied",
+            "applied": changes,
+            "version": version,
+            "step": sim_step
+        })
+
+
+def send_message(message, coalesce_key=None, merge=None):
+    """
+    Queue a message for the backend; never blocks the simulation loop.
+
+    Messages with a coalesce_key replace an older unsent message with the same
+    key (used for telemetry), or are combined with it by merge; all others
+    (acks etc.) are delivered reliably, up to the send queue's hard cap
+    (RELIABLE_QUEUE_SIZE). Pre-encoded frames (str/bytes) are sent as-is.
+    """
+    if transport is not None:
+        if isinstance(message, dict):
+            message = json.dumps(message)
+        transport.send(message, coalesce_key, merge)
+
+
+def connect_websocket():
+    """Start the background transport (non-blocking; it reconnects by itself)."""
+    global transport
+    if transport is None:
+        transport = AsyncTransport(BACKEND_URL, latency=latency)
+        transport.hello = json.dumps({
+            "type": "hello",
+            "role": "robot",
+            "robots": list(robots),
+            # Lockstep runs stay on JSON (protocol §13)
+            "encodings": [ENCODING_JSON] if LOCKSTEP else [TELEMETRY_ENCODING, ENCODING_JSON],
+            "lockstep": LOCKSTEP
+        })
+        transport.start()
+    return transport
 
 
 # ============================================
@@ -154,13 +568,25 @@ def get_heading(compass):
     return normalize_theta(rad)
 
 
-def update_battery(is_moving, timestep):
-    """Simulate battery drain based on movement."""
-    global battery_level
-    if is_moving:
-        drain = BATTERY_DRAIN_RATE * (timestep / 1000.0)
-        battery_level -= drain
-        battery_level = max(0.0, min(100.0, battery_level))
+def update_battery(robot, is_moving, timestep):
+    """Drain the battery through the battery model, from the motion written over `timestep` ms."""
+    distance, rotation = robot.adapter.motion()
+    dt = timestep / 1000.0
+    robot.battery_level, robot.battery_speed, load = battery_model.step(
+        robot.battery_level, is_moving, distance, rotation, robot.battery_speed, dt)
+    # Smooth the load so turn and start-up spikes do not make time-to-empty jump
+    if robot.battery_load is None:
+        robot.battery_load = load
+    else:
+        robot.battery_load += (load - robot.battery_load) * min(1.0, dt / BATTERY_LOAD_SMOOTHING)
+
+
+def time_to_empty(robot):
+    """Estimated seconds until the robot's battery is empty (None while idle, linear model)."""
+    if robot.battery_load is None:
+        return None
+    seconds = battery_model.time_to_empty(robot.battery_level, robot.battery_load)
+    return None if seconds is None else round(seconds)
 
 
 def move_forward(pos, theta, speed):
@@ -191,7 +617,191 @@ def rotate_right(theta, speed):
     return normalize_theta(theta - speed)
 
 
-def apply_movement(robot_node, command, timestep):
+def finite_number(value):
+    """True for an int or float that is not a bool, NaN or infinite."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def start_goto(robot, command, pose):
+    """Plan a path for a goto command that starts this step; report it as goto_status."""
+    params = command.params
+    goal = (params.get('x'), params.get('y'))
+    tolerance = params.get('tolerance')
+    robot.goto = {
+        "seq": command.seq,
+        "goal": tuple(v if finite_number(v) else None for v in goal),
+        "tolerance": GOTO_TOLERANCE if tolerance is None else tolerance,
+        "waypoints": None,
+        "index": 1
+    }
+    if not all(finite_number(v) for v in goal):
+        finish_goto(robot, "rejected", reason="goto needs finite numeric x and y")
+        return
+    if not finite_number(robot.goto["tolerance"]) or robot.goto["tolerance"] <= 0:
+        finish_goto(robot, "rejected", reason="tolerance must be a positive number (m)")
+        return
+    if planner is None:
+        finish_goto(robot, "unreachable", reason="no occupancy grid loaded")
+        return
+    waypoints, cached = planner.plan(pose.position, robot.goto["goal"])
+    if waypoints is None:
+        finish_goto(robot, "unreachable", reason="goal blocked, off the floor or enclosed")
+        return
+    robot.goto["waypoints"] = waypoints
+    length = sum(math.hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(waypoints, waypoints[1:]))
+    log.info("🧭 %s goto (%.2f, %.2f): %d waypoints, %.2f m%s", robot.robot_id,
+             waypoints[-1][0], waypoints[-1][1], len(waypoints), length,
+             " (cached plan)" if cached else f" (planned in {planner.last_plan_ms:.1f} ms)",
+             extra=rate_key(f"goto.{robot.robot_id}", robot_id=robot.robot_id, step=sim_step))
+    send_goto_status(robot, "planned",
+                     waypoints=[[round(x, 3), round(y, 3)] for x, y in waypoints],
+                     length=round(length, 3), cached=cached,
+                     planMs=round(planner.last_plan_ms, 3))
+
+
+def finish_goto(robot, status, **fields):
+    """End the robot's goto (arrived / unreachable / rejected / cancelled) and report it."""
+    if robot.goto is None:
+        return
+    send_goto_status(robot, status, **fields)
+    robot.goto = None
+
+
+def send_goto_status(robot, status, **fields):
+    goal = robot.goto["goal"]
+    message = {
+        "type": "goto_status",
+        "robotId": robot.robot_id,
+        "seq": robot.goto["seq"],
+        "status": status,
+        "goal": list(goal),
+        "step": sim_step,
+        "simTime": round(sim_time, 3)
+    }
+    message.update(fields)
+    send_message(message)
+
+
+def follow_path(robot, pose, timestep):
+    """
+    Drive along the goto waypoints for `timestep` ms of sim time.
+
+    The time is split into sub-steps of at most MOTION_SUBSTEP_MS. In each one
+    the robot either turns in place towards the next waypoint (angular_velocity)
+    or moves towards it (linear_velocity, never past it), so a coarse
+    basicTimeStep follows the same path as a fine one. The pose is written once
+    at the end. Returns True if the robot moved.
+    """
+    goto = robot.goto
+    if goto is None or goto["waypoints"] is None:
+        return False
+    substeps = max(1, math.ceil(timestep / MOTION_SUBSTEP_MS - 1e-9)) if MOTION_SUBSTEP_MS > 0 else 1
+    dt = timestep / 1000.0 / substeps
+    position, theta = pose.position, pose.theta
+    waypoints = goto["waypoints"]
+    turned = moved = False
+    for _ in range(substeps):
+        while True:
+            target = waypoints[goto["index"]]
+            last = goto["index"] == len(waypoints) - 1
+            dx, dy = target[0] - position[0], target[1] - position[1]
+            distance = math.hypot(dx, dy)
+            if distance > (goto["tolerance"] if last else GOTO_WAYPOINT_TOLERANCE):
+                break
+            if last:
+                finish_goto(robot, "arrived", position=[round(position[0], 3), round(position[1], 3)])
+                break
+            goto["index"] += 1
+        if robot.goto is None:
+            break
+
+        error = normalize_theta(math.atan2(dy, dx) - theta)
+        if abs(error) > GOTO_HEADING_TOLERANCE:
+            turn = min(abs(error), config.angular_velocity * dt)
+            theta = rotate_left(theta, turn) if error > 0 else rotate_right(theta, turn)
+            turned = True
+        else:
+            position = move_forward(position, theta, min(config.linear_velocity * dt, distance))
+            moved = True
+
+    if turned:
+        robot.adapter.set_yaw(theta)
+    if moved:
+        robot.adapter.set_translation(position)
+    return turned or moved
+
+
+def twist_velocity(robot, params, key, limit):
+    """A twist velocity parameter, clamped to ±limit (0 if missing or not a number)."""
+    value = params.get(key, 0.0)
+    if not finite_number(value):
+        log.warning("⚠️  %s twist: ignoring non-numeric %s=%r", robot.robot_id, key, value,
+                    extra=rate_key(f"twist.{robot.robot_id}", robot_id=robot.robot_id))
+        return 0.0
+    return max(-limit, min(limit, float(value)))
+
+
+def start_twist(robot, command, start_time):
+    """
+    Activate a twist command that starts this step.
+
+    "duration" (s) counts from start_time, the sim time this step's motion
+    starts at; "deadline" is an absolute sim time (s). Without either the
+    twist holds until the next command.
+    """
+    params = command.params
+    duration, deadline = params.get('duration'), params.get('deadline')
+    expires = None
+    if isinstance(duration, (int, float)) and not isinstance(duration, bool):
+        expires = start_time + max(0.0, duration)
+    elif isinstance(deadline, (int, float)) and not isinstance(deadline, bool):
+        expires = float(deadline)
+    robot.twist = {
+        "seq": command.seq,
+        "v": twist_velocity(robot, params, 'v', TWIST_MAX_LINEAR),
+        "w": twist_velocity(robot, params, 'w', TWIST_MAX_ANGULAR),
+        "expires": expires,
+        "expired": False
+    }
+
+
+def integrate_twist(robot, pose, timestep):
+    """
+    Move along the active twist for this step's elapsed time (exact unicycle arc).
+
+    Only the part of the step before the twist expires counts; after that the
+    robot holds still until the next command. Returns True if the robot moved.
+    """
+    twist = robot.twist
+    if twist is None or twist["expired"]:
+        return False
+    dt = timestep / 1000.0
+    if twist["expires"] is not None:
+        dt = min(dt, twist["expires"] - (sim_time - dt))
+        if dt <= 1e-9:
+            twist["expired"] = True
+            log.info("⏹️  %s twist #%s expired", robot.robot_id, twist["seq"],
+                     extra=rate_key(f"twist.{robot.robot_id}", robot_id=robot.robot_id, step=sim_step))
+            return False
+    v, w = twist["v"], twist["w"]
+    if v == 0.0 and w == 0.0:
+        return False
+    x, y, z = pose.position
+    theta = pose.theta
+    if abs(w) < 1e-9:
+        x += v * math.cos(theta) * dt
+        y += v * math.sin(theta) * dt
+    else:
+        new_theta = theta + w * dt
+        x += v / w * (math.sin(new_theta) - math.sin(theta))
+        y -= v / w * (math.cos(new_theta) - math.cos(theta))
+        robot.adapter.set_yaw(normalize_theta(new_theta))
+    if v != 0.0:
+        robot.adapter.set_translation([x, y, z])
+    return True
+
+
+def apply_movement(robot, timestep):
     """
     Apply robot-relative movement (linear or angular).
     
@@ -200,103 +810,158 @@ def apply_movement(robot_node, command, timestep):
     - backward: moves linearly opposite to facing (continuous)
     - left: turns 90° left once per command press
     - right: turns 90° right once per command press
+    - goto: follows the planned path (follow_path)
+    - twist: integrates its linear / angular velocity (integrate_twist)
     
-    LEFT/RIGHT only execute once per button press to avoid spinning.
+    LEFT/RIGHT only execute once per button press to avoid spinning; a new
+    sequenced command counts as a new press even if it repeats the last one.
+
+    timestep is the sim time (ms) elapsed since the previous step: linear
+    moves cover linear_velocity * elapsed time, so robot speed does not
+    depend on basicTimeStep.
+
+    Uses the pose snapshot read at the start of the step (robot.adapter.pose)
+    and writes through the adapter's cached field handles.
     """
-    global last_executed_command
+    adapter = robot.adapter
+    command = robot.current_command
     
     if command == "stop":
-        last_executed_command = "stop"
+        robot.last_executed_command = "stop"
         return False
     
-    # Get current state
-    current_pos = robot_node.getPosition()
-    current_theta = get_current_yaw(robot_node)
+    # Current state from this step's snapshot
+    pose = adapter.pose or adapter.read_pose(sim_step)
+    current_pos = pose.position
+    current_theta = pose.theta
     
-    # Debug: Print movement details every 20 commands
-    global cycle_counter
-    log_debug = cycle_counter % 20 == 0
+    # Debug: log movement details every 20 cycles (skipped entirely unless DEBUG)
+    log_debug = robot.cycle_counter % 20 == 0 and log.isEnabledFor(logging.DEBUG)
     
     if log_debug:
-        print(f"🔍 Movement: cmd={command}, theta={current_theta:.3f} rad ({math.degrees(current_theta):.1f}°), pos=({current_pos[0]:.2f}, {current_pos[1]:.2f})")
+        log.debug("🔍 Movement: cmd=%s, theta=%.3f rad (%.1f°), pos=(%.2f, %.2f)",
+                  command, current_theta, math.degrees(current_theta), current_pos[0], current_pos[1],
+                  extra=rate_key(f"movement.{robot.robot_id}", robot_id=robot.robot_id))
     
     moved = False
+    step_distance = config.linear_velocity * (timestep / 1000.0)
     
     # Apply Linear Movement (continuous - executes every cycle)
     if command == "forward":
-        new_pos = move_forward(current_pos, current_theta, MOVEMENT_SPEED)
-        robot_node.getField('translation').setSFVec3f(new_pos)
+        new_pos = move_forward(current_pos, current_theta, step_distance)
+        adapter.set_translation(new_pos)
         moved = True
-        last_executed_command = "forward"
+        robot.last_executed_command = "forward"
         if log_debug:
-            print(f"   → Forward: Δx={new_pos[0]-current_pos[0]:.4f}, Δy={new_pos[1]-current_pos[1]:.4f}")
+            log.debug("   → Forward: Δx=%.4f, Δy=%.4f", new_pos[0] - current_pos[0], new_pos[1] - current_pos[1])
             
     elif command == "backward":
-        new_pos = move_backward(current_pos, current_theta, MOVEMENT_SPEED)
-        robot_node.getField('translation').setSFVec3f(new_pos)
+        new_pos = move_backward(current_pos, current_theta, step_distance)
+        adapter.set_translation(new_pos)
         moved = True
-        last_executed_command = "backward"
+        robot.last_executed_command = "backward"
         if log_debug:
-            print(f"   → Backward: Δx={new_pos[0]-current_pos[0]:.4f}, Δy={new_pos[1]-current_pos[1]:.4f}")
+            log.debug("   → Backward: Δx=%.4f, Δy=%.4f", new_pos[0] - current_pos[0], new_pos[1] - current_pos[1])
+            
+    # Follow the planned goto path
+    elif command == "goto":
+        moved = follow_path(robot, pose, timestep)
+        robot.last_executed_command = "goto"
+            
+    # Integrate a continuous velocity command
+    elif command == "twist":
+        moved = integrate_twist(robot, pose, timestep)
+        robot.last_executed_command = "twist"
             
     # Apply Turn + Forward Movement (ONCE per command change)
     elif command == "left":
         # Only execute if this is a NEW left command
-        if last_executed_command != "left":
+        if robot.last_executed_command != "left" or robot.turned_seq != robot.command_seq:
             # Turn 90° left (counter-clockwise) and move forward
             new_theta = normalize_theta(current_theta + TURN_ANGLE)  # +90°
-            robot_node.getField('rotation').setSFRotation([0, 0, 1, new_theta])
+            adapter.set_yaw(new_theta)
             # Move forward in the NEW direction
-            new_pos = move_forward(current_pos, new_theta, MOVEMENT_SPEED)
-            robot_node.getField('translation').setSFVec3f(new_pos)
+            new_pos = move_forward(current_pos, new_theta, step_distance)
+            adapter.set_translation(new_pos)
             moved = True
-            last_executed_command = "left"
-            print(f"✨ Turn 90° Left + Forward: θ_new={new_theta:.3f} rad ({math.degrees(new_theta):.1f}°)")
+            robot.last_executed_command = "left"
+            robot.turned_seq = robot.command_seq
+            log.info("✨ %s Turn 90° Left + Forward: θ_new=%.3f rad", robot.robot_id, new_theta,
+                     extra=rate_key(f"turn.{robot.robot_id}", robot_id=robot.robot_id))
         # If already executed left, just move forward
         else:
-            new_pos = move_forward(current_pos, current_theta, MOVEMENT_SPEED)
-            robot_node.getField('translation').setSFVec3f(new_pos)
+            new_pos = move_forward(current_pos, current_theta, step_distance)
+            adapter.set_translation(new_pos)
             moved = True
             
     elif command == "right":
         # Only execute if this is a NEW right command
-        if last_executed_command != "right":
+        if robot.last_executed_command != "right" or robot.turned_seq != robot.command_seq:
             # Turn 90° right (clockwise) and move forward
             new_theta = normalize_theta(current_theta - TURN_ANGLE)  # -90°
-            robot_node.getField('rotation').setSFRotation([0, 0, 1, new_theta])
+            adapter.set_yaw(new_theta)
             # Move forward in the NEW direction
-            new_pos = move_forward(current_pos, new_theta, MOVEMENT_SPEED)
-            robot_node.getField('translation').setSFVec3f(new_pos)
+            new_pos = move_forward(current_pos, new_theta, step_distance)
+            adapter.set_translation(new_pos)
             moved = True
-            last_executed_command = "right"
-            print(f"✨ Turn 90° Right + Forward: θ_new={new_theta:.3f} rad ({math.degrees(new_theta):.1f}°)")
+            robot.last_executed_command = "right"
+            robot.turned_seq = robot.command_seq
+            log.info("✨ %s Turn 90° Right + Forward: θ_new=%.3f rad", robot.robot_id, new_theta,
+                     extra=rate_key(f"turn.{robot.robot_id}", robot_id=robot.robot_id))
         # If already executed right, just move forward
         else:
-            new_pos = move_forward(current_pos, current_theta, MOVEMENT_SPEED)
-            robot_node.getField('translation').setSFVec3f(new_pos)
+            new_pos = move_forward(current_pos, current_theta, step_distance)
+            adapter.set_translation(new_pos)
             moved = True
 
     return moved
 
 
-def create_telemetry(position, heading, is_moving):
+def check_collision(robot, is_moving):
+    """
+    Clip or reject the move written this step if it would collide.
+
+    Returns the moving flag: a move that was cut back to nothing (and no
+    turn) no longer counts as moving.
+    """
+    adapter = robot.adapter
+    position, status = collisions.resolve(robot.robot_id, adapter.pose.position,
+                                          adapter.written_position)
+    if status == "free":
+        return is_moving
+    adapter.set_translation(position)
+    log.info("🧱 %s move %s: %s", robot.robot_id, status,
+             ", ".join(c["id"] for c in collisions.contacts(robot.robot_id)) or "?",
+             extra=rate_key(f"collision.{robot.robot_id}", robot_id=robot.robot_id, step=sim_step))
+    distance, rotation = adapter.motion()
+    return distance > 0.0 or rotation > 0.0
+
+
+def create_telemetry(robot, position, heading, is_moving):
     """
     Create telemetry JSON message with normalized theta.
     
     Telemetry includes:
+    - robotId: id of the robot the frame describes
     - pose: {x, y, theta} where theta is normalized to [-π, π]
     - speed: current movement speed
     - battery: battery level percentage
+    - timeToEmpty: estimated seconds of battery left at the average load (or null)
+    - contacts: [{kind, id}, ...] robots / obstacles / floor edge in contact
+      (only with the collision layer on)
     - cycle: cycle counter
-    - timestamp: milliseconds since epoch
+    - timestamp: milliseconds since epoch (wall clock, when the frame was built)
+    - step / simTime: simulation step index and sim time of the frame
     """
-    global battery_level, cycle_counter
-    
     # Speed is set based on movement type
-    if current_command in ["forward", "backward"]:
+    if robot.current_command in ["forward", "backward"] and is_moving:
         speed = 0.1  # Linear movement
-    elif current_command in ["left", "right"]:
+    elif robot.current_command in ["left", "right"] and is_moving:
         speed = 0.05  # Rotational movement
+    elif robot.current_command == "goto" and is_moving:
+        speed = 0.1  # Following a planned path
+    elif robot.current_command == "twist" and is_moving:
+        speed = round(abs(robot.twist["v"]), 3)  # Commanded linear velocity
     else:
         speed = 0.0
     
@@ -305,110 +970,325 @@ def create_telemetry(position, heading, is_moving):
     
     telemetry = {
         "type": "telemetry",
+        "robotId": robot.robot_id,
         "pose": {
             "x": round(position[0], 3),
             "y": round(position[1], 3),
             "theta": round(normalized_heading, 4)
         },
         "speed": speed,
-        "battery": round(battery_level, 1),
-        "cycle": cycle_counter,
-        "timestamp": int(time.time() * 1000)
+        "battery": round(robot.battery_level, 1),
+        "timeToEmpty": time_to_empty(robot),
+        "cycle": robot.cycle_counter,
+        "timestamp": int(time.time() * 1000),
+        "step": sim_step,
+        "simTime": round(sim_time, 3)
     }
+    if collisions is not None:
+        telemetry["contacts"] = collisions.contacts(robot.robot_id)
     return telemetry
 
 
-def send_telemetry(telemetry):
-    """Send telemetry to backend via WebSocket."""
-    global ws_connection, connected
-    if connected and ws_connection:
-        try:
-            ws_connection.send(json.dumps(telemetry))
-        except Exception as e:
-            print(f"❌ Failed to send telemetry: {e}")
-            connected = False
+def send_telemetry(telemetry, robot=None):
+    """
+    Send telemetry to backend via WebSocket (only the newest unsent frame is kept).
+
+    Full frames use the encoding negotiated on the current connection, JSON
+    otherwise. In delta mode the robot's DeltaEncoder decides whether a
+    keyframe, a partial telemetry_delta or nothing is sent. In lockstep mode
+    nothing is coalesced, so the frames a run produces do not depend on timing.
+    """
+    coalesce_key = ("telemetry", telemetry["robotId"]) if lockstep is None else None
+    encoding = telemetry_encoding if encoding_session == transport.connect_count else ENCODING_JSON
+    if robot is not None and robot.delta_encoder is not None:
+        frame, is_keyframe = robot.delta_encoder.encode(telemetry)
+        if frame is None:
+            return
+        # The encoder's baseline has already moved: a delta coalescing with an
+        # unsent frame is merged into it instead of replacing it
+        send_message(encode_telemetry(frame, encoding) if is_keyframe else frame,
+                     coalesce_key=coalesce_key, merge=merge_telemetry_frames)
+        return
+    send_message(encode_telemetry(telemetry, encoding), coalesce_key=coalesce_key)
+
+
+def resync_dropped_telemetry():
+    """
+    Force keyframes after the send queue shed or lost telemetry frames.
+
+    A dropped frame may have been a delta: the encoders' baselines already
+    moved past it, so until a keyframe the backend keeps the stale values.
+    The queue does not say whose frame was lost, so every robot resyncs.
+    """
+    global telemetry_dropped
+    dropped = transport.stats()["dropped"]
+    if dropped == telemetry_dropped:
+        return
+    telemetry_dropped = dropped
+    for robot in robots.values():
+        if robot.delta_encoder is not None:
+            robot.delta_encoder.force_keyframe()
 
 
 # ============================================
 # MAIN CONTROLLER
 # ============================================
 
-def main():
-    """Main robot controller loop."""
-    global cycle_counter, current_command
+def init_robots(supervisor, timestep):
+    """
+    Build the RobotState table for this supervisor.
+
+    Single-robot mode controls the supervisor's own node (with its GPS).
+    Fleet mode controls every node listed in FLEET_DEFS, looked up by DEF name.
+    """
+    robots.clear()
+    if not FLEET_DEFS:
+        gps = supervisor.getDevice('gps')
+        gps.enable(timestep)
+        robot_node = supervisor.getSelf()
+        robot_id = robot_node.getDef() or "ROBOT"
+        robots[robot_id] = RobotState(robot_id, robot_node, gps)
+        return
+    for def_name in FLEET_DEFS:
+        robot_node = supervisor.getFromDef(def_name)
+        if robot_node is None:
+            log.warning("⚠️  Fleet robot DEF '%s' not found in world, skipping", def_name)
+            continue
+        robots[def_name] = RobotState(def_name, robot_node)
+
+
+def step_robot(robot, timestep, current_time):
+    """
+    Run one control step (movement, battery, telemetry) for a single robot.
+
+    timestep is the sim time (ms) elapsed since the previous step.
+    """
+    # Take this step's command from the queue; ack commands that start now
+    command, started = robot.commands.next_for_step(sim_step)
+    if command is not None:
+        robot.current_command = command.cmd
+        robot.command_seq = (command.seq, command.index)
+        if started:
+            ack = command.ack(robot.robot_id, round(current_time, 3))
+            record_actuation(command, ack)
+            send_message(ack)
+    profiler.lap("commands")
+    
+    # Read the pose once; movement and telemetry share this snapshot
+    pose = robot.adapter.read_pose(sim_step)
+    position = pose.position
+    heading = pose.theta
+    if started:
+        finish_goto(robot, "cancelled")  # a new command supersedes an unfinished goto
+        robot.twist = None  # ... and an unexpired twist
+        if command.cmd == "goto":
+            start_goto(robot, command, pose)
+        elif command.cmd == "twist":
+            start_twist(robot, command, current_time - timestep / 1000.0)
+    if collisions is not None:
+        collisions.place(robot.robot_id, position)
+    profiler.lap("sensors")
+    
+    # Apply current command to robot
+    is_moving = apply_movement(robot, timestep)
+    if collisions is not None and robot.adapter.written_position is not None:
+        is_moving = check_collision(robot, is_moving)
+    profiler.lap("movement")
+    
+    # Zone transitions along this step's motion
+    send_zone_events(robot, position, robot.adapter.written_position or position, timestep)
+    profiler.lap("zones")
+    
+    # Update battery
+    update_battery(robot, is_moving, timestep)
+    profiler.lap("battery")
+    
+    if recorder is not None:
+        recorder.record(sim_step, current_time, robot.robot_id, robot.current_command,
+                        robot.command_seq, position, heading, robot.battery_level, is_moving)
+    if robot.history is not None:
+        robot.history.append(current_time, position[0], position[1], heading,
+                             robot.battery_level, robot.current_command)
+    if robot.path is not None:
+        update_path(robot, current_time, position, is_moving)
+    
+    # Send telemetry when the (motion-adaptive) scheduler says so
+    if robot.scheduler.due(current_time, is_moving):
+        telemetry = create_telemetry(robot, position, heading, is_moving)
+        send_telemetry(telemetry, robot)
+        
+        # Log status every 20 cycles
+        if robot.cycle_counter % 20 == 0:
+            log.info("📊 %s Cycle %4d | Pos: (%6.2f, %6.2f) | θ: %6.3f rad | "
+                     "Speed: %4.2f | Battery: %5.1f%% | Cmd: %s",
+                     robot.robot_id, robot.cycle_counter, position[0], position[1], heading,
+                     telemetry['speed'], robot.battery_level, robot.current_command,
+                     extra=rate_key(f"status.{robot.robot_id}", robot_id=robot.robot_id, step=sim_step))
+        
+        robot.cycle_counter += 1
+    
+    # Check if battery is critical
+    if robot.battery_level < 10.0 and robot.cycle_counter % 50 == 0:
+        log.warning("⚠️  WARNING: %s battery level critical!", robot.robot_id,
+                    extra=rate_key(f"battery.{robot.robot_id}", robot_id=robot.robot_id))
+    profiler.lap("telemetry")
+
+
+def wait_for_tick():
+    """
+    Lockstep mode: block until the next step is granted, handling messages meanwhile.
+
+    Sends "tick_done" once every step of the previous grant has run. Returns
+    immediately when lockstep mode is off.
+    """
+    if lockstep is None:
+        return True
+    while not lockstep.allows(sim_step + 1):
+        if lockstep.should_report(sim_step):
+            send_message({
+                "type": "tick_done",
+                "step": sim_step,
+                "simTime": round(sim_time, 3),
+                "timestamp": int(time.time() * 1000)
+            })
+        for message in transport.poll(timeout=LOCKSTEP_POLL_TIMEOUT):
+            on_message(message)
+    return True
+
+
+def report_profile():
+    """Log the step profile and send it to the backend as a "profile" message."""
+    log.info(profiler.format_report(), extra=rate_key("profile"))
+    send_message({
+        "type": "profile",
+        "step": sim_step,
+        "simTime": round(sim_time, 3),
+        "profile": profiler.summary(),
+        "timestamp": int(time.time() * 1000)
+    }, coalesce_key=("profile",))
+
+
+def main(supervisor=None):
+    """
+    Main robot controller loop.
+
+    A pre-built supervisor (e.g. a HeadlessSupervisor) can be passed in;
+    otherwise one is created for the configured world backend.
+    """
+    global sim_step, sim_time, basic_timestep, recorder, planner, collisions
     
-    print("=" * 60)
-    print("🤖 S4 ROBOT SUPERVISOR CONTROLLER (Rotation-Based)")
-    print("=" * 60)
+    configure_logging()
+    log.info("=" * 60)
+    log.info("🤖 S4 ROBOT SUPERVISOR CONTROLLER (Rotation-Based)")
+    log.info("=" * 60)
     
     # Initialize supervisor
-    supervisor = Supervisor()
+    if supervisor is None:
+        supervisor = create_supervisor(robot_defs=FLEET_DEFS)
     timestep = int(supervisor.getBasicTimeStep())
-    print(f"⏱️  Timestep: {timestep} ms")
+    basic_timestep = timestep
+    log.info("⏱️  Timestep: %s ms", timestep)
+    profiler.budget_ms = timestep
+    profiler.cprofile_path = {None: None, "1": ""}.get(PROFILE_CPROFILE, PROFILE_CPROFILE)
     
-    # Get robot node
-    robot_node = supervisor.getSelf()
-    print("✅ Robot node acquired")
+    # Get robot nodes (own node, or the whole fleet)
+    init_robots(supervisor, timestep)
+    if not robots:
+        log.error("❌ No robot nodes to control")
+        return
+    fleet = list(robots.values())
+    log.info("✅ %d robot node(s) acquired: %s", len(fleet), ", ".join(robots))
+    world_file = WORLD_FILE or getattr(supervisor, "getWorldPath", lambda: "")()
+    if world_file and os.path.exists(world_file):
+        planner = PathPlanner(OccupancyGrid.from_world_file(world_file))
+        grid = planner.grid
+        log.info("🗺️  Occupancy grid %dx%d @ %.2f m, %d obstacle(s) from %s", grid.width,
+                 grid.height, grid.resolution, grid.obstacles, os.path.basename(world_file))
+    else:
+        log.warning("⚠️  No world file for the occupancy grid, goto disabled")
+    if COLLISION_MODE != "off":
+        if world_file and os.path.exists(world_file):
+            collisions = CollisionWorld.from_world_file(world_file, mode=COLLISION_MODE)
+        else:
+            collisions = CollisionWorld(mode=COLLISION_MODE)  # robot-robot only
+        log.info("🧱 Collisions (%s): %d obstacle footprint(s), floor edge %s", COLLISION_MODE,
+                 len(collisions.footprints), "on" if collisions.floor else "off")
+    if RECORD_FILE:
+        recorder = StepRecorder(RECORD_FILE, list(robots), timestep)
+        log.info("💾 Recording steps to %s", RECORD_FILE)
+    if HISTORY_DIR:
+        for robot in fleet:
+            robot.history = TrajectoryRing.create(
+                os.path.join(HISTORY_DIR, f"{robot.robot_id}.ring"), HISTORY_CAPACITY)
+        log.info("🗂️  Pose history: %d records per robot in %s", HISTORY_CAPACITY, HISTORY_DIR)
     
-    # Initialize sensors
-    gps = supervisor.getDevice('gps')
-    gps.enable(timestep)
-    compass = supervisor.getDevice('compass')
-    compass.enable(timestep)
-    print("✅ Sensors initialized (GPS, Compass)")
+    # Connect to backend (in the background; the loop starts immediately)
+    connect_websocket()
     
-    # Connect to backend
-    if not connect_websocket():
-        print("⚠️  Starting without backend connection")
+    log.info("🚀 Starting main control loop...")
+    log.info("-" * 60)
     
-    print("\n🚀 Starting main control loop...")
-    print("-" * 60)
+    last_link_report = 0
+    last_profile_report = 0
+    profiler.start_cprofile()
     
-    last_telemetry_time = 0
+    if lockstep is not None:
+        log.info("🔒 Lockstep mode: waiting for tick grants")
     
     # Main control loop
-    while supervisor.step(timestep) != -1:
+    while wait_for_tick() and supervisor.step(timestep) != -1:
+        profiler.begin_step()
         current_time = supervisor.getTime()
+        # Motion and battery integrate over the sim time that actually elapsed
+        elapsed = round((current_time - sim_time) * 1000.0, 3)  # ms
         
-        # Read sensors
-        position = gps.getValues()
-        # Use robot's actual rotation field for heading
-        heading = get_current_yaw(robot_node)
-        
-        # Apply current command to robot
-        is_moving = apply_movement(robot_node, current_command, timestep)
+        sim_step += 1
+        sim_time = current_time
         
-        # Update battery
-        update_battery(is_moving, timestep)
+        # Apply messages that arrived since the last step, then commit
+        # staged config changes atomically before any robot moves
+        for message in transport.poll():
+            on_message(message)
+        apply_config()
+        if TELEMETRY_DELTA:
+            resync_dropped_telemetry()
+        profiler.lap("messages")
         
-        # Send telemetry at specified interval
-        if current_time - last_telemetry_time >= TELEMETRY_INTERVAL:
-            telemetry = create_telemetry(position, heading, is_moving)
-            send_telemetry(telemetry)
-            
-            # Print status every 20 cycles
-            if cycle_counter % 20 == 0:
-                speed_value = telemetry['speed']
-                print(f"📊 Cycle {cycle_counter:4d} | "
-                      f"Pos: ({position[0]:6.2f}, {position[1]:6.2f}) | "
-                      f"θ: {heading:6.3f} rad ({math.degrees(heading):6.1f}°) | "
-                      f"Speed: {speed_value:4.2f} | "
-                      f"Battery: {battery_level:5.1f}% | "
-                      f"Cmd: {current_command}")
-            
-            cycle_counter += 1
-            last_telemetry_time = current_time
+        for robot in fleet:
+            step_robot(robot, elapsed, current_time)
         
-        # Check if battery is critical
-        if battery_level < 10.0 and cycle_counter % 50 == 0:
-            print("⚠️  WARNING: Battery level critical!")
+        # Report send-queue counters (queued/sent/coalesced/dropped)
+        if current_time - last_link_report >= LINK_STATS_INTERVAL:
+            link = transport.stats()
+            log.info("📡 Link: %s | pending %d | queued %d | sent %d | coalesced %d | dropped %d",
+                     "up" if link['connected'] else "down", link['pending'], link['queued'],
+                     link['sent'], link['coalesced'], link['dropped'], extra=rate_key("link"))
+            if link['dropped_reliable']:
+                log.error("❌ Link unhealthy: %d control frame(s) lost to send-queue overflow",
+                          link['dropped_reliable'], extra=rate_key("link_overflow"))
+            end_to_end = latency.summary().get("cmd.end_to_end")
+            if end_to_end:
+                log.info("⏱️  Command latency: p50 %.1f ms | p99 %.1f ms | n=%d",
+                         end_to_end['p50'] / 1000, end_to_end['p99'] / 1000, end_to_end['count'],
+                         extra=rate_key("latency"))
+            last_link_report = current_time
         
-        # Attempt reconnection if disconnected
-        if not connected and cycle_counter % 100 == 0:
-            print("🔄 Attempting to reconnect...")
-            connect_websocket()
+        if profiler.enabled and current_time - last_profile_report >= PROFILE_REPORT_INTERVAL:
+            report_profile()
+            last_profile_report = current_time
+        profiler.lap("report")
+        profiler.end_step()
     
-    print("\n🛑 Controller stopped")
+    if profiler.enabled:
+        log.info(profiler.format_report())
+    cprofile_report = profiler.stop_cprofile()
+    if cprofile_report:
+        log.info(cprofile_report)
+    if recorder is not None:
+        recorder.close()
+        log.info("💾 %d step records written to %s", recorder.count, RECORD_FILE)
+    transport.stop()
+    log.info("🛑 Controller stopped")
 
 
 # ============================================
@@ -424,3 +1304,7 @@ if __name__ == "__main__":
         print(f"\n❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        # Flush buffered step records even when the loop was interrupted
+        if recorder is not None:
+            recorder.close()
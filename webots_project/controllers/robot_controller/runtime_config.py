@@ -0,0 +1,142 @@
+"""
+S4 Remote Robot Management System - Runtime Configuration Store
+================================================================
+
+Typed, validated settings that can be changed while the simulation runs
+(via "config" / "update" messages) instead of only at restart.
+
+Updates are staged when a message arrives and committed together by
+apply_pending() at a step boundary: a request is validated as a whole
+(types, ranges, cross-field rules) and either every setting in it is
+applied or none is.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+# ============================================
+# SCHEMA
+# ============================================
+
+# name -> (type, min, max)
+CONFIG_SCHEMA = {
+    "linear_velocity": (float, 0.0, 5.0),         # m/s, forward/backward/goto
+    "angular_velocity": (float, 0.0, 20.0),       # rad/s, goto turns
+    "telemetry_interval": (float, 0.02, 10.0),    # s, fixed-rate mode
+    "battery_drain_rate": (float, 0.0, 100.0),    # % per second when moving
+    "battery_temperature": (float, -40.0, 80.0),  # °C, physics battery model
+    "telemetry_min_hz": (float, 0.01, 100.0),
+    "telemetry_max_hz": (float, 0.01, 100.0),
+    "telemetry_moving_hz": (float, 0.01, 100.0),
+    "telemetry_idle_hz": (float, 0.01, 100.0),
+    "path_tolerance": (float, 0.0, 10.0),         # m, path_segment simplification
+}
+
+
+def camel_case(name):
+    """telemetry_min_hz -> telemetryMinHz"""
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+# Accepted aliases: the camelCase protocol name of every setting, plus the
+# short telemetry_rate names (controller constant names are matched by lower())
+CONFIG_ALIASES = {camel_case(name): name for name in CONFIG_SCHEMA}
+CONFIG_ALIASES.update({
+    "minHz": "telemetry_min_hz",
+    "maxHz": "telemetry_max_hz",
+    "movingHz": "telemetry_moving_hz",
+    "idleHz": "telemetry_idle_hz",
+})
+
+# ============================================
+# STORE
+# ============================================
+
+
+class ConfigError(ValueError):
+    """Raised when a configuration update is invalid; carries per-field errors."""
+
+    def __init__(self, errors):
+        super().__init__("; ".join(f"{k}: {v}" for k, v in errors.items()))
+        self.errors = errors
+
+
+def normalize_key(key):
+    """Map LINEAR_VELOCITY / linearVelocity / linear_velocity to the schema name."""
+    return CONFIG_ALIASES.get(key, key.lower())
+
+
+class RuntimeConfig:
+    """Versioned settings with staged, all-or-nothing updates."""
+
+    def __init__(self, **defaults):
+        self.defaults = {}
+        for key, value in defaults.items():
+            self.defaults[normalize_key(key)] = value
+        self.values = dict(self.defaults)
+        self.version = 0
+        self.pending = []  # (request, validated changes)
+
+    def __getattr__(self, name):
+        try:
+            return self.__dict__["values"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def validate(self, updates):
+        """Return normalized, type-converted changes or raise ConfigError."""
+        changes = {}
+        errors = {}
+        for raw_key, raw_value in updates.items():
+            key = normalize_key(raw_key)
+            if key not in CONFIG_SCHEMA:
+                errors[raw_key] = "unknown setting"
+                continue
+            kind, low, high = CONFIG_SCHEMA[key]
+            if isinstance(raw_value, bool):
+                errors[raw_key] = f"expected {kind.__name__}"
+                continue
+            try:
+                value = kind(raw_value)
+            except (TypeError, ValueError):
+                errors[raw_key] = f"expected {kind.__name__}"
+                continue
+            if not low <= value <= high:
+                errors[raw_key] = f"out of range [{low}, {high}]"
+                continue
+            changes[key] = value
+
+        # Cross-field rules are checked against the merged result
+        merged = dict(self.values)
+        for _, staged in self.pending:
+            merged.update(staged)
+        merged.update(changes)
+        if merged.get("telemetry_min_hz", 0.0) > merged.get("telemetry_max_hz", float("inf")):
+            errors["telemetry_min_hz"] = "must not exceed telemetry_max_hz"
+        if errors:
+            raise ConfigError(errors)
+        return changes
+
+    def stage(self, updates, request=None):
+        """Validate an update and queue it for the next step boundary."""
+        changes = self.validate(updates)
+        self.pending.append((request, changes))
+        return changes
+
+    def stage_reset(self, request=None):
+        """Queue a reset of every setting to its default."""
+        self.pending.append((request, dict(self.defaults)))
+
+    def apply_pending(self):
+        """Commit staged updates; returns [(request, changes, version), ...]."""
+        applied = []
+        for request, changes in self.pending:
+            self.values.update(changes)
+            self.version += 1
+            applied.append((request, changes, self.version))
+        self.pending = []
+        return applied
+
+    def snapshot(self):
+        return dict(self.values)
@@ -0,0 +1,153 @@
+"""
+S4 Remote Robot Management System - Outbound Send Queue
+========================================================
+
+Bounded, thread-safe queue between the simulation loop (producer) and the
+transport thread (consumer).
+
+Frames come in two classes:
+- coalescing frames (telemetry): keyed, e.g. by robot id. A newer frame for
+  the same key replaces the queued one in place ("newest pose wins"), or is
+  combined with it by a merge function when the newer frame is partial
+  (telemetry deltas). When the queue is full the oldest coalescing frame is
+  dropped.
+- reliable frames (acks, commands, config replies): never coalesced and
+  never shed to make room, always sent before pending telemetry. Only as a
+  last resort, so that a very long disconnect cannot exhaust memory, they
+  are hard-capped at RELIABLE_QUEUE_SIZE. Past the cap the oldest reliable
+  frame is dropped, counted in dropped_reliable and logged as an error. The
+  queue is then marked overflowed and the transport reports the link as
+  unhealthy.
+
+Counters (queued / sent / coalesced / dropped / dropped_reliable / requeued)
+let us size the link under load. With a LatencyTracker attached, the time
+each frame waited in the queue is recorded per class (link.reliable_queue /
+telemetry.send_queue).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import collections
+import threading
+import time
+
+from structured_log import get_logger, rate_key
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+SEND_QUEUE_SIZE = 256  # telemetry is shed while reliable + coalescing frames exceed this
+RELIABLE_QUEUE_SIZE = 1024  # last-resort cap on reliable frames (oldest dropped, link unhealthy)
+
+log = get_logger("send_queue")
+
+# ============================================
+# QUEUE
+# ============================================
+
+
+class OutboundQueue:
+    """Bounded send queue with telemetry coalescing and (capped) reliable control frames."""
+
+    def __init__(self, max_size=SEND_QUEUE_SIZE, latency=None, max_reliable=RELIABLE_QUEUE_SIZE):
+        self.max_size = max_size
+        self.max_reliable = max_reliable
+        self.latency = latency  # optional LatencyTracker for queueing delay
+        self._lock = threading.Lock()
+        self._reliable = collections.deque()  # (frame, queued_at)
+        self._latest = collections.OrderedDict()  # coalesce key -> (frame, queued_at)
+        self.queued = 0
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0  # telemetry frames shed
+        self.dropped_reliable = 0  # reliable frames lost to the hard cap
+        self.overflowed = False  # set once a reliable frame was dropped
+        self.requeued = 0
+
+    def __len__(self):
+        with self._lock:
+            return len(self._reliable) + len(self._latest)
+
+    def put(self, frame, coalesce_key=None, merge=None):
+        """
+        Add a frame. Returns True if the queue was empty before (consumer should be woken).
+
+        Frames with a coalesce_key replace any queued frame with the same key,
+        or, with merge, are replaced by merge(queued frame, frame).
+        """
+        now = time.perf_counter()
+        with self._lock:
+            was_empty = not self._reliable and not self._latest
+            self.queued += 1
+            if coalesce_key is None:
+                self._reliable.append((frame, now))
+                self._enforce_bound()
+                return was_empty
+            if coalesce_key in self._latest:
+                if merge is not None:
+                    frame = merge(self._latest[coalesce_key][0], frame)
+                self._latest[coalesce_key] = (frame, now)
+                self.coalesced += 1
+                return False
+            self._latest[coalesce_key] = (frame, now)
+            self._enforce_bound()
+            return was_empty
+
+    def drain(self):
+        """Remove and return pending frames as (reliable, telemetry) lists."""
+        with self._lock:
+            reliable = list(self._reliable)
+            telemetry = list(self._latest.values())
+            self._reliable.clear()
+            self._latest.clear()
+        if self.latency is not None:
+            now = time.perf_counter()
+            for _, queued_at in reliable:
+                self.latency.record("link.reliable_queue", (now - queued_at) * 1e6)
+            for _, queued_at in telemetry:
+                self.latency.record("telemetry.send_queue", (now - queued_at) * 1e6)
+        return [frame for frame, _ in reliable], [frame for frame, _ in telemetry]
+
+    def mark_sent(self, count=1):
+        with self._lock:
+            self.sent += count
+
+    def requeue(self, reliable, lost_telemetry=0):
+        """Put unsent reliable frames back at the front after a failed send."""
+        now = time.perf_counter()
+        with self._lock:
+            self._reliable.extendleft((frame, now) for frame in reversed(reliable))
+            self.requeued += len(reliable)
+            self.dropped += lost_telemetry
+            self._enforce_bound()
+
+    def stats(self):
+        """Snapshot of the queue counters."""
+        with self._lock:
+            return {
+                "pending": len(self._reliable) + len(self._latest),
+                "queued": self.queued,
+                "sent": self.sent,
+                "coalesced": self.coalesced,
+                "dropped": self.dropped,
+                "dropped_reliable": self.dropped_reliable,
+                "requeued": self.requeued,
+            }
+
+    def _enforce_bound(self):
+        # Backpressure: shed the oldest telemetry; control frames are not shed to make room.
+        while len(self._reliable) + len(self._latest) > self.max_size and self._latest:
+            self._latest.popitem(last=False)
+            self.dropped += 1
+        # Last resort for control frames: keep the newest max_reliable and flag the overflow.
+        if len(self._reliable) > self.max_reliable:
+            lost = len(self._reliable) - self.max_reliable
+            for _ in range(lost):
+                self._reliable.popleft()
+            self.dropped_reliable += lost
+            self.overflowed = True
+            log.error("❌ Send queue overflow: dropped %d control frame(s) (%d in total) past "
+                      "%d queued; link marked unhealthy", lost, self.dropped_reliable,
+                      self.max_reliable, extra=rate_key("send_queue_overflow"))
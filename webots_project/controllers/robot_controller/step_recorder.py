@@ -0,0 +1,181 @@
+"""
+S4 Remote Robot Management System - Step Recorder
+==================================================
+
+Append-only, fixed-record binary log of every robot's command, pose and
+battery on every simulation step, for offline replay and benchmarking
+(see webots_project/benchmarks/replay_recording.py).
+
+File layout (little-endian):
+
+    header (64 bytes)
+    0       4s       magic b"S4RC"
+    4       uint16   version (1)
+    6       uint16   record size (64)
+    8       uint32   basic timestep (ms)
+    12      uint16   robot count R
+    14      uint16   data offset (bytes from file start)
+    16      48x      reserved
+
+    robot table: R x 32 bytes, robot id (utf-8, NUL padded)
+    records from the data offset, 64 bytes each:
+
+    offset  type     field
+    0       uint32   step
+    4       uint16   robot index (into the robot table)
+    6       int8     command code (COMMAND_CODES, -1 = unknown)
+    7       uint8    moved this step (0/1)
+    8       uint32   command seq
+    12      uint16   command index inside its batch
+    14      2x       padding
+    16      float64  sim time (s)
+    24      float64  x       (pose at the start of the step)
+    32      float64  y
+    40      float64  z
+    48      float64  theta
+    56      float32  battery (%, after the step)
+    60      4x       padding
+
+Records are fixed-size and 64-byte aligned, so the file can be mmap'ed and
+indexed directly (RecordingReader; as_array() views it as a NumPy
+structured array without copying). A torn last record is ignored.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import mmap
+import struct
+
+# ============================================
+# FORMAT
+# ============================================
+
+RECORD_MAGIC = b"S4RC"
+RECORD_VERSION = 1
+HEADER_STRUCT = struct.Struct("<4sHHIHH48x")
+ROBOT_ID_SIZE = 32
+RECORD_STRUCT = struct.Struct("<IHbBIH2x5df4x")
+RECORD_FIELDS = ("step", "robot", "cmd", "moved", "seq", "index",
+                 "sim_time", "x", "y", "z", "theta", "battery")
+RECORD_FLUSH_EVERY = 256  # records buffered before a write
+
+# Same codes as batch_kinematics.py (plus goto and twist, which it does not simulate).
+# Only the code is stored, not a command's arguments (goto goal, twist velocities):
+# replay skips those steps
+COMMAND_CODES = {"stop": 0, "forward": 1, "backward": 2, "left": 3, "right": 4, "goto": 5,
+                 "twist": 6}
+COMMAND_NAMES = {code: name for name, code in COMMAND_CODES.items()}
+
+# NumPy view of one record (offsets match RECORD_STRUCT)
+NUMPY_RECORD_DTYPE = {
+    "names": list(RECORD_FIELDS),
+    "formats": ["<u4", "<u2", "i1", "u1", "<u4", "<u2",
+                "<f8", "<f8", "<f8", "<f8", "<f8", "<f4"],
+    "offsets": [0, 4, 6, 7, 8, 12, 16, 24, 32, 40, 48, 56],
+    "itemsize": RECORD_STRUCT.size,
+}
+
+
+def data_offset(robot_count):
+    """Start of the records: header + robot table, rounded up to a record boundary."""
+    size = HEADER_STRUCT.size + robot_count * ROBOT_ID_SIZE
+    return -(-size // RECORD_STRUCT.size) * RECORD_STRUCT.size
+
+# ============================================
+# WRITER
+# ============================================
+
+
+class StepRecorder:
+    """Buffered append-only writer of per-step robot records."""
+
+    def __init__(self, path, robot_ids, timestep):
+        self.path = path
+        self.robot_ids = list(robot_ids)
+        self.robot_index = {robot_id: i for i, robot_id in enumerate(self.robot_ids)}
+        self.timestep = timestep
+        self.count = 0
+        self._buffer = bytearray()
+        self._file = open(path, "wb")
+        offset = data_offset(len(self.robot_ids))
+        header = bytearray(offset)
+        HEADER_STRUCT.pack_into(header, 0, RECORD_MAGIC, RECORD_VERSION, RECORD_STRUCT.size,
+                                timestep, len(self.robot_ids), offset)
+        for i, robot_id in enumerate(self.robot_ids):
+            encoded = robot_id.encode("utf-8")[:ROBOT_ID_SIZE]
+            start = HEADER_STRUCT.size + i * ROBOT_ID_SIZE
+            header[start:start + len(encoded)] = encoded
+        self._file.write(header)
+
+    def record(self, step, sim_time, robot_id, command, command_seq, position, theta,
+               battery, moved):
+        """Append one robot's record for a step (command_seq = (seq, index) or None)."""
+        seq, index = command_seq if command_seq is not None else (0, 0)
+        self._buffer += RECORD_STRUCT.pack(
+            step, self.robot_index[robot_id], COMMAND_CODES.get(command, -1), int(moved),
+            seq or 0, index, sim_time, position[0], position[1], position[2], theta, battery)
+        self.count += 1
+        if len(self._buffer) >= RECORD_FLUSH_EVERY * RECORD_STRUCT.size:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+# ============================================
+# READER
+# ============================================
+
+
+class RecordingReader:
+    """Memory-mapped, random-access reader of a step recording."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size, self.timestep, robot_count, self.data_offset = \
+            HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != RECORD_MAGIC or version != RECORD_VERSION or record_size != RECORD_STRUCT.size:
+            raise ValueError(f"{path}: not a v{RECORD_VERSION} S4 step recording")
+        self.robot_ids = []
+        for i in range(robot_count):
+            start = HEADER_STRUCT.size + i * ROBOT_ID_SIZE
+            raw = self._mmap[start:start + ROBOT_ID_SIZE]
+            self.robot_ids.append(raw.rstrip(b"\0").decode("utf-8"))
+        self.count = (len(self._mmap) - self.data_offset) // RECORD_STRUCT.size
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, i):
+        """Record i as a dict (command decoded to its name, robot to its id)."""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        values = dict(zip(RECORD_FIELDS, RECORD_STRUCT.unpack_from(
+            self._mmap, self.data_offset + i * RECORD_STRUCT.size)))
+        values["robot"] = self.robot_ids[values["robot"]]
+        values["cmd"] = COMMAND_NAMES.get(values["cmd"], "unknown")
+        return values
+
+    def iter_raw(self):
+        """Iterate raw record tuples (RECORD_FIELDS order) straight from the mapping."""
+        end = self.data_offset + self.count * RECORD_STRUCT.size
+        return RECORD_STRUCT.iter_unpack(memoryview(self._mmap)[self.data_offset:end])
+
+    def as_array(self):
+        """Zero-copy NumPy structured array over all records (requires numpy)."""
+        import numpy as np
+        return np.frombuffer(self._mmap, dtype=np.dtype(NUMPY_RECORD_DTYPE),
+                             count=self.count, offset=self.data_offset)
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
@@ -0,0 +1,170 @@
+"""
+S4 Remote Robot Management System - Structured Logging
+=======================================================
+
+Logging layer for the controllers, built on the standard logging module.
+
+- levels: S4_LOG_LEVEL (DEBUG / INFO / WARNING / ...), default INFO
+- lazy formatting: log.info("📥 cmd #%s", seq) only formats records that pass
+  the level and rate-limit checks; guard expensive arguments with
+  log.isEnabledFor(logging.DEBUG)
+- per-key rate limiting: records logged with extra=rate_key("...") are let
+  through at most once per S4_LOG_RATE_LIMIT seconds per key; the next record
+  that passes reports how many were suppressed
+- async output: the sim thread only enqueues records (never blocks; records
+  are counted and dropped if the queue is full); a listener thread writes the
+  console and, with S4_LOG_FILE set, a JSON-lines file
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+LOG_LEVEL = os.environ.get("S4_LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.environ.get("S4_LOG_FILE", "")  # JSON-lines file, empty = console only
+LOG_RATE_LIMIT = float(os.environ.get("S4_LOG_RATE_LIMIT", "1.0"))  # seconds per key
+LOG_QUEUE_SIZE = 10000
+
+ROOT_LOGGER = "s4"
+# Record attributes copied into JSON lines when present
+JSON_FIELDS = ("rate_key", "suppressed", "robot_id", "step")
+
+_listener = None
+
+# ============================================
+# FILTERS AND FORMATTERS
+# ============================================
+
+
+def rate_key(key, **fields):
+    """extra= dict for a rate-limited record (extra fields end up in JSON lines)."""
+    fields["rate_key"] = key
+    return fields
+
+
+class RateLimitFilter(logging.Filter):
+    """Let at most one record per rate_key through every `interval` seconds."""
+
+    def __init__(self, interval=LOG_RATE_LIMIT):
+        super().__init__()
+        self.interval = interval
+        self._last = {}
+        self._suppressed = {}
+
+    def filter(self, record):
+        key = getattr(record, "rate_key", None)
+        if key is None or self.interval <= 0:
+            return True
+        now = time.monotonic()
+        last = self._last.get(key)
+        if last is not None and now - last < self.interval:
+            self._suppressed[key] = self._suppressed.get(key, 0) + 1
+            return False
+        self._last[key] = now
+        record.suppressed = self._suppressed.pop(key, 0)
+        return True
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Plain message (same look as the old print output) plus a suppressed count."""
+
+    def format(self, record):
+        message = super().format(record)
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            message += f" (+{suppressed} suppressed)"
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per record: ts, level, logger, msg and known extra fields."""
+
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for field in JSON_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records instead of blocking when full."""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+# ============================================
+# SETUP
+# ============================================
+
+
+def get_logger(name):
+    """Logger under the s4 hierarchy (configure_logging sets up its output)."""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def configure_logging(level=LOG_LEVEL, json_path=LOG_FILE, rate_limit=LOG_RATE_LIMIT,
+                      console=True):
+    """Install the rate-limited async handler on the s4 logger (idempotent)."""
+    global _listener
+    root = logging.getLogger(ROOT_LOGGER)
+    if _listener is not None:
+        return root
+    root.setLevel(level)
+    root.propagate = False
+
+    handlers = []
+    if console:
+        stream = logging.StreamHandler(sys.stdout)
+        stream.setFormatter(ConsoleFormatter("%(message)s"))
+        handlers.append(stream)
+    if json_path:
+        file_handler = logging.FileHandler(json_path, encoding="utf-8")
+        file_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(file_handler)
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+    queue_handler.addFilter(RateLimitFilter(rate_limit))
+    root.addHandler(queue_handler)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, *handlers,
+                                               respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return root
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+        logging.getLogger(ROOT_LOGGER).handlers.clear()
@@ -0,0 +1,255 @@
+"""
+S4 Remote Robot Management System - Telemetry Encodings
+========================================================
+
+Wire encodings for telemetry frames.
+
+- "json":      the default text frame built by create_telemetry()
+- "binary-v2": fixed-layout little-endian struct, opt-in, negotiated with the
+               backend through a hello / hello_ack exchange at connect time
+
+binary-v2 layout (52 bytes + robot id):
+
+    offset  type     field
+    0       2s       magic b"S4"
+    2       uint8    version (2)
+    3       uint8    frame type (1 = telemetry)
+    4       float32  pose.x
+    8       float32  pose.y
+    12      float32  pose.theta
+    16      float32  speed
+    20      float32  battery
+    24      uint32   cycle
+    28      uint64   timestamp (ms)
+    36      uint32   step
+    40      float64  simTime (s)
+    48      uint32   timeToEmpty (s, 0xFFFFFFFF = null)
+    52      uint8    robot id length N
+    53      N bytes  robot id (utf-8)
+
+binary-v1 (version 1) is the same frame without step / simTime /
+timeToEmpty and the robot id length at offset 36.
+
+binary-v2 has no slot for the variable-length contacts list (collision
+layer): a frame with contacts is sent as JSON instead, whatever the
+negotiated encoding. An empty list is simply left out of the binary frame.
+Controllers only send v2; v1 frames from older controllers are still
+decoded. backend/utils/telemetry-codec.js decodes the same layouts.
+
+Delta mode (DeltaEncoder) sits on top of either encoding: every
+KEYFRAME_INTERVAL-th frame is a full keyframe, frames in between are JSON
+"telemetry_delta" messages carrying only the fields that moved beyond their
+quantization threshold since the last sent value, and unchanged frames are
+not sent at all. The backend router merges deltas into the last full state.
+
+The encoder's baseline moves as soon as it builds a frame, so a delta that
+never reaches the backend leaves it with stale values. Coalescing does not
+lose deltas: keyframes and deltas of a robot share one slot in the send
+queue, and merge_telemetry_frames folds a newer delta into whatever frame is
+still waiting there. The queue can still shed a frame (when full, or when a
+send fails); the controller then forces a keyframe, which resynchronises the
+backend.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+import struct
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+ENCODING_JSON = "json"
+ENCODING_BINARY = "binary-v2"
+ENCODING_BINARY_V1 = "binary-v1"  # decode only (older controllers)
+SUPPORTED_ENCODINGS = (ENCODING_BINARY, ENCODING_JSON)
+
+BINARY_MAGIC = b"S4"
+BINARY_VERSION = 2
+FRAME_TELEMETRY = 1
+
+TELEMETRY_STRUCT = struct.Struct("<2sBBfffffIQIdI")
+TIME_TO_EMPTY_NONE = 0xFFFFFFFF  # binary-v2 timeToEmpty when unknown (idle)
+TELEMETRY_STRUCT_V1 = struct.Struct("<2sBBfffffIQ")
+
+KEYFRAME_INTERVAL = 25  # frames between full keyframes in delta mode
+DELTA_THRESHOLDS = {
+    "x": 0.001,       # m
+    "y": 0.001,       # m
+    "theta": 0.001,   # rad
+    "speed": 0.001,   # m/s
+    "battery": 0.1,   # %
+    "timeToEmpty": 60,  # s
+    "contacts": None,   # list, sent whenever it changes
+}
+POSE_FIELDS = ("x", "y", "theta")
+TRACE_FIELDS = ("step", "simTime")  # copied into every delta so the timeline stays intact
+
+# ============================================
+# ENCODERS
+# ============================================
+
+
+def pack_telemetry(robot_id, x, y, theta, speed, battery, cycle, timestamp, step, sim_time,
+                   time_to_empty=None):
+    """Pack telemetry fields into a binary-v2 frame."""
+    rid = robot_id.encode("utf-8")[:255]
+    tte = TIME_TO_EMPTY_NONE if time_to_empty is None else \
+        min(max(int(time_to_empty), 0), TIME_TO_EMPTY_NONE - 1)
+    return TELEMETRY_STRUCT.pack(
+        BINARY_MAGIC, BINARY_VERSION, FRAME_TELEMETRY,
+        x, y, theta, speed, battery, cycle, timestamp, step, sim_time, tte
+    ) + bytes((len(rid),)) + rid
+
+
+def unpack_telemetry(frame):
+    """Decode a binary-v2 (or binary-v1) frame back into the JSON telemetry shape."""
+    magic, version, frame_type = frame[:2], frame[2], frame[3]
+    if magic != BINARY_MAGIC or version not in (1, BINARY_VERSION) or frame_type != FRAME_TELEMETRY:
+        raise ValueError("Not a binary telemetry frame")
+    layout = TELEMETRY_STRUCT if version == BINARY_VERSION else TELEMETRY_STRUCT_V1
+    values = layout.unpack_from(frame)
+    x, y, theta, speed, battery, cycle, timestamp = values[3:10]
+    rid_len = frame[layout.size]
+    rid_start = layout.size + 1
+    telemetry = {
+        "type": "telemetry",
+        "robotId": frame[rid_start:rid_start + rid_len].decode("utf-8"),
+        "pose": {"x": round(x, 3), "y": round(y, 3), "theta": round(theta, 4)},
+        "speed": round(speed, 3),
+        "battery": round(battery, 1),
+        "cycle": cycle,
+        "timestamp": timestamp,
+    }
+    if version == BINARY_VERSION:
+        telemetry["step"] = values[10]
+        telemetry["simTime"] = round(values[11], 3)
+        telemetry["timeToEmpty"] = None if values[12] == TIME_TO_EMPTY_NONE else values[12]
+    return telemetry
+
+
+def encode_telemetry(telemetry, encoding=ENCODING_JSON):
+    """Encode a telemetry dict (as built by create_telemetry) for the wire."""
+    if encoding == ENCODING_BINARY and not telemetry.get("contacts"):
+        pose = telemetry["pose"]
+        return pack_telemetry(telemetry.get("robotId", ""), pose["x"], pose["y"], pose["theta"],
+                              telemetry["speed"], telemetry["battery"],
+                              telemetry["cycle"], telemetry["timestamp"],
+                              telemetry.get("step", 0), telemetry.get("simTime", 0.0),
+                              telemetry.get("timeToEmpty"))
+    return json.dumps(telemetry)
+
+
+# ============================================
+# DELTA ENCODING
+# ============================================
+
+
+def field_changed(value, previous, threshold):
+    """True if a field moved by at least its threshold (or became / stopped being None).
+
+    Fields without a threshold (lists) change on any difference.
+    """
+    if threshold is None:
+        return value != previous
+    if value is None or previous is None:
+        return value is not previous
+    return abs(value - previous) >= threshold - 1e-9
+
+
+class DeltaEncoder:
+    """Per-robot delta/keyframe telemetry encoder."""
+
+    def __init__(self, keyframe_interval=KEYFRAME_INTERVAL, thresholds=None):
+        self.keyframe_interval = keyframe_interval
+        self.thresholds = dict(DELTA_THRESHOLDS)
+        if thresholds:
+            self.thresholds.update(thresholds)
+        self.baseline = None  # last sent value per field
+        self.frames_since_keyframe = 0
+        self.keyframes = 0
+        self.deltas = 0
+        self.suppressed = 0
+
+    def force_keyframe(self):
+        """Make the next frame a keyframe (e.g. when the backend lost our state)."""
+        self.baseline = None
+
+    def encode(self, telemetry):
+        """
+        Return (frame, is_keyframe) for a full telemetry dict.
+
+        frame is the telemetry itself for keyframes, a partial
+        "telemetry_delta" dict for changes, or None if nothing changed.
+        """
+        values = dict(telemetry["pose"])
+        values["speed"] = telemetry["speed"]
+        values["battery"] = telemetry["battery"]
+        if "timeToEmpty" in telemetry:
+            values["timeToEmpty"] = telemetry["timeToEmpty"]  # may be None
+        if "contacts" in telemetry:
+            values["contacts"] = telemetry["contacts"]
+
+        if self.baseline is None or self.frames_since_keyframe + 1 >= self.keyframe_interval:
+            self.baseline = values
+            self.frames_since_keyframe = 0
+            self.keyframes += 1
+            return telemetry, True
+
+        self.frames_since_keyframe += 1
+        changed = {
+            field: value for field, value in values.items()
+            if field_changed(value, self.baseline.get(field), self.thresholds[field])
+        }
+        if not changed:
+            self.suppressed += 1
+            return None, False
+
+        self.baseline.update(changed)
+        self.deltas += 1
+        delta = {
+            "type": "telemetry_delta",
+            "robotId": telemetry.get("robotId"),
+            "cycle": telemetry["cycle"],
+            "timestamp": telemetry["timestamp"],
+        }
+        for field in TRACE_FIELDS:
+            if field in telemetry:
+                delta[field] = telemetry[field]
+        pose = {field: changed.pop(field) for field in POSE_FIELDS if field in changed}
+        if pose:
+            delta["pose"] = pose
+        delta.update(changed)
+        return delta, False
+
+
+def _parse_frame(frame):
+    """Telemetry dict of a queued frame (JSON text or binary)."""
+    if isinstance(frame, (bytes, bytearray)):
+        return unpack_telemetry(frame), ENCODING_BINARY
+    return json.loads(frame), ENCODING_JSON
+
+
+def merge_telemetry_frames(older, newer):
+    """
+    Frame to queue when `newer` coalesces with a still unsent `older` frame.
+
+    A keyframe replaces whatever was pending. A delta is folded into the
+    pending frame (delta into delta, or delta into keyframe, which stays a
+    keyframe in its encoding), so no field the older frame carried is lost.
+    """
+    delta, _ = _parse_frame(newer)
+    if delta.get("type") != "telemetry_delta":
+        return newer
+    merged, encoding = _parse_frame(older)
+    pose = dict(merged.get("pose", {}))
+    pose.update(delta.pop("pose", {}))
+    delta.pop("type")
+    merged.update(delta)
+    if pose:
+        merged["pose"] = pose
+    if merged.get("type") == "telemetry_delta":
+        return json.dumps(merged)
+    return encode_telemetry(merged, encoding)
@@ -0,0 +1,85 @@
+"""
+S4 Remote Robot Management System - Adaptive Telemetry Scheduler
+=================================================================
+
+Decides on which simulation steps a robot sends telemetry.
+
+- while moving (forward/backward/left/right): MOVING_HZ, for smooth paths
+- while stopped: a slow IDLE_HZ heartbeat
+- a frame is sent immediately when the robot starts or stops moving
+- both rates are clamped to [min_hz, max_hz], which can be changed at
+  runtime (telemetry_rate / config messages)
+
+With adaptive=False it behaves like the old fixed TELEMETRY_INTERVAL.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+MOVING_HZ = 20.0  # telemetry rate while executing a movement command
+IDLE_HZ = 1.0     # heartbeat rate while stopped
+MIN_HZ = 0.2
+MAX_HZ = 50.0
+
+TIME_EPSILON = 1e-9  # tolerate float error in sim-time differences
+
+# ============================================
+# SCHEDULER
+# ============================================
+
+
+class TelemetryScheduler:
+    """Per-robot telemetry cadence driven by sim time and motion state."""
+
+    def __init__(self, moving_hz=MOVING_HZ, idle_hz=IDLE_HZ, min_hz=MIN_HZ, max_hz=MAX_HZ,
+                 adaptive=True):
+        self.moving_hz = moving_hz
+        self.idle_hz = idle_hz
+        self.min_hz = min_hz
+        self.max_hz = max_hz
+        self.adaptive = adaptive
+        self.last_time = None
+        self.was_moving = False
+
+    def set_limits(self, min_hz=None, max_hz=None):
+        """
+        Change the allowed rate band (None keeps the current value).
+
+        The band is validated before it is applied, so a bad request (e.g.
+        straight from the wire) raises ValueError and leaves the old band.
+        """
+        new_min = self.min_hz if min_hz is None else float(min_hz)
+        new_max = self.max_hz if max_hz is None else float(max_hz)
+        if not 0 < new_min <= new_max:
+            raise ValueError(f"invalid telemetry rate band: min_hz {new_min}, max_hz {new_max}")
+        self.min_hz, self.max_hz = new_min, new_max
+
+    def set_rates(self, moving_hz=None, idle_hz=None):
+        """Change the target moving / idle rates (None keeps the current value)."""
+        if moving_hz is not None:
+            self.moving_hz = float(moving_hz)
+        if idle_hz is not None:
+            self.idle_hz = float(idle_hz)
+
+    def set_interval(self, interval):
+        """Fixed-rate mode: one frame every `interval` seconds regardless of motion."""
+        self.moving_hz = self.idle_hz = 1.0 / interval
+
+    def current_hz(self, is_moving):
+        """Target rate for the given motion state, clamped to [min_hz, max_hz]."""
+        hz = self.moving_hz if (is_moving or not self.adaptive) else self.idle_hz
+        return max(self.min_hz, min(self.max_hz, hz))
+
+    def due(self, now, is_moving):
+        """Return True if a telemetry frame should be sent at sim time `now`."""
+        changed = self.adaptive and is_moving != self.was_moving
+        self.was_moving = is_moving
+        if (self.last_time is None or changed or
+                now - self.last_time >= 1.0 / self.current_hz(is_moving) - TIME_EPSILON):
+            self.last_time = now
+            return True
+        return False
@@ -0,0 +1,200 @@
+"""
+S4 Remote Robot Management System - Trajectory Ring Buffer
+===========================================================
+
+Fixed-size, memory-mapped ring buffer of a robot's pose history
+(sim_time, x, y, theta, battery, cmd), one file per robot. The controller
+appends one record per step; other local processes open the same file
+read-only and read time windows of it without copying the ring.
+
+File layout (little-endian):
+
+    header (64 bytes)
+    0       4s       magic b"S4RB"
+    4       uint16   version (1)
+    6       uint16   record size (32)
+    8       uint32   capacity (records)
+    16      uint64   write count (total records ever appended)
+    24      40x      reserved
+
+    records: capacity x 32 bytes, record i at 64 + (i % capacity) * 32
+    0       float64  sim time (s)
+    8       float32  x
+    12      float32  y
+    16      float32  theta
+    20      float32  battery (%)
+    24      int8     command code (step_recorder.COMMAND_CODES, -1 = unknown)
+    25      7x       padding
+
+The write count is updated after the record is written, so a reader only
+sees complete records; window() re-checks it afterwards and retries if the
+writer lapped the part of the ring it was reading.
+
+Put the files on tmpfs (e.g. S4_HISTORY_DIR=/dev/shm/s4) to keep them in
+shared memory. Writing needs only the standard library; reading windows
+requires numpy.
+
+Usage (read from another process):
+    python trajectory_ring.py /dev/shm/s4/ROBOT.ring [seconds] [points]
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+
+from step_recorder import COMMAND_CODES, COMMAND_NAMES
+
+# ============================================
+# FORMAT
+# ============================================
+
+RING_MAGIC = b"S4RB"
+RING_VERSION = 1
+HEADER_STRUCT = struct.Struct("<4sHHIxxxxQ40x")
+COUNT_STRUCT = struct.Struct("<Q")
+COUNT_OFFSET = 16
+RECORD_STRUCT = struct.Struct("<dffffb7x")
+RING_CAPACITY = 262144  # records per robot (~4.6 h at a 64 ms step)
+READ_RETRIES = 3
+
+NUMPY_RECORD_DTYPE = {
+    "names": ["sim_time", "x", "y", "theta", "battery", "cmd"],
+    "formats": ["<f8", "<f4", "<f4", "<f4", "<f4", "i1"],
+    "offsets": [0, 8, 12, 16, 20, 24],
+    "itemsize": RECORD_STRUCT.size,
+}
+
+# ============================================
+# RING BUFFER
+# ============================================
+
+
+class TrajectoryRing:
+    """mmap-backed pose history ring (writer: create(), readers: open())."""
+
+    def __init__(self, path, writable=False):
+        self.path = path
+        self._file = open(path, "r+b" if writable else "rb")
+        access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+        magic, version, record_size, self.capacity, _ = HEADER_STRUCT.unpack_from(self._mmap, 0)
+        if magic != RING_MAGIC or version != RING_VERSION or record_size != RECORD_STRUCT.size:
+            raise ValueError(f"{path}: not a v{RING_VERSION} S4 trajectory ring")
+        self._count = self.write_count()
+
+    @classmethod
+    def create(cls, path, capacity=RING_CAPACITY):
+        """Create (or truncate) a ring file and open it for writing."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(HEADER_STRUCT.pack(RING_MAGIC, RING_VERSION, RECORD_STRUCT.size, capacity, 0))
+            f.truncate(HEADER_STRUCT.size + capacity * RECORD_STRUCT.size)
+        return cls(path, writable=True)
+
+    @classmethod
+    def open(cls, path):
+        """Open an existing ring read-only (safe while the controller writes)."""
+        return cls(path)
+
+    def write_count(self):
+        """Total records ever appended (the newest is write_count() - 1)."""
+        return COUNT_STRUCT.unpack_from(self._mmap, COUNT_OFFSET)[0]
+
+    def __len__(self):
+        return min(self.write_count(), self.capacity)
+
+    # --- Writer --------------------------------------------------------------------
+
+    def append(self, sim_time, x, y, theta, battery, command):
+        """Write one record, then publish it by bumping the write count."""
+        offset = HEADER_STRUCT.size + (self._count % self.capacity) * RECORD_STRUCT.size
+        RECORD_STRUCT.pack_into(self._mmap, offset, sim_time, x, y, theta, battery,
+                                COMMAND_CODES.get(command, -1))
+        self._count += 1
+        COUNT_STRUCT.pack_into(self._mmap, COUNT_OFFSET, self._count)
+
+    # --- Readers -------------------------------------------------------------------
+
+    def view(self):
+        """Zero-copy NumPy view of the raw ring (physical order, requires numpy)."""
+        import numpy as np
+        return np.frombuffer(self._mmap, dtype=np.dtype(NUMPY_RECORD_DTYPE),
+                             count=self.capacity, offset=HEADER_STRUCT.size)
+
+    def window(self, seconds=None, points=None):
+        """
+        Chronological records covering the last `seconds` of sim time (all if None),
+        downsampled to at most `points` evenly spaced records (newest always kept).
+
+        Only the selected records are gathered out of the mapping, so the cost
+        depends on `points`, not on the ring size.
+        """
+        import numpy as np
+        ring = self.view()
+        for _ in range(READ_RETRIES):
+            count = self.write_count()
+            size = min(count, self.capacity)
+            if size == 0:
+                return ring[:0].copy()
+            oldest = count - size  # logical index of the oldest record still in the ring
+
+            def physical(logical):
+                return np.asarray(logical) % self.capacity
+
+            first = oldest
+            if seconds is not None:
+                newest_time = ring["sim_time"][physical(count - 1)]
+                # Binary search over logical positions (sim time increases with them)
+                lo, hi = oldest, count - 1
+                while lo < hi:
+                    mid = (lo + hi) // 2
+                    if ring["sim_time"][physical(mid)] < newest_time - seconds:
+                        lo = mid + 1
+                    else:
+                        hi = mid
+                first = lo
+
+            logical = np.arange(first, count)
+            if points is not None and len(logical) > points:
+                # Spaced back from the newest record, so it is kept even for points=1
+                picks = np.linspace(len(logical) - 1, 0, points).round().astype(np.int64)
+                logical = logical[picks[::-1]]
+            result = ring[physical(logical)]  # fancy indexing gathers just these records
+
+            # Valid only if the writer did not lap the oldest record we read
+            if self.write_count() - self.capacity <= first:
+                return result
+        raise RuntimeError(f"{self.path}: writer kept overwriting the requested window")
+
+    def close(self):
+        self._mmap.close()
+        self._file.close()
+
+
+def window_to_json(records):
+    """Records from window() as a list of plain dicts (command decoded)."""
+    return [{
+        "simTime": round(float(r["sim_time"]), 3),
+        "x": round(float(r["x"]), 3),
+        "y": round(float(r["y"]), 3),
+        "theta": round(float(r["theta"]), 4),
+        "battery": round(float(r["battery"]), 1),
+        "cmd": COMMAND_NAMES.get(int(r["cmd"]), "unknown"),
+    } for r in records]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    ring = TrajectoryRing.open(sys.argv[1])
+    window_seconds = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    window_points = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    print(json.dumps(window_to_json(ring.window(window_seconds, window_points))))
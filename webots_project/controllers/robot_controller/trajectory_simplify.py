@@ -0,0 +1,159 @@
+"""
+S4 Remote Robot Management System - Trajectory Simplification
+==============================================================
+
+Robot-side path simplification, so frontends receive and draw a handful of
+vertices instead of one point per telemetry frame.
+
+- rdp(): iterative Ramer–Douglas–Peucker on (t, x, y) points; keeps the
+  vertices that deviate more than `tolerance` metres from the simplified line
+- time_buckets(): keeps the last point of every bucket of `seconds`
+- PathSimplifier: streaming per-robot stage. Poses are collected into a
+  pending segment; when it is full (or the robot stops) the segment is
+  simplified with the broadcast tolerance and returned for sending as a
+  "path_segment" message. The same segment is also simplified at every
+  level-of-detail tolerance and appended to that level's bounded history, so
+  a "path_request" for any zoom level is answered without re-simplifying.
+
+Consecutive segments share their boundary point, so they join seamlessly.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import collections
+import math
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+PATH_TOLERANCE = 0.01           # m, tolerance of broadcast path segments
+SEGMENT_POINTS = 64             # raw poses per segment before it is simplified
+LOD_TOLERANCES = (0.005, 0.02, 0.1, 0.5)  # m, level 0 = finest
+LOD_CAPACITY = 20000            # simplified points kept per level
+
+# ============================================
+# ALGORITHMS
+# ============================================
+
+
+def _distance_to_segment(p, a, b):
+    """Distance from point p to the segment a-b (x, y at indices 1, 2)."""
+    dx, dy = b[1] - a[1], b[2] - a[2]
+    length_sq = dx * dx + dy * dy
+    if length_sq == 0.0:
+        return math.hypot(p[1] - a[1], p[2] - a[2])
+    t = max(0.0, min(1.0, ((p[1] - a[1]) * dx + (p[2] - a[2]) * dy) / length_sq))
+    return math.hypot(p[1] - (a[1] + t * dx), p[2] - (a[2] + t * dy))
+
+
+def rdp(points, tolerance):
+    """Ramer–Douglas–Peucker simplification of [(t, x, y), ...] (iterative, endpoints kept)."""
+    if len(points) < 3:
+        return list(points)
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        first, last = stack.pop()
+        worst, worst_index = -1.0, None
+        for i in range(first + 1, last):
+            d = _distance_to_segment(points[i], points[first], points[last])
+            if d > worst:
+                worst, worst_index = d, i
+        if worst_index is not None and worst > tolerance:
+            keep[worst_index] = True
+            stack.append((first, worst_index))
+            stack.append((worst_index, last))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def time_buckets(points, seconds):
+    """Keep the last point of each `seconds`-wide time bucket (first point always kept)."""
+    if not points:
+        return []
+    last = {}
+    for p in points:
+        last[math.floor(p[0] / seconds)] = p
+    result = list(last.values())
+    if result[0] is not points[0]:
+        result.insert(0, points[0])
+    return result
+
+# ============================================
+# STREAMING SIMPLIFIER
+# ============================================
+
+
+class PathSimplifier:
+    """Per-robot streaming path simplifier with level-of-detail history."""
+
+    def __init__(self, tolerance=PATH_TOLERANCE, segment_points=SEGMENT_POINTS,
+                 lod_tolerances=LOD_TOLERANCES, lod_capacity=LOD_CAPACITY):
+        self.tolerance = tolerance
+        self.segment_points = segment_points
+        self.lod_tolerances = tuple(lod_tolerances)
+        self.levels = [collections.deque(maxlen=lod_capacity) for _ in self.lod_tolerances]
+        self.pending = []
+        self.segments = 0
+        self.raw_points = 0
+        self.sent_points = 0
+
+    def add(self, t, x, y):
+        """Add a pose; returns a simplified segment when one is complete, else None."""
+        self.pending.append((t, x, y))
+        self.raw_points += 1
+        if len(self.pending) >= self.segment_points:
+            return self.flush()
+        return None
+
+    def flush(self):
+        """Simplify the pending segment now (e.g. when the robot stops); None if empty."""
+        if len(self.pending) < 2:
+            return None
+        segment = self.pending
+        for tolerance, level in zip(self.lod_tolerances, self.levels):
+            simplified = rdp(segment, tolerance)
+            if level and level[-1] == simplified[0]:
+                simplified = simplified[1:]  # boundary point already stored
+            level.extend(simplified)
+        points = rdp(segment, self.tolerance)
+        self.pending = [segment[-1]]  # next segment starts where this one ended
+        self.segments += 1
+        self.sent_points += len(points)
+        return points
+
+    def level_for(self, tolerance=None, level=None):
+        """Pick a LOD level by index or by the coarsest tolerance not above `tolerance`."""
+        if level is not None:
+            return max(0, min(len(self.levels) - 1, int(level)))
+        if tolerance is None:
+            return 0
+        chosen = 0
+        for i, level_tolerance in enumerate(self.lod_tolerances):
+            if level_tolerance <= tolerance:
+                chosen = i
+        return chosen
+
+    def history(self, level=0, since=None, max_points=None, bucket_seconds=None):
+        """
+        Simplified history of one LOD level, optionally from sim time `since`
+        and thinned to one point per `bucket_seconds`.
+
+        If it has more than max_points points, coarser levels are tried first,
+        then the result is thinned with an even stride. Returns (level, points).
+        """
+        while True:
+            points = [p for p in self.levels[level] if since is None or p[0] >= since]
+            tail = self.pending[1:] if self.levels[level] else self.pending  # not yet simplified
+            points += [p for p in tail if since is None or p[0] >= since]
+            if bucket_seconds:
+                points = time_buckets(points, bucket_seconds)
+            if max_points is None or len(points) <= max_points or level == len(self.levels) - 1:
+                break
+            level += 1
+        if max_points is not None and len(points) > max_points > 1:
+            step = (len(points) - 1) / (max_points - 1)
+            points = [points[round(i * step)] for i in range(max_points)]
+        return level, points
@@ -0,0 +1,203 @@
+"""
+S4 Remote Robot Management System - Asyncio WebSocket Transport
+================================================================
+
+Backend connection used by the Supervisor controllers.
+
+One background thread runs a single asyncio event loop that owns the
+WebSocket. The simulation thread never blocks on the network:
+- start() returns immediately; connecting happens on the loop thread
+- reconnects use exponential backoff with jitter, entirely off the sim thread
+- outbound frames go through a bounded OutboundQueue (send_queue.py) that
+  coalesces stale telemetry and keeps control frames (up to a last-resort
+  cap; overflowing it marks the link unhealthy); the loop thread drains it
+  and is woken with call_soon_threadsafe only when it was empty
+- inbound frames land in a thread-safe queue that the sim loop drains
+  once per step with poll()
+
+Requires: websockets
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import asyncio
+import queue
+import random
+import threading
+
+import websockets
+
+from send_queue import OutboundQueue, SEND_QUEUE_SIZE
+from structured_log import get_logger, rate_key
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+RECONNECT_INITIAL_DELAY = 0.5  # seconds
+RECONNECT_MAX_DELAY = 30.0     # seconds
+OPEN_TIMEOUT = 5.0             # seconds
+
+log = get_logger("transport")
+
+# ============================================
+# TRANSPORT
+# ============================================
+
+
+class AsyncTransport:
+    """Non-blocking WebSocket client running on its own asyncio loop thread."""
+
+    def __init__(self, url, initial_delay=RECONNECT_INITIAL_DELAY, max_delay=RECONNECT_MAX_DELAY,
+                 queue_size=SEND_QUEUE_SIZE, latency=None):
+        self.url = url
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.inbox = queue.Queue()  # messages received, drained by the sim thread
+        self.outbox = OutboundQueue(queue_size, latency)  # frames to send, drained by the loop thread
+        self.connected = False
+        self.connect_count = 0
+        self.hello = None  # optional frame sent first on every (re)connect
+        self._loop = None
+        self._thread = None
+        self._wakeup = None
+        self._stopping = None
+
+    # --- Sim-thread API ---------------------------------------------------------
+
+    def start(self):
+        """Start the event loop thread (idempotent, never blocks)."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="s4-transport", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Ask the loop thread to close the socket and exit."""
+        if self._loop is not None and self._stopping is not None:
+            self._loop.call_soon_threadsafe(self._stopping.set)
+
+    def send(self, message, coalesce_key=None, merge=None):
+        """
+        Queue a frame for sending (never blocks).
+
+        Frames with a coalesce_key (telemetry) replace an older queued frame
+        with the same key (or are merged into it, see OutboundQueue.put);
+        frames without one are delivered reliably, also across reconnects.
+        """
+        if self.outbox.put(message, coalesce_key, merge) and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    def stats(self):
+        """Link counters: queue state plus connection info."""
+        stats = self.outbox.stats()
+        stats["connected"] = self.connected
+        stats["connects"] = self.connect_count
+        stats["healthy"] = self.healthy
+        return stats
+
+    @property
+    def healthy(self):
+        """Connected, and no control frame was ever lost to a send-queue overflow."""
+        return self.connected and not self.outbox.overflowed
+
+    def poll(self, timeout=None):
+        """
+        Return all messages received since the last call.
+
+        Non-blocking by default; with a timeout, waits up to that many seconds
+        for the first message when none is queued.
+        """
+        messages = []
+        if timeout is not None:
+            try:
+                messages.append(self.inbox.get(timeout=timeout))
+            except queue.Empty:
+                return messages
+        while True:
+            try:
+                messages.append(self.inbox.get_nowait())
+            except queue.Empty:
+                return messages
+
+    # --- Loop thread --------------------------------------------------------------
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._loop.run_until_complete(self._connect_forever())
+
+    async def _connect_forever(self):
+        attempt = 0
+        while not self._stopping.is_set():
+            try:
+                log.info("🔄 Connecting to %s...", self.url, extra=rate_key("connect"))
+                async with websockets.connect(self.url, open_timeout=OPEN_TIMEOUT) as ws:
+                    attempt = 0
+                    self.connect_count += 1
+                    self.connected = True
+                    log.info("✅ Connected to backend at %s", self.url)
+                    await self._serve(ws)
+                    log.info("🔌 WebSocket connection closed (code: %s)", ws.close_code)
+            except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+                log.warning("❌ WebSocket error: %s", e, extra=rate_key("connect_error"))
+            finally:
+                self.connected = False
+
+            if self._stopping.is_set():
+                break
+            delay = min(self.max_delay, self.initial_delay * (2 ** attempt))
+            delay *= random.uniform(0.5, 1.0)
+            attempt += 1
+            log.info("🔄 Reconnecting in %.1fs...", delay, extra=rate_key("reconnect"))
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _serve(self, ws):
+        """Pump frames both ways until the socket closes or stop() is called."""
+        if self.hello is not None:
+            await ws.send(self.hello)
+        self._wakeup.set()  # flush anything queued while disconnected
+        reader = asyncio.ensure_future(self._reader(ws))
+        writer = asyncio.ensure_future(self._writer(ws))
+        stopper = asyncio.ensure_future(self._stopping.wait())
+        done, pending = await asyncio.wait({reader, writer, stopper},
+                                           return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            if task is not stopper and task.exception() is not None:
+                raise task.exception()
+
+    async def _reader(self, ws):
+        async for message in ws:
+            self.inbox.put(message)
+
+    async def _writer(self, ws):
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            reliable, telemetry = self.outbox.drain()
+            sent = 0
+            try:
+                for frame in reliable:
+                    await ws.send(frame)
+                    sent += 1
+                for frame in telemetry:
+                    await ws.send(frame)
+                    sent += 1
+            except BaseException:
+                # Keep undelivered control frames for the next connection
+                unsent = reliable[sent:]
+                lost = len(telemetry) - max(0, sent - len(reliable))
+                self.outbox.requeue(unsent, lost)
+                self._wakeup.set()
+                raise
+            finally:
+                self.outbox.mark_sent(sent)
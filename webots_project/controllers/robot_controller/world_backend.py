@@ -0,0 +1,228 @@
+"""
+S4 Remote Robot Management System - World Backends
+===================================================
+
+Pluggable "world backend" for the Supervisor controllers.
+
+The controllers only use a small slice of the Webots Supervisor API:
+- supervisor.step / getTime / getBasicTimeStep / getSelf / getFromDef / getDevice /
+  getWorldPath
+- node.getPosition / getOrientation / getField
+- field.setSFVec3f / setSFRotation (and the matching getters)
+- gps.getValues / compass.getValues
+
+This module provides that slice in two flavours:
+- "webots":   the real controller.Supervisor (default)
+- "headless": a pure-Python kinematic world that never sleeps, so the
+              control loop, telemetry and battery model can be run and
+              profiled on a plain Linux box faster than real time
+
+Select the backend with the S4_WORLD_BACKEND environment variable.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+import os
+
+# ============================================
+# CONFIGURATION
+# ============================================
+
+WORLD_BACKEND = os.environ.get("S4_WORLD_BACKEND", "webots")
+HEADLESS_TIMESTEP = int(os.environ.get("S4_HEADLESS_TIMESTEP", "64"))  # ms
+HEADLESS_MAX_STEPS = int(os.environ.get("S4_HEADLESS_MAX_STEPS", "0"))  # 0 = run forever
+HEADLESS_SELF_DEF = "ROBOT"
+HEADLESS_START_TRANSLATION = [0.0, 0.0, 0.1]  # same as DEF ROBOT in robot_world.wbt
+# World whose layout the headless world stands in for (occupancy grid for goto)
+HEADLESS_WORLD_FILE = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "worlds", "robot_world.wbt"))
+
+# ============================================
+# HEADLESS WORLD
+# ============================================
+
+
+def rotation_to_matrix(rotation):
+    """Convert an axis-angle rotation [x, y, z, angle] to a flat 3x3 matrix (row-major)."""
+    ax, ay, az, angle = rotation
+    norm = math.sqrt(ax * ax + ay * ay + az * az)
+    if norm == 0.0:
+        return [1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0]
+    ax, ay, az = ax / norm, ay / norm, az / norm
+    c = math.cos(angle)
+    s = math.sin(angle)
+    t = 1.0 - c
+    return [
+        t * ax * ax + c,      t * ax * ay - s * az, t * ax * az + s * ay,
+        t * ax * ay + s * az, t * ay * ay + c,      t * ay * az - s * ax,
+        t * ax * az - s * ay, t * ay * az + s * ax, t * az * az + c,
+    ]
+
+
+class HeadlessField:
+    """Stand-in for a Webots Field holding an SFVec3f or SFRotation value."""
+
+    def __init__(self, value):
+        self.value = list(value)
+
+    def getSFVec3f(self):
+        return list(self.value)
+
+    def setSFVec3f(self, values):
+        self.value = [float(v) for v in values[:3]]
+
+    def getSFRotation(self):
+        return list(self.value)
+
+    def setSFRotation(self, values):
+        self.value = [float(v) for v in values[:4]]
+
+
+class HeadlessNode:
+    """Stand-in for a Webots Node with translation and rotation fields."""
+
+    def __init__(self, def_name, translation=None, rotation=None):
+        self.def_name = def_name
+        self.fields = {
+            'translation': HeadlessField(translation or HEADLESS_START_TRANSLATION),
+            'rotation': HeadlessField(rotation or [0.0, 0.0, 1.0, 0.0]),
+        }
+
+    def getDef(self):
+        return self.def_name
+
+    def getField(self, name):
+        return self.fields.get(name)
+
+    def getPosition(self):
+        return self.fields['translation'].getSFVec3f()
+
+    def getOrientation(self):
+        return rotation_to_matrix(self.fields['rotation'].value)
+
+
+class HeadlessGPS:
+    """GPS device reporting the world position of its node."""
+
+    def __init__(self, node):
+        self.node = node
+        self.sampling_period = 0
+
+    def enable(self, sampling_period):
+        self.sampling_period = sampling_period
+
+    def disable(self):
+        self.sampling_period = 0
+
+    def getValues(self):
+        return self.node.getPosition()
+
+
+class HeadlessCompass:
+    """Compass device reporting the world north (+Y) direction in the node frame."""
+
+    def __init__(self, node):
+        self.node = node
+        self.sampling_period = 0
+
+    def enable(self, sampling_period):
+        self.sampling_period = sampling_period
+
+    def disable(self):
+        self.sampling_period = 0
+
+    def getValues(self):
+        # North vector = R^T * (0, 1, 0), i.e. the second row of R
+        r = self.node.getOrientation()
+        return [r[3], r[4], r[5]]
+
+
+class HeadlessSupervisor:
+    """
+    Pure-Python kinematic world exposing the Supervisor calls used by the controllers.
+
+    There is no physics: node poses only change when a controller writes the
+    translation/rotation fields, exactly like the Supervisor-driven robots in
+    Webots. step() advances simulated time and returns immediately, so loops
+    run as fast as the CPU allows.
+    """
+
+    def __init__(self, basic_timestep=HEADLESS_TIMESTEP, max_steps=HEADLESS_MAX_STEPS,
+                 self_def=HEADLESS_SELF_DEF):
+        self.basic_timestep = basic_timestep
+        self.max_steps = max_steps
+        self.step_count = 0
+        self.time_ms = 0
+        self.nodes = {}
+        self.self_def = self_def
+        self.add_robot(self_def)
+
+    def add_robot(self, def_name, translation=None, rotation=None):
+        """Create (or replace) a robot node addressable through getFromDef."""
+        node = HeadlessNode(def_name, translation, rotation)
+        self.nodes[def_name] = node
+        return node
+
+    def add_fleet(self, robot_defs):
+        """Create fleet robots on a 1 m grid centred on the origin."""
+        columns = max(1, math.ceil(math.sqrt(len(robot_defs))))
+        for i, def_name in enumerate(robot_defs):
+            x = float(i % columns) - (columns - 1) / 2.0
+            y = float(i // columns) - (columns - 1) / 2.0
+            self.add_robot(def_name, [x, y, HEADLESS_START_TRANSLATION[2]])
+
+    # --- Robot / Supervisor API -------------------------------------------------
+
+    def getBasicTimeStep(self):
+        return float(self.basic_timestep)
+
+    def step(self, timestep):
+        if self.max_steps and self.step_count >= self.max_steps:
+            return -1
+        self.step_count += 1
+        self.time_ms += int(timestep)
+        return 0
+
+    def getTime(self):
+        return self.time_ms / 1000.0
+
+    def getSelf(self):
+        return self.nodes[self.self_def]
+
+    def getWorldPath(self):
+        return HEADLESS_WORLD_FILE
+
+    def getFromDef(self, name):
+        return self.nodes.get(name)
+
+    def getDevice(self, name):
+        node = self.getSelf()
+        if name == 'gps':
+            return HeadlessGPS(node)
+        if name == 'compass':
+            return HeadlessCompass(node)
+        return None
+
+
+# ============================================
+# FACTORY
+# ============================================
+
+def create_supervisor(backend=None, robot_defs=()):
+    """
+    Create a Supervisor for the selected world backend ("webots" or "headless").
+
+    robot_defs lists fleet robot DEF names. Webots worlds must already contain
+    them; the headless world creates them on a 1 m grid around the origin.
+    """
+    backend = backend or WORLD_BACKEND
+    if backend == "headless":
+        supervisor = HeadlessSupervisor()
+        supervisor.add_fleet(robot_defs)
+        return supervisor
+    if backend == "webots":
+        from controller import Supervisor
+        return Supervisor()
+    raise ValueError(f"Unknown world backend: {backend}")
@@ -0,0 +1,41 @@
+"""
+S4 Remote Robot Management System - Test Configuration
+=======================================================
+
+Puts the controller modules on sys.path, as the benchmarks do, so tests can
+import them directly, and provides a `transport` fixture that records what
+robot_controller sends. Run from the repository root:
+
+    python -m pytest -q webots_project/tests
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "controllers", "robot_controller"))
+
+import robot_controller as rc  # noqa: E402
+
+
+class RecordingTransport:
+    """Stands in for AsyncTransport; keeps every message the controller sends."""
+
+    def __init__(self):
+        self.messages = []
+        self.connect_count = 1
+
+    def send(self, message, coalesce_key=None, merge=None):
+        self.messages.append(json.loads(message))
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    recorder = RecordingTransport()
+    monkeypatch.setattr(rc, "transport", recorder)
+    return recorder
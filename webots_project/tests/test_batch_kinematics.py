@@ -0,0 +1,64 @@
+"""
+S4 Remote Robot Management System - Batched Kinematics Tests
+=============================================================
+
+batch_kinematics.FleetKinematics: command semantics and node writes.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_kinematics import FleetKinematics, encode_commands  # noqa: E402
+
+
+class FakeField:
+    def __init__(self):
+        self.value = None
+
+    def setSFVec3f(self, value):
+        self.value = value
+
+    def setSFRotation(self, value):
+        self.value = value
+
+
+class FakeNode:
+    def __init__(self):
+        self.fields = {"translation": FakeField(), "rotation": FakeField()}
+        self.lookups = 0
+
+    def getField(self, name):
+        self.lookups += 1
+        return self.fields[name]
+
+
+def test_turn_once_then_keep_moving():
+    fleet = FleetKinematics(2, speed=0.5)
+    for _ in range(2):
+        fleet.apply_commands(encode_commands(["left", "forward"]))
+    assert fleet.poses[0] == pytest.approx([0.0, 1.0, math.pi / 2])
+    assert fleet.poses[1] == pytest.approx([1.0, 0.0, 0.0])
+
+
+def test_stop_and_unknown_commands_do_not_move():
+    fleet = FleetKinematics(2)
+    moved = fleet.apply_commands(encode_commands(["stop", "dance"]))
+    assert not moved.any()
+    assert not fleet.poses.any()
+
+
+def test_write_to_nodes_looks_up_fields_once():
+    fleet = FleetKinematics.from_poses([[1.0, 2.0, 0.5], [0.0, 0.0, 0.0]], z=[0.1, 0.1])
+    nodes = [FakeNode(), FakeNode()]
+    for _ in range(3):
+        fleet.write_to_nodes(nodes, moved=np.array([True, False]))
+    assert [node.lookups for node in nodes] == [2, 2]
+    assert nodes[0].fields["translation"].value == [1.0, 2.0, 0.1]
+    assert nodes[0].fields["rotation"].value == [0, 0, 1, 0.5]
+    assert nodes[1].fields["translation"].value is None
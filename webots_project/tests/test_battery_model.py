@@ -0,0 +1,62 @@
+"""
+S4 Remote Robot Management System - Battery Model Tests
+========================================================
+
+Linear and physics drain, time-to-empty and the fleet-wide step_many()
+path (battery_model.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import pytest
+
+from battery_model import LinearDrainModel, PhysicsBatteryModel, create_battery_model
+
+DT = 0.064
+
+
+def test_linear_drains_only_while_moving():
+    model = LinearDrainModel(drain_rate=0.5)
+    assert model.step(80.0, False, 0.0, 0.0, 0.0, DT) == (80.0, 0.0, 0.0)
+    soc, speed, load = model.step(80.0, True, 0.032, 0.0, 0.0, DT)
+    assert soc == pytest.approx(80.0 - 0.5 * DT)
+    assert speed == pytest.approx(0.5) and load == 0.5
+    assert model.step(0.01, True, 0.032, 0.0, 0.0, DT)[0] == 0.0
+
+
+def test_time_to_empty_is_none_while_idle():
+    for name in ("linear", "physics"):
+        model = create_battery_model(name)
+        assert model.time_to_empty(50.0, 0.0) is None
+        assert model.time_to_empty(50.0, 5.0) > 0
+
+
+def test_physics_drains_faster_when_cold_and_when_moving():
+    warm, cold = PhysicsBatteryModel(temperature_c=25.0), PhysicsBatteryModel(temperature_c=-10.0)
+    idle_drop = 80.0 - warm.step(80.0, False, 0.0, 0.0, 0.0, DT)[0]
+    warm_drop = 80.0 - warm.step(80.0, True, 0.03, 0.1, 0.0, DT)[0]
+    cold_drop = 80.0 - cold.step(80.0, True, 0.03, 0.1, 0.0, DT)[0]
+    assert 0 < idle_drop < warm_drop < cold_drop
+    assert cold.time_to_empty(80.0, 10.0) < warm.time_to_empty(80.0, 10.0)
+
+
+def test_unknown_model_is_rejected():
+    with pytest.raises(ValueError, match="available"):
+        create_battery_model("nuclear")
+
+
+@pytest.mark.parametrize("name", ["linear", "physics"])
+def test_step_many_matches_step_per_robot(name):
+    np = pytest.importorskip("numpy")
+    model = create_battery_model(name)
+    soc = [100.0, 55.5, 3.0, 0.0001, 42.0]
+    moving = [True, False, True, True, False]
+    distance = [0.03, 0.01, 0.0, 0.02, 0.0]
+    rotation = [0.1, 0.0, -0.2, 0.0, 0.0]
+    speed = [0.0, 0.3, 0.5, 0.1, 0.0]
+    many = model.step_many(np.array(soc), np.array(moving), np.array(distance),
+                           np.array(rotation), np.array(speed), DT)
+    for i in range(len(soc)):
+        one = model.step(soc[i], moving[i], distance[i], rotation[i], speed[i], DT)
+        assert [column[i] for column in many] == pytest.approx(one)
@@ -0,0 +1,76 @@
+"""
+S4 Remote Robot Management System - Collision Layer Tests
+==========================================================
+
+Clip and reject modes, robot / obstacle / floor-edge contacts and escaping an
+existing overlap (collision.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import pytest
+
+from collision import CLIP_ITERATIONS, CollisionWorld
+from occupancy_grid import ROBOT_RADIUS, Footprint
+
+WALL = Footprint("box", "wall", 0.5, 0.0, 0.1, 2.0)  # faces x = 0.45
+PILLAR = Footprint("circle", "pillar", 0.0, 3.0, radius=0.2)
+CLIP_SLACK = 1.0 / 2 ** CLIP_ITERATIONS  # of the move length
+
+
+def world(mode="clip", floor=None):
+    collisions = CollisionWorld([WALL, PILLAR], floor, mode=mode)
+    collisions.place("r1", (0.0, 0.0))
+    return collisions
+
+
+def test_free_moves_pass_unchanged():
+    collisions = world()
+    assert collisions.resolve("r1", [0.0, 0.0, 0.1], [0.0, -0.5, 0.1]) == ([0.0, -0.5, 0.1], "free")
+    assert collisions.contacts("r1") == []
+
+
+def test_clip_stops_at_the_obstacle():
+    collisions = world()
+    (x, y, z), status = collisions.resolve("r1", [0.0, 0.0, 0.1], [0.4, 0.0, 0.1])
+    assert status == "clipped" and (y, z) == (0.0, 0.1)
+    assert 0.45 - ROBOT_RADIUS - CLIP_SLACK <= x <= 0.45 - ROBOT_RADIUS
+    assert collisions.contacts("r1") == [{"kind": "obstacle", "id": "wall"}]
+    assert collisions.stats()["clipped"] == 1
+
+
+def test_reject_cancels_the_whole_move():
+    collisions = world("reject")
+    assert collisions.resolve("r1", [0.0, 0.0, 0.1], [0.4, 0.0, 0.1]) == ([0.0, 0.0, 0.1], "rejected")
+    assert collisions.contacts("r1") == [{"kind": "obstacle", "id": "wall"}]  # what blocked it
+    assert collisions.stats()["rejected"] == 1 and collisions.positions["r1"] == (0.0, 0.0)
+
+
+def test_robots_block_each_other():
+    collisions = world()
+    collisions.place("r2", (0.0, 1.0))
+    (x, y, _), status = collisions.resolve("r1", [0.0, 0.0, 0.1], [0.0, 1.0, 0.1])
+    assert status == "clipped"
+    assert 1.0 - 2 * ROBOT_RADIUS - CLIP_SLACK <= y <= 1.0 - 2 * ROBOT_RADIUS
+    assert {"kind": "robot", "id": "r2"} in collisions.contacts("r1")
+
+
+def test_floor_edge_keeps_robots_on_the_floor():
+    collisions = world(floor=(0.0, 0.0, 4.0, 4.0))
+    (x, y, _), status = collisions.resolve("r1", [0.0, 0.0, 0.1], [0.0, -3.0, 0.1])
+    assert status == "clipped" and y == pytest.approx(-2.0 + ROBOT_RADIUS, abs=3 * CLIP_SLACK)
+    assert collisions.contacts("r1") == [{"kind": "edge", "id": "floor"}]
+
+
+def test_an_overlapping_robot_may_move_out_but_not_deeper():
+    collisions = world()
+    collisions.place("r1", (0.4, 0.0))  # already inside the wall's reach
+    assert collisions.resolve("r1", [0.4, 0.0, 0.1], [0.3, 0.0, 0.1])[1] == "free"
+    assert collisions.resolve("r1", [0.3, 0.0, 0.1], [0.3, 0.5, 0.1])[1] == "free"  # same depth
+    assert collisions.resolve("r1", [0.3, 0.5, 0.1], [0.35, 0.5, 0.1])[1] == "clipped"
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="clip, reject"):
+        CollisionWorld(mode="bounce")
@@ -0,0 +1,97 @@
+"""
+S4 Remote Robot Management System - Command Queue Tests
+========================================================
+
+Ordering, timed commands and stop preemption in command_queue.CommandQueue.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+from command_queue import CommandQueue
+
+
+def run_steps(queue, steps, first_step=1):
+    """Command name executed on each step."""
+    executed = []
+    for step in range(first_step, first_step + steps):
+        command, _ = queue.next_for_step(step)
+        executed.append(command.cmd if command is not None else None)
+    return executed
+
+
+def test_timed_command_runs_exact_steps_then_next():
+    queue = CommandQueue()
+    queue.push_batch([{"cmd": "forward", "steps": 3}, {"cmd": "left"}])
+    assert run_steps(queue, 5) == ["forward"] * 3 + ["left"] * 2
+
+
+def test_timed_command_stops_when_nothing_is_queued():
+    queue = CommandQueue()
+    queue.push("forward", steps=2)
+    assert run_steps(queue, 4) == ["forward", "forward", "stop", "stop"]
+
+
+def test_untimed_command_holds_until_superseded():
+    queue = CommandQueue()
+    queue.push("forward")
+    assert run_steps(queue, 3) == ["forward"] * 3
+    queue.push("right")
+    assert run_steps(queue, 1, first_step=4) == ["right"]
+
+
+def test_stop_in_batch_keeps_earlier_entries_of_the_batch():
+    queue = CommandQueue()
+    queue.push("backward", steps=5)
+    queue.push_batch([{"cmd": "forward", "steps": 2}, {"cmd": "stop"}])
+    assert queue.preempted == 1  # only the queued backward
+    assert run_steps(queue, 4) == ["forward", "forward", "stop", "stop"]
+
+
+def test_stop_preempts_running_timed_command():
+    queue = CommandQueue()
+    queue.push("forward", steps=10)
+    assert run_steps(queue, 2) == ["forward", "forward"]
+    queue.push("stop")
+    command, started = queue.next_for_step(3)
+    assert (command.cmd, started) == ("stop", True)
+    assert queue.preempted == 1
+
+
+def test_stop_clears_queued_commands():
+    queue = CommandQueue()
+    queue.push("forward", steps=10)
+    queue.next_for_step(1)
+    queue.push("left", steps=4)
+    queue.push("right", steps=4)
+    queue.push("stop")
+    assert len(queue) == 1
+    assert run_steps(queue, 2, first_step=2) == ["stop", "stop"]
+
+
+def test_tagged_stop_does_not_preempt():
+    queue = CommandQueue()
+    queue.push("forward", steps=4)
+    queue.push("stop", at_step=10)
+    assert run_steps(queue, 6) == ["forward"] * 4 + ["stop"] * 2
+    assert queue.preempted == 0
+
+
+def test_at_step_commands_start_on_their_step_in_order():
+    queue = CommandQueue()
+    queue.push("right", at_step=5, steps=1)
+    queue.push("left", at_step=3, steps=1)
+    executed = run_steps(queue, 6)
+    assert executed[2] == "left" and executed[4] == "right"
+    assert executed[:2] == [None, None]
+
+
+def test_started_entries_carry_execution_step_and_seq():
+    queue = CommandQueue()
+    seq = queue.push_batch([{"cmd": "forward", "steps": 1}, {"cmd": "left", "steps": 1}],
+                           seq=7, received_step=1)
+    first, _ = queue.next_for_step(2)
+    second, started = queue.next_for_step(3)
+    assert seq == 7 and started
+    assert (first.seq, first.index, first.executed_step) == (7, 0, 2)
+    assert (second.seq, second.index, second.executed_step) == (7, 1, 3)
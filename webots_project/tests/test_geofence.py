@@ -0,0 +1,79 @@
+"""
+S4 Remote Robot Management System - Geofence Tests
+===================================================
+
+Zone parsing, enter / exit transitions and the zone index (geofence.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import pytest
+
+from geofence import MAX_ZONE_CELLS, GeofenceIndex, ZoneError, parse_zones
+
+DOCK = {"id": "dock", "shape": "circle", "center": [0.0, 0.0], "radius": 1.0}
+LAB = {"id": "lab", "shape": "polygon", "points": [[2, -1], [4, -1], [4, 1], [2, 1]]}
+
+
+def geofence(*specs):
+    index = GeofenceIndex()
+    index.set_zones(parse_zones(list(specs)))
+    return index
+
+
+def test_enter_and_exit_at_boundary_crossings():
+    index = geofence(DOCK)
+    assert index.update("r1", (-3.0, 0.0), (-2.0, 0.0)) == []
+    [(t, zone_id, entered)] = index.update("r1", (-2.0, 0.0), (0.0, 0.0))
+    assert (zone_id, entered) == ("dock", True) and t == pytest.approx(0.5)
+    [(t, _, entered)] = index.update("r1", (0.0, 0.0), (2.0, 0.0))
+    assert not entered and t == pytest.approx(0.5)
+
+
+def test_zone_crossed_within_one_step_yields_both_events():
+    index = geofence(DOCK, LAB)
+    index.update("r1", (-3.0, 0.0), (-3.0, 0.0))
+    events = index.update("r1", (-3.0, 0.0), (5.0, 0.0))
+    assert [(zone, entered) for _, zone, entered in events] == [
+        ("dock", True), ("dock", False), ("lab", True), ("lab", False)]
+    assert [t for t, _, _ in events] == pytest.approx([0.25, 0.5, 0.625, 0.875])
+
+
+def test_robot_inside_new_zone_enters_and_removal_exits():
+    index = geofence()
+    index.update("r1", (3.0, 0.0), (3.0, 0.0))
+    index.set_zones(parse_zones([LAB]))
+    assert index.update("r1", (3.0, 0.0), (3.0, 0.0)) == [(0.0, "lab", True)]
+    index.set_zones({})
+    assert index.update("r1", (3.0, 0.0), (3.0, 0.0)) == [(0.0, "lab", False)]
+
+
+def test_large_zone_is_tested_without_indexing():
+    index = geofence({"id": "site", "shape": "circle", "center": [0, 0], "radius": 3000},
+                     DOCK)
+    assert index.unindexed == {"site"}
+    assert len(index.index.cells) <= MAX_ZONE_CELLS
+    events = index.update("r1", (5.0, 5.0), (5.1, 5.0))
+    assert events == [(0.0, "site", True)]
+    events = index.update("r1", (2999.5, 0.0), (3000.5, 0.0))
+    assert [(zone, entered) for _, zone, entered in events] == [("site", False)]
+
+
+@pytest.mark.parametrize("spec, error", [
+    ({"id": "a", "shape": "circle", "center": [0, 0], "radius": float("inf")}, "radius"),
+    ({"id": "a", "shape": "circle", "center": [0, 0], "radius": True}, "radius"),
+    ({"id": "a", "shape": "circle", "center": [0, "x"], "radius": 1}, "[x, y]"),
+    ({"id": "a", "points": [[0, 0], [1, 1]]}, "points"),
+    ({"id": "a", "shape": "hexagon"}, "unknown shape"),
+])
+def test_malformed_zones_are_rejected(spec, error):
+    with pytest.raises(ZoneError) as raised:
+        parse_zones([spec])
+    assert error in raised.value.errors["a"]
+
+
+def test_duplicate_ids_reject_the_whole_list():
+    with pytest.raises(ZoneError) as raised:
+        parse_zones([DOCK, dict(DOCK)])
+    assert raised.value.errors == {"dock": "duplicate id"}
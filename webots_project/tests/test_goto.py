@@ -0,0 +1,54 @@
+"""
+S4 Remote Robot Management System - Goto Command Tests
+=======================================================
+
+Argument validation of goto commands in robot_controller.start_goto.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+import types
+
+import pytest
+
+import robot_controller as rc
+from command_queue import QueuedCommand
+
+
+@pytest.fixture(autouse=True)
+def no_planner(monkeypatch):
+    monkeypatch.setattr(rc, "planner", None)
+
+
+def start(params):
+    robot = types.SimpleNamespace(robot_id="robot_1", goto=None)
+    rc.start_goto(robot, QueuedCommand("goto", 1, params=params), pose=None)
+    return robot
+
+
+@pytest.mark.parametrize("params", [
+    {"x": "1", "y": 2.0},
+    {"x": True, "y": 2.0},
+    {"x": float("nan"), "y": 2.0},
+    {"x": 1.0, "y": float("inf")},
+    {"y": 2.0},
+    {"x": 1.0, "y": 2.0, "tolerance": "0.2"},
+    {"x": 1.0, "y": 2.0, "tolerance": 0},
+    {"x": 1.0, "y": 2.0, "tolerance": -0.1},
+    {"x": 1.0, "y": 2.0, "tolerance": False},
+])
+def test_invalid_goto_is_rejected(transport, params):
+    robot = start(params)
+    assert robot.goto is None
+    [status] = transport.messages
+    assert status["type"] == "goto_status" and status["status"] == "rejected"
+    json.dumps(status, allow_nan=False)  # goal stays valid JSON
+
+
+def test_valid_goto_reaches_the_planner(transport):
+    robot = start({"x": 1, "y": 2.5, "tolerance": 0.05})
+    [status] = transport.messages
+    assert status["status"] == "unreachable"  # no occupancy grid loaded
+    assert status["goal"] == [1, 2.5]
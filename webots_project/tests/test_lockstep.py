@@ -0,0 +1,65 @@
+"""
+S4 Remote Robot Management System - Lockstep Tests
+===================================================
+
+LockstepGate grants and tick_done reporting (lockstep.py), and the
+controller's wait_for_tick() loop on top of it.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+
+import robot_controller as rc
+from lockstep import LockstepGate
+
+
+def test_ticks_grant_steps_from_the_current_step():
+    gate = LockstepGate()
+    assert not gate.allows(1)
+    assert gate.grant(0, ticks=3) == 3
+    assert gate.allows(3) and not gate.allows(4)
+    assert gate.grant(3) == 4  # one tick by default
+    assert gate.grant(10, ticks=2) == 12  # counted from the current step when it is ahead
+
+
+def test_until_never_moves_the_grant_back():
+    gate = LockstepGate()
+    gate.grant(0, until=10)
+    assert gate.grant(4, until=6) == 10
+    assert gate.grants == 1
+    assert gate.grant(4, until="20") == 20 and gate.grants == 2
+
+
+def test_tick_done_is_reported_once_per_grant():
+    gate = LockstepGate()
+    assert not gate.should_report(0)  # nothing granted yet
+    gate.grant(0, ticks=2)
+    assert not gate.should_report(1)
+    assert gate.should_report(2)
+    assert not gate.should_report(2)
+    gate.grant(2, until=2)  # stale: nothing new to report
+    assert not gate.should_report(2)
+
+
+def test_wait_for_tick_reports_and_applies_the_next_grant(monkeypatch, transport):
+    gate = LockstepGate()
+    gate.grant(0, ticks=5)
+    inbox = [json.dumps({"type": "tick", "ticks": 2})]
+    polls = []
+
+    def poll(timeout=None):
+        polls.append(timeout)
+        return [inbox.pop()] if inbox else []
+
+    monkeypatch.setattr(rc, "lockstep", gate)
+    monkeypatch.setattr(rc, "sim_step", 5)
+    monkeypatch.setattr(transport, "poll", poll, raising=False)
+    assert rc.wait_for_tick()
+    [done] = transport.messages
+    assert (done["type"], done["step"]) == ("tick_done", 5)
+    assert gate.granted_until == 7 and len(polls) == 1
+
+    rc.sim_step = 6
+    assert rc.wait_for_tick() and len(polls) == 1  # step 7 already granted: no wait
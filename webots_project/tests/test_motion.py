@@ -0,0 +1,69 @@
+"""
+S4 Remote Robot Management System - Motion Integration Tests
+=============================================================
+
+Robot motion is integrated from velocities over the elapsed sim time, so
+speed and goto paths must not depend on basicTimeStep (robot_controller.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+
+import pytest
+
+import robot_controller as rc
+from world_backend import HeadlessSupervisor
+
+WAYPOINTS = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)]
+
+
+def make_robot():
+    supervisor = HeadlessSupervisor()
+    return rc.RobotState("robot_1", supervisor.add_robot("robot_1", [0.0, 0.0, 0.1]))
+
+
+def drive(robot, command, timestep, seconds):
+    """Run `command` for `seconds` of sim time in steps of `timestep` ms; returns the pose."""
+    robot.current_command = command
+    for step in range(1, round(seconds * 1000 / timestep) + 1):
+        robot.adapter.read_pose(step)
+        rc.apply_movement(robot, timestep)
+        if robot.current_command == "goto" and robot.goto is None:
+            return step * timestep / 1000.0, robot.adapter.read_pose(step + 1)
+    return seconds, robot.adapter.read_pose(step + 1)
+
+
+@pytest.mark.parametrize("timestep", [16, 32, 64, 128])
+def test_forward_speed_does_not_depend_on_the_timestep(timestep):
+    robot = make_robot()
+    _, pose = drive(robot, "forward", timestep, 1.024)
+    assert pose.position[0] == pytest.approx(rc.config.linear_velocity * 1.024)
+    assert pose.position[1] == pytest.approx(0.0, abs=1e-12)
+
+
+def run_goto(timestep):
+    robot = make_robot()
+    robot.goto = {"seq": 1, "goal": WAYPOINTS[-1], "tolerance": 0.05,
+                  "waypoints": list(WAYPOINTS), "index": 1}
+    return drive(robot, "goto", timestep, 30.0)
+
+
+def test_goto_follows_the_same_path_at_any_timestep(transport):
+    fine_time, fine = run_goto(16)
+    coarse_time, coarse = run_goto(128)
+    assert [m["status"] for m in transport.messages] == ["arrived", "arrived"]
+    assert coarse.position[:2] == pytest.approx(fine.position[:2], abs=0.01)
+    assert coarse.theta == pytest.approx(fine.theta, abs=0.01)
+    # 1.95 m of driving plus a 90° turn in place, detected within one coarse step
+    expected = 1.95 / rc.config.linear_velocity + (math.pi / 2) / rc.config.angular_velocity
+    assert fine_time == pytest.approx(expected, abs=0.128)
+    assert coarse_time == pytest.approx(expected, abs=0.128)
+
+
+def test_legacy_movement_speed_is_converted_per_second(monkeypatch):
+    monkeypatch.setattr(rc, "basic_timestep", 32)
+    settings = rc.convert_legacy_settings({"movement_speed": 0.01, "battery_drain_rate": 0.1})
+    assert settings == {"linear_velocity": pytest.approx(0.3125), "battery_drain_rate": 0.1}
+    assert rc.convert_legacy_settings({"movementSpeed": "fast"}) == {"linear_velocity": "fast"}
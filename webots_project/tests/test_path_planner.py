@@ -0,0 +1,75 @@
+"""
+S4 Remote Robot Management System - Path Planner Tests
+=======================================================
+
+A* search, path reduction and plan caching (path_planner.py) on small
+hand-built occupancy grids.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+from occupancy_grid import OccupancyGrid
+from path_planner import PathPlanner, astar, corners, line_of_sight
+
+
+def grid_with_wall(size=10, wall_x=5, gap_y=None):
+    """size x size grid of 1 m cells with a vertical wall at wall_x (optionally with a gap)."""
+    grid = OccupancyGrid((0.0, 0.0), size, size, resolution=1.0)
+    for y in range(size):
+        if y != gap_y:
+            grid.cells[y * size + wall_x] = 1
+    return grid
+
+
+def test_straight_path_on_empty_grid():
+    grid = OccupancyGrid((0.0, 0.0), 5, 5, resolution=1.0)
+    path = astar(grid, (0, 0), (4, 0))
+    assert path == [(x, 0) for x in range(5)]
+    assert corners(path) == [(0, 0), (4, 0)]
+
+
+def test_path_goes_through_gap_in_wall():
+    grid = grid_with_wall(gap_y=8)
+    path = astar(grid, (1, 1), (8, 1))
+    assert (5, 8) in path
+    assert all(grid.is_free(cell) for cell in path)
+
+
+def test_diagonal_moves_do_not_cut_corners():
+    grid = OccupancyGrid((0.0, 0.0), 3, 3, resolution=1.0)
+    grid.cells[0 * 3 + 1] = 1  # (1, 0) blocked
+    path = astar(grid, (0, 0), (1, 1))
+    assert path == [(0, 0), (0, 1), (1, 1)]
+
+
+def test_unreachable_and_blocked_goals():
+    grid = grid_with_wall()
+    assert astar(grid, (1, 1), (8, 1)) is None
+    assert astar(grid, (1, 1), (5, 1)) is None
+
+
+def test_line_of_sight_is_blocked_by_wall():
+    grid = grid_with_wall(gap_y=8)
+    assert line_of_sight(grid, (1, 1), (4, 4))
+    assert not line_of_sight(grid, (1, 1), (8, 1))
+
+
+def test_planner_returns_exact_endpoints_and_caches():
+    planner = PathPlanner(grid_with_wall(gap_y=8))
+    waypoints, cached = planner.plan((1.2, 1.3), (8.7, 1.4))
+    assert not cached
+    assert waypoints[0] == (1.2, 1.3) and waypoints[-1] == (8.7, 1.4)
+    assert len(waypoints) > 2  # detour through the gap
+    again, cached = planner.plan((1.4, 1.1), (8.2, 1.9))  # same cells
+    assert cached and again[1:-1] == waypoints[1:-1]
+    assert planner.stats()["hits"] == 1
+
+
+def test_planner_cache_is_invalidated_by_grid_change():
+    grid = OccupancyGrid((0.0, 0.0), 6, 6, resolution=1.0)
+    planner = PathPlanner(grid)
+    planner.plan((0.5, 0.5), (5.5, 0.5))
+    grid.add_box(3.0, 1.0, 1.0, 2.0)
+    waypoints, cached = planner.plan((0.5, 0.5), (5.5, 0.5))
+    assert not cached and len(waypoints) > 2
@@ -0,0 +1,119 @@
+"""
+S4 Remote Robot Management System - Runtime Config Tests
+=========================================================
+
+Config messages through robot_controller.stage_config / apply_config.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import types
+
+import pytest
+
+import robot_controller as rc
+from telemetry_scheduler import TelemetryScheduler
+
+
+@pytest.fixture(autouse=True)
+def reset_config():
+    yield
+    rc.config.stage_reset()
+    rc.config.apply_pending()
+
+
+def config_acks(transport):
+    return [m for m in transport.messages if m["type"] == "config_ack"]
+
+
+def test_trace_fields_are_not_settings(transport):
+    rc.stage_config({"type": "update", "updateType": "config", "requestId": "r1",
+                     "timestamp": 0, "sentAt": 1, "routerAt": 2, "linearVelocity": 0.5})
+    rc.apply_config()
+    [ack] = config_acks(transport)
+    assert ack["status"] == "applied"
+    assert rc.config.linear_velocity == 0.5
+
+
+@pytest.mark.parametrize("settings, setting, value", [
+    ({"telemetryMinHz": 2, "telemetryMaxHz": 10}, "telemetry_max_hz", 10.0),
+    ({"pathTolerance": 0.05}, "path_tolerance", 0.05),
+    ({"BATTERY_DRAIN_RATE": 0.01}, "battery_drain_rate", 0.01),
+    ({"angular_velocity": 2.0}, "angular_velocity", 2.0),
+])
+def test_settings_accept_every_spelling(transport, settings, setting, value):
+    rc.stage_config({"type": "config", "requestId": "r2", "settings": settings})
+    rc.apply_config()
+    [ack] = config_acks(transport)
+    assert ack["status"] == "applied"
+    assert getattr(rc.config, setting) == value
+
+
+def test_telemetry_rate_message_with_trace_fields(transport):
+    rc.stage_config({"type": "telemetry_rate", "minHz": 1, "maxHz": 30, "movingHz": 15,
+                     "sentAt": 1, "routerAt": 2, "seq": 3})
+    rc.apply_config()
+    [ack] = config_acks(transport)
+    assert ack["status"] == "applied"
+    assert (rc.config.telemetry_min_hz, rc.config.telemetry_max_hz) == (1.0, 30.0)
+
+
+@pytest.mark.parametrize("settings", [
+    {"noSuchSetting": 1},
+    {"linearVelocity": 99},
+    {"telemetryMinHz": 20, "telemetryMaxHz": 10},
+])
+def test_invalid_update_is_rejected_and_not_applied(transport, settings):
+    before = rc.config.snapshot()
+    rc.stage_config({"type": "config", "requestId": "bad", "settings": settings})
+    rc.apply_config()
+    [ack] = config_acks(transport)
+    assert ack["status"] == "rejected"
+    assert rc.config.snapshot() == before
+
+
+@pytest.fixture
+def fleet(monkeypatch):
+    robots = {robot_id: types.SimpleNamespace(robot_id=robot_id, scheduler=TelemetryScheduler(),
+                                              path=None)
+              for robot_id in ("robot_1", "robot_2")}
+    monkeypatch.setattr(rc, "robots", robots)
+    return robots
+
+
+def test_update_for_one_robot_of_a_fleet_is_rejected(transport, fleet):
+    before = rc.config.snapshot()
+    rc.stage_config({"type": "update", "updateType": "config", "robotId": "robot_1",
+                     "settings": {"linearVelocity": 0.5}})
+    rc.apply_config()
+    [ack] = config_acks(transport)
+    assert ack["status"] == "rejected" and "robotId" in ack["errors"]
+    assert rc.config.snapshot() == before
+
+
+def test_update_for_a_robot_driven_elsewhere_is_ignored(transport, fleet):
+    before = rc.config.snapshot()
+    rc.stage_config({"type": "config", "robotId": "robot_9", "settings": {"linearVelocity": 0.5}})
+    rc.apply_config()
+    assert config_acks(transport) == []
+    assert rc.config.snapshot() == before
+
+
+def test_update_for_the_only_robot_applies(transport, fleet):
+    del fleet["robot_2"]
+    rc.stage_config({"type": "config", "robotId": "robot_1", "settings": {"linearVelocity": 0.5}})
+    rc.apply_config()
+    [ack] = config_acks(transport)
+    assert ack["status"] == "applied" and rc.config.linear_velocity == 0.5
+
+
+def test_telemetry_rate_is_fleet_wide(transport, fleet):
+    rc.stage_config({"type": "telemetry_rate", "minHz": 2, "maxHz": 10})
+    rc.apply_config()
+    assert all((robot.scheduler.min_hz, robot.scheduler.max_hz) == (2.0, 10.0)
+               for robot in fleet.values())
+    rc.stage_config({"type": "telemetry_rate", "robotId": "robot_2", "maxHz": 5})
+    rc.apply_config()
+    assert config_acks(transport)[-1]["status"] == "rejected"
+    assert fleet["robot_2"].scheduler.max_hz == 10.0
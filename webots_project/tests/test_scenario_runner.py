@@ -0,0 +1,74 @@
+"""
+S4 Remote Robot Management System - Scenario Runner Tests
+==========================================================
+
+Spec expansion, scripted message schedules and report merging
+(benchmarks/scenario_runner.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+from latency import LatencyHistogram  # noqa: E402
+from scenario_runner import (DEFAULT_STEPS, STEP_HOP, expand_scenarios,  # noqa: E402
+                             merge_report, scripted_messages)
+
+
+def test_expand_applies_defaults_and_splits_fleet_lists():
+    spec = {"defaults": {"steps": 500, "env": {"S4_BATTERY_MODEL": "physics", "S4_COLLISION": "1"}},
+            "scenarios": [{"fleet": [1, 10], "env": {"S4_COLLISION": "0"}},
+                          {"name": "solo", "steps": 100}]}
+    runs = expand_scenarios(spec)
+    assert [(r["name"], r["fleet"], r["steps"]) for r in runs] == [
+        ("scenario1@1", 1, 500), ("scenario1@10", 10, 500), ("solo", 1, 100)]
+    assert runs[0]["env"] == {"S4_BATTERY_MODEL": "physics", "S4_COLLISION": "0"}
+    assert runs[2]["env"] == {"S4_BATTERY_MODEL": "physics", "S4_COLLISION": "1"}
+    assert expand_scenarios({"scenarios": [{}]})[0]["steps"] == DEFAULT_STEPS
+
+
+def test_scripted_messages_repeat_every_period():
+    scenario = {"steps": 25, "period": 10, "script": [
+        {"cmd": "forward", "steps": 5},
+        {"atStep": 4, "type": "zones", "zones": []}]}
+    messages = scripted_messages(scenario)
+    assert [step for step, _ in messages] == [1, 4, 11, 14, 21, 24]
+    _, forward = messages[2]
+    assert forward == {"type": "cmd", "cmd": "forward", "steps": 5, "atStep": 11}
+    assert "atStep" not in messages[1][1]  # only commands carry their step
+
+
+def test_scripted_messages_without_period_run_once_and_stop_at_the_last_step():
+    scenario = {"steps": 50, "period": None,
+                "script": [{"atStep": 30, "cmd": "stop"}, {"atStep": 80, "cmd": "left"}]}
+    assert scripted_messages(scenario) == [(30, {"type": "cmd", "cmd": "stop", "atStep": 30})]
+
+
+def run_result(name, robots, steps, wall_us, messages):
+    histogram = LatencyHistogram()
+    for value in wall_us:
+        histogram.record(value)
+    result = {"name": name, "robots": robots, "steps": steps, "wallSeconds": 1.0,
+              "distance": {"total": 2.0}, "battery": {"used": 0.5}, "messages": messages}
+    return result, {STEP_HOP: histogram}
+
+
+def test_merge_report_sums_runs_and_merges_histograms():
+    runs = [run_result("a", 1, 100, [100] * 99 + [5000], {"telemetry": 10}),
+            run_result("b", 10, 100, [200] * 100, {"telemetry": 5, "ack": 1})]
+    report = merge_report(runs, elapsed=2.0, jobs=2)
+    total = report["total"]
+    assert (total["runs"], total["steps"], total["robotSteps"]) == (2, 200, 1100)
+    assert total["robotStepsPerSec"] == 550.0
+    assert total["messages"] == {"telemetry": 15, "ack": 1}
+    assert total["stepWall"]["count"] == 200 and total["stepWall"]["max"] == 5000
+    # 101 of 200 steps took 200 us or more, and run a's single 5 ms step is the p99.9
+    assert total["stepWall"]["p50"] == pytest.approx(200, rel=0.02)
+    assert total["stepWall"]["p99.9"] == 5000
+    assert report["scenarios"][0]["stepWall"]["count"] == 100
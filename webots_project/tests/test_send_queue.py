@@ -0,0 +1,57 @@
+"""
+S4 Remote Robot Management System - Send Queue Tests
+=====================================================
+
+Coalescing and bounds of send_queue.OutboundQueue.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+from send_queue import OutboundQueue
+
+KEY = ("telemetry", "robot_1")
+
+
+def test_newer_frame_replaces_queued_one():
+    queue = OutboundQueue()
+    queue.put("a", KEY)
+    queue.put("b", KEY)
+    assert queue.drain() == ([], ["b"])
+    assert queue.stats()["coalesced"] == 1
+
+
+def test_reliable_frames_are_never_coalesced():
+    queue = OutboundQueue()
+    queue.put("ack1")
+    queue.put("t", KEY)
+    queue.put("ack2")
+    assert queue.drain() == (["ack1", "ack2"], ["t"])
+
+
+def test_full_queue_sheds_oldest_telemetry_first():
+    queue = OutboundQueue(max_size=3)
+    queue.put("t1", ("telemetry", "robot_1"))
+    queue.put("t2", ("telemetry", "robot_2"))
+    queue.put("ack1")
+    queue.put("ack2")
+    assert queue.drain() == (["ack1", "ack2"], ["t2"])
+    assert queue.stats()["dropped"] == 1
+
+
+def test_reliable_overflow_drops_oldest_and_is_flagged():
+    queue = OutboundQueue(max_size=8, max_reliable=3)
+    for i in range(5):
+        queue.put(f"ack{i}")
+    queue.requeue(["retry"])
+    assert queue.drain() == (["ack2", "ack3", "ack4"], [])
+    assert queue.stats()["dropped_reliable"] == 3
+    assert queue.overflowed
+
+
+def test_reliable_frames_are_not_shed_for_space():
+    queue = OutboundQueue(max_size=2)
+    for i in range(4):
+        queue.put(f"ack{i}")
+    assert queue.drain() == (["ack0", "ack1", "ack2", "ack3"], [])
+    assert not queue.overflowed
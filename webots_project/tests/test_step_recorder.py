@@ -0,0 +1,106 @@
+"""
+S4 Remote Robot Management System - Step Recording Tests
+=========================================================
+
+StepRecorder / RecordingReader round-trip (step_recorder.py) and replaying a
+recording of the real control step through benchmarks/replay_recording.py.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import os
+import sys
+
+import pytest
+
+import robot_controller as rc
+from step_recorder import RecordingReader, StepRecorder
+from world_backend import HeadlessSupervisor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+
+from replay_recording import replay_controller  # noqa: E402
+
+TIMESTEP = 64  # ms
+SCRIPT = ["forward"] * 10 + ["left"] * 3 + ["backward"] * 5 + ["stop"] * 2
+
+
+def test_records_round_trip(tmp_path):
+    path = str(tmp_path / "run.s4rec")
+    recorder = StepRecorder(path, ["robot_1", "robot_2"], TIMESTEP)
+    recorder.record(1, 0.064, "robot_2", "forward", (7, 0), [1.0, 2.0, 0.1], 0.5, 99.5, True)
+    recorder.record(1, 0.064, "robot_1", "goto", None, [0.0, 0.0, 0.1], 0.0, 100.0, False)
+    recorder.close()
+
+    reader = RecordingReader(path)
+    assert (len(reader), reader.timestep, reader.robot_ids) == (2, TIMESTEP, ["robot_1", "robot_2"])
+    first = reader[0]
+    assert (first["robot"], first["cmd"], first["seq"], first["moved"]) == ("robot_2", "forward", 7, 1)
+    assert (first["x"], first["y"], first["theta"]) == (1.0, 2.0, 0.5)
+    assert first["battery"] == pytest.approx(99.5)
+    assert reader[1]["cmd"] == "goto" and reader[1]["seq"] == 0
+    with pytest.raises(IndexError):
+        reader[2]
+    reader.close()
+
+
+def test_numpy_view_matches_records(tmp_path):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / "run.s4rec")
+    recorder = StepRecorder(path, ["robot_1"], TIMESTEP)
+    for step in range(1, 301):  # more than one flush
+        recorder.record(step, step * 0.064, "robot_1", "forward", None, [step * 0.01, 0.0, 0.1],
+                        0.0, 100.0 - step * 0.001, True)
+    recorder.close()
+    reader = RecordingReader(path)
+    records = reader.as_array()
+    assert len(records) == 300 and records["step"][-1] == 300
+    assert records["x"][99] == reader[99]["x"]
+    del records
+    reader.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "notes.s4rec"
+    path.write_bytes(b"not a recording" * 10)
+    with pytest.raises(ValueError):
+        RecordingReader(str(path))
+
+
+def record_run(path, monkeypatch):
+    """Drive one robot through SCRIPT with the real step_robot() while recording."""
+    supervisor = HeadlessSupervisor(basic_timestep=TIMESTEP)
+    robot = rc.RobotState("robot_1", supervisor.add_robot("robot_1", [0.0, 0.0, 0.1]))
+    monkeypatch.setattr(rc, "recorder", StepRecorder(path, ["robot_1"], TIMESTEP))
+    monkeypatch.setattr(rc, "sim_step", 0)
+    for step, command in enumerate(SCRIPT, start=1):
+        rc.sim_step = step
+        robot.current_command = command
+        rc.step_robot(robot, TIMESTEP, step * TIMESTEP / 1000.0)
+    rc.recorder.close()
+
+
+def test_replay_reproduces_the_controller(tmp_path, monkeypatch, transport):
+    path = str(tmp_path / "run.s4rec")
+    record_run(path, monkeypatch)
+    reader = RecordingReader(path)
+    assert [record["cmd"] for record in map(reader.__getitem__, range(len(reader)))] == SCRIPT
+    _, mismatches, skipped = replay_controller(reader)
+    assert mismatches == 0 and not skipped
+    reader.close()
+
+
+def test_replay_reports_divergence_and_skips_unreplayable(tmp_path):
+    path = str(tmp_path / "run.s4rec")
+    recorder = StepRecorder(path, ["robot_1"], TIMESTEP)
+    recorder.record(1, 0.064, "robot_1", "stop", None, [0.0, 0.0, 0.1], 0.0, 100.0, False)
+    recorder.record(2, 0.128, "robot_1", "twist", (3, 0), [0.0, 0.0, 0.1], 0.0, 100.0, True)
+    recorder.record(3, 0.192, "robot_1", "stop", None, [0.5, 0.0, 0.1], 0.0, 100.0, False)
+    recorder.record(4, 0.256, "robot_1", "stop", None, [0.9, 0.0, 0.1], 0.0, 100.0, False)
+    recorder.close()
+    reader = RecordingReader(path)
+    _, mismatches, skipped = replay_controller(reader)
+    # the twist step is skipped and resynced; the jump to x = 0.9 while stopped is not
+    assert skipped == {"twist": 1} and mismatches == 1
+    reader.close()
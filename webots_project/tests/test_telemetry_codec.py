@@ -0,0 +1,65 @@
+"""
+S4 Remote Robot Management System - Telemetry Codec Tests
+==========================================================
+
+binary-v2 pack / unpack, binary-v1 decoding and the JSON fallback for frames
+the binary layout cannot carry (telemetry_codec.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+
+import pytest
+
+from telemetry_codec import (BINARY_MAGIC, ENCODING_BINARY, ENCODING_JSON, FRAME_TELEMETRY,
+                             TELEMETRY_STRUCT_V1, encode_telemetry, pack_telemetry,
+                             unpack_telemetry)
+
+TELEMETRY = {"type": "telemetry", "robotId": "robot_1",
+             "pose": {"x": 1.25, "y": -0.5, "theta": 1.5708},
+             "speed": 0.3, "battery": 87.5, "cycle": 42, "timestamp": 1730000000123,
+             "step": 420, "simTime": 26.88, "timeToEmpty": 3600}
+
+
+def test_binary_round_trip_matches_json_shape():
+    frame = encode_telemetry(TELEMETRY, ENCODING_BINARY)
+    assert isinstance(frame, bytes) and frame[:2] == BINARY_MAGIC
+    assert len(frame) == 53 + len("robot_1")
+    assert unpack_telemetry(frame) == TELEMETRY
+
+
+def test_unknown_time_to_empty_survives_the_round_trip():
+    frame = encode_telemetry(dict(TELEMETRY, timeToEmpty=None), ENCODING_BINARY)
+    assert unpack_telemetry(frame)["timeToEmpty"] is None
+
+
+def test_robot_id_is_utf8():
+    frame = pack_telemetry("röbot-ü", 0.0, 0.0, 0.0, 0.0, 100.0, 1, 0, 1, 0.064)
+    assert unpack_telemetry(frame)["robotId"] == "röbot-ü"
+
+
+def test_v1_frames_still_decode():
+    rid = b"legacy"
+    frame = TELEMETRY_STRUCT_V1.pack(BINARY_MAGIC, 1, FRAME_TELEMETRY, 1.0, 2.0, 0.5,
+                                     0.2, 50.0, 7, 1234) + bytes((len(rid),)) + rid
+    telemetry = unpack_telemetry(frame)
+    assert telemetry["robotId"] == "legacy" and telemetry["cycle"] == 7
+    assert telemetry["pose"] == {"x": 1.0, "y": 2.0, "theta": 0.5}
+    assert "step" not in telemetry and "simTime" not in telemetry
+
+
+def test_unknown_versions_are_rejected():
+    frame = bytearray(encode_telemetry(TELEMETRY, ENCODING_BINARY))
+    frame[2] = 9
+    with pytest.raises(ValueError):
+        unpack_telemetry(bytes(frame))
+
+
+def test_contacts_fall_back_to_json():
+    contacts = [{"kind": "robot", "id": "robot_2"}]
+    frame = encode_telemetry(dict(TELEMETRY, contacts=contacts), ENCODING_BINARY)
+    assert json.loads(frame)["contacts"] == contacts
+    assert isinstance(encode_telemetry(dict(TELEMETRY, contacts=[]), ENCODING_BINARY), bytes)
+    assert json.loads(encode_telemetry(TELEMETRY, ENCODING_JSON)) == TELEMETRY
@@ -0,0 +1,85 @@
+"""
+S4 Remote Robot Management System - Delta Telemetry Tests
+==========================================================
+
+DeltaEncoder keyframes / deltas and merge_telemetry_frames when deltas
+coalesce in the send queue.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import json
+import types
+
+import robot_controller as rc
+from send_queue import OutboundQueue
+from telemetry_codec import (DeltaEncoder, ENCODING_BINARY, encode_telemetry,
+                             merge_telemetry_frames, unpack_telemetry)
+
+KEY = ("telemetry", "robot_1")
+
+
+def telemetry(cycle, x=0.0, y=0.0, theta=0.0, battery=100.0, speed=0.0):
+    return {"type": "telemetry", "robotId": "robot_1", "pose": {"x": x, "y": y, "theta": theta},
+            "speed": speed, "battery": battery, "timeToEmpty": None, "cycle": cycle,
+            "timestamp": 1000 + cycle, "step": cycle, "simTime": cycle * 0.064}
+
+
+def test_deltas_coalesce_without_losing_fields():
+    encoder = DeltaEncoder()
+    queue = OutboundQueue()
+    keyframe, is_keyframe = encoder.encode(telemetry(1))
+    assert is_keyframe
+    queue.drain()  # keyframe already sent
+    first, _ = encoder.encode(telemetry(2, x=1.0, battery=99.0))
+    second, _ = encoder.encode(telemetry(3, y=2.0, battery=99.0, x=1.0))
+    queue.put(json.dumps(first), KEY, merge_telemetry_frames)
+    queue.put(json.dumps(second), KEY, merge_telemetry_frames)
+    _, [frame] = queue.drain()
+    merged = json.loads(frame)
+    assert merged["type"] == "telemetry_delta"
+    assert merged["pose"] == {"x": 1.0, "y": 2.0}
+    assert merged["battery"] == 99.0
+    assert (merged["cycle"], merged["step"]) == (3, 3)
+
+
+def test_delta_folds_into_pending_binary_keyframe():
+    encoder = DeltaEncoder()
+    queue = OutboundQueue()
+    keyframe, _ = encoder.encode(telemetry(1, x=0.5))
+    delta, _ = encoder.encode(telemetry(2, x=0.5, theta=0.25))
+    queue.put(encode_telemetry(keyframe, ENCODING_BINARY), KEY, merge_telemetry_frames)
+    queue.put(json.dumps(delta), KEY, merge_telemetry_frames)
+    _, [frame] = queue.drain()
+    decoded = unpack_telemetry(frame)
+    assert decoded["pose"]["x"] == 0.5
+    assert abs(decoded["pose"]["theta"] - 0.25) < 1e-6
+    assert (decoded["cycle"], decoded["step"]) == (2, 2)
+
+
+def test_keyframe_replaces_pending_delta():
+    encoder = DeltaEncoder(keyframe_interval=2)
+    encoder.encode(telemetry(1))
+    delta, _ = encoder.encode(telemetry(2, x=1.0))
+    keyframe, is_keyframe = encoder.encode(telemetry(3, x=2.0))
+    assert is_keyframe
+    queue = OutboundQueue()
+    queue.put(json.dumps(delta), KEY, merge_telemetry_frames)
+    queue.put(json.dumps(keyframe), KEY, merge_telemetry_frames)
+    _, [frame] = queue.drain()
+    assert json.loads(frame) == keyframe
+
+
+def test_dropped_telemetry_forces_keyframes(monkeypatch):
+    link = {"dropped": 0}
+    monkeypatch.setattr(rc, "transport", types.SimpleNamespace(stats=lambda: dict(link)))
+    monkeypatch.setattr(rc, "telemetry_dropped", 0)
+    encoder = DeltaEncoder()
+    monkeypatch.setattr(rc, "robots", {"robot_1": types.SimpleNamespace(delta_encoder=encoder)})
+    encoder.encode(telemetry(1))
+    rc.resync_dropped_telemetry()
+    assert encoder.encode(telemetry(2, x=1.0))[1] is False
+    link["dropped"] = 1  # the queue shed that delta
+    rc.resync_dropped_telemetry()
+    assert encoder.encode(telemetry(3, x=1.0))[1] is True
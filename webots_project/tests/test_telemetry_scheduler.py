@@ -0,0 +1,48 @@
+"""
+S4 Remote Robot Management System - Telemetry Scheduler Tests
+==============================================================
+
+Cadence and rate-band validation of telemetry_scheduler.TelemetryScheduler.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import pytest
+
+from telemetry_scheduler import TelemetryScheduler
+
+
+def due_times(scheduler, moving, duration=2.0, dt=0.05):
+    steps = round(duration / dt)
+    return [round(i * dt, 2) for i in range(steps) if scheduler.due(i * dt, moving(i * dt))]
+
+
+def test_moving_rate_and_idle_heartbeat():
+    scheduler = TelemetryScheduler(moving_hz=10.0, idle_hz=1.0)
+    assert len(due_times(scheduler, lambda t: True)) == 20
+    scheduler = TelemetryScheduler(moving_hz=10.0, idle_hz=1.0)
+    assert due_times(scheduler, lambda t: False) == [0.0, 1.0]
+
+
+def test_motion_change_sends_immediately():
+    scheduler = TelemetryScheduler(moving_hz=1.0, idle_hz=1.0)
+    times = due_times(scheduler, lambda t: t >= 0.3)
+    assert times[:2] == [0.0, 0.3]
+
+
+def test_rates_are_clamped_to_band():
+    scheduler = TelemetryScheduler(moving_hz=100.0, idle_hz=0.01, min_hz=0.5, max_hz=20.0)
+    assert scheduler.current_hz(True) == 20.0
+    assert scheduler.current_hz(False) == 0.5
+
+
+def test_scheduler_keeps_band_when_limits_are_invalid():
+    scheduler = TelemetryScheduler(min_hz=1.0, max_hz=10.0)
+    with pytest.raises(ValueError):
+        scheduler.set_limits(20.0, None)
+    with pytest.raises(ValueError):
+        scheduler.set_limits(0, 5)
+    assert (scheduler.min_hz, scheduler.max_hz) == (1.0, 10.0)
+    scheduler.set_limits(None, 5)
+    assert (scheduler.min_hz, scheduler.max_hz) == (1.0, 5.0)
@@ -0,0 +1,64 @@
+"""
+S4 Remote Robot Management System - Trajectory Ring Tests
+==========================================================
+
+Appending, wraparound and windowed reads of trajectory_ring.TrajectoryRing.
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import pytest
+
+from trajectory_ring import TrajectoryRing, window_to_json
+
+pytest.importorskip("numpy")  # window() reads through numpy
+
+
+@pytest.fixture
+def ring(tmp_path):
+    ring = TrajectoryRing.create(str(tmp_path / "robot.ring"), capacity=8)
+    yield ring
+    ring.close()
+
+
+def fill(ring, count):
+    for i in range(count):
+        ring.append(i * 0.5, float(i), 0.0, 0.0, 100.0 - i, "forward")
+
+
+def test_window_returns_chronological_records(ring):
+    fill(ring, 5)
+    assert list(ring.window()["x"]) == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert window_to_json(ring.window(points=1))[0]["cmd"] == "forward"
+
+
+def test_ring_keeps_the_newest_capacity_records(ring):
+    fill(ring, 13)
+    assert len(ring) == 8
+    assert list(ring.window()["x"]) == [float(i) for i in range(5, 13)]
+
+
+def test_seconds_selects_recent_records(ring):
+    fill(ring, 13)
+    assert list(ring.window(seconds=1.0)["x"]) == [10.0, 11.0, 12.0]
+
+
+@pytest.mark.parametrize("points", [1, 2, 3, 5])
+def test_downsampling_always_keeps_the_newest_record(ring, points):
+    fill(ring, 13)
+    records = ring.window(points=points)
+    assert len(records) == points
+    assert records["x"][-1] == 12.0
+    assert list(records["x"]) == sorted(records["x"])
+
+
+def test_reader_sees_writer_records(ring):
+    fill(ring, 3)
+    reader = TrajectoryRing.open(ring.path)
+    try:
+        assert list(reader.window()["x"]) == [0.0, 1.0, 2.0]
+        ring.append(1.5, 3.0, 0.0, 0.0, 97.0, "stop")
+        assert reader.window(points=1)["x"][0] == 3.0
+    finally:
+        reader.close()
@@ -0,0 +1,75 @@
+"""
+S4 Remote Robot Management System - Trajectory Simplification Tests
+====================================================================
+
+Ramer–Douglas–Peucker, time buckets and the streaming PathSimplifier
+(trajectory_simplify.py).
+
+Author: Fitfest25 Hackathon Team
+Date: 2025
+"""
+
+import math
+import random
+
+from trajectory_simplify import PathSimplifier, _distance_to_segment, rdp, time_buckets
+
+
+def corner_path(n=50):
+    """Forward along x, then a 90° turn and forward along y: (t, x, y) every 0.1 s."""
+    return [(i * 0.1, min(i, n) * 0.02, max(0, i - n) * 0.02) for i in range(2 * n + 1)]
+
+
+def test_straight_lines_reduce_to_their_vertices():
+    assert rdp([(i, i * 0.1, 0.0) for i in range(100)], 0.001) == [(0, 0.0, 0.0), (99, 9.9, 0.0)]
+    path = corner_path()
+    assert rdp(path, 0.01) == [path[0], path[50], path[-1]]
+
+
+def test_dropped_points_stay_within_tolerance():
+    rng = random.Random(3)
+    x = y = heading = 0.0
+    path = []
+    for i in range(500):
+        heading += rng.uniform(-0.2, 0.2)
+        x, y = x + math.cos(heading) * 0.02, y + math.sin(heading) * 0.02
+        path.append((i * 0.064, x, y))
+    simplified = rdp(path, 0.05)
+    assert len(simplified) < len(path) // 5
+    kept = [path.index(p) for p in simplified]
+    for a, b in zip(kept, kept[1:]):
+        for p in path[a + 1:b]:
+            assert _distance_to_segment(p, path[a], path[b]) <= 0.05
+
+
+def test_time_buckets_keep_the_last_point_per_bucket():
+    points = [(t / 10, t, 0.0) for t in range(25)]
+    assert [p[0] for p in time_buckets(points, 1.0)] == [0.0, 0.9, 1.9, 2.4]
+
+
+def test_segments_share_boundary_points():
+    simplifier = PathSimplifier(tolerance=0.01, segment_points=30)
+    segments = []
+    for t, x, y in corner_path():
+        segment = simplifier.add(t, x, y)
+        if segment:
+            segments.append(segment)
+    segments.append(simplifier.flush())
+    for previous, segment in zip(segments, segments[1:]):
+        assert segment[0] == previous[-1]
+    assert simplifier.flush() is None  # only the boundary point is pending
+    assert simplifier.sent_points < simplifier.raw_points / 5
+
+
+def test_history_levels_and_point_budget():
+    simplifier = PathSimplifier(segment_points=16, lod_tolerances=(0.001, 0.5))
+    for t, x, y in corner_path(200):
+        simplifier.add(t, x, y)
+    assert simplifier.level_for(tolerance=0.1) == 0 and simplifier.level_for(tolerance=1.0) == 1
+    level, fine = simplifier.history(level=0)
+    assert level == 0 and fine[0] == (0.0, 0.0, 0.0) and fine[-1][0] == simplifier.pending[-1][0]
+    assert len(fine) == len({p[0] for p in fine})  # no duplicated boundary points
+    level, coarse = simplifier.history(level=0, max_points=len(fine) - 1)
+    assert level == 1 and len(coarse) < len(fine)
+    _, recent = simplifier.history(level=0, since=30.0)
+    assert recent and all(p[0] >= 30.0 for p in recent)